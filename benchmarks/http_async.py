@@ -0,0 +1,76 @@
+"""
+Offline throughput benchmark for CemirUtilsHTTPAsync against sequential CemirUtilsHTTP.get, using a local threaded test server that adds a fixed per-request delay.
+
+Sabit istek başı gecikme ekleyen yerel, çok iş parçacıklı bir test sunucusuyla CemirUtilsHTTPAsync'in sıralı CemirUtilsHTTP.get'e karşı çevrimdışı verim kıyaslaması.
+
+Usage / Kullanım:
+    python benchmarks/http_async.py [requests] [concurrency] [delay_ms]
+"""
+import asyncio
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from cemirutils import CemirUtilsHTTP, CemirUtilsHTTPAsync
+
+
+class DelayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    delay = 0.02
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        time.sleep(self.delay)
+        body = json.dumps({"path": self.path}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class BenchmarkServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+def start_server(delay):
+    DelayHandler.delay = delay
+    httpd = BenchmarkServer(("127.0.0.1", 0), DelayHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+
+async def run_async(url, count, concurrency):
+    async with CemirUtilsHTTPAsync(concurrency=concurrency, max_pool_size=concurrency) as client:
+        return await client.gather_many({"url": f"{url}/{i}"} for i in range(count))
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    delay = (int(sys.argv[3]) if len(sys.argv) > 3 else 20) / 1000
+
+    httpd = start_server(delay)
+    url = f"http://127.0.0.1:{httpd.server_port}"
+
+    sequential_count = min(count, 100)
+    started = time.perf_counter()
+    http = CemirUtilsHTTP()
+    for i in range(sequential_count):
+        http.get(f"{url}/{i}")
+    sequential = sequential_count / (time.perf_counter() - started)
+
+    started = time.perf_counter()
+    results = asyncio.run(run_async(url, count, concurrency))
+    concurrent = count / (time.perf_counter() - started)
+
+    assert [r["path"] for r in results] == [f"/{i}" for i in range(count)]
+    print(f"sequential CemirUtilsHTTP.get : {sequential:8.1f} req/s")
+    print(f"CemirUtilsHTTPAsync ({concurrency:>3} slots): {concurrent:8.1f} req/s")
+    httpd.shutdown()
@@ -0,0 +1,71 @@
+"""
+Load benchmark for the CemirUtilsHTTP.server concurrency modes. Each mode is started in a child process and driven from a local CemirUtilsHTTPAsync client while a "slow client" holds an idle connection open for the first second.
+
+CemirUtilsHTTP.server eşzamanlılık modları için yük kıyaslaması. Her mod bir alt süreçte başlatılır ve ilk saniye boyunca bir "yavaş istemci" boşta bağlantı tutarken yerel bir CemirUtilsHTTPAsync istemcisiyle yüklenir.
+
+Usage / Kullanım:
+    python benchmarks/http_server.py [requests] [concurrency]
+"""
+import asyncio
+import multiprocessing
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+
+from cemirutils import CemirUtilsHTTP, CemirUtilsHTTPAsync
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port, timeout=10):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+async def drive(url, count, concurrency):
+    async with CemirUtilsHTTPAsync(concurrency=concurrency, timeout=5) as client:
+        results = await client.gather_many(({"url": url} for _ in range(count)), return_exceptions=True)
+    return sum(isinstance(result, Exception) for result in results)
+
+
+def run_mode(mode, directory, count, concurrency):
+    port = free_port()
+    process = multiprocessing.Process(target=CemirUtilsHTTP().server, kwargs={"port": port, "directory": directory, "mode": mode, "backlog": 1024}, daemon=True)
+    process.start()
+    try:
+        wait_for_port(port)
+        slow_client = socket.create_connection(("127.0.0.1", port))  # connects and sends nothing for a second / bağlanır ve bir saniye hiçbir şey göndermez
+        threading.Timer(1.0, slow_client.close).start()
+        time.sleep(0.1)
+        started = time.perf_counter()
+        errors = asyncio.run(drive(f"http://127.0.0.1:{port}/payload.json", count, concurrency))
+        elapsed = time.perf_counter() - started
+        print(f"{mode:<8} {count / elapsed:9.1f} req/s   errors {errors}/{count}")
+    finally:
+        process.terminate()  # SIGTERM; the prefork parent forwards it to its workers and reaps them / SIGTERM; prefork üst süreci bunu işçilerine iletir ve onları toplar
+        process.join()
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+
+    with tempfile.TemporaryDirectory() as directory:
+        with open(os.path.join(directory, "payload.json"), "w") as f:
+            f.write('{"data": "' + "x" * 4096 + '"}')
+
+        for mode in ("single", "thread", "prefork", "asyncio"):
+            run_mode(mode, directory, count, concurrency)
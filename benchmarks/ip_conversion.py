@@ -0,0 +1,41 @@
+"""
+Micro-benchmark for IPGeolocation.ip_to_int / int_to_ip against the previous split and floor-division implementation.
+
+IPGeolocation.ip_to_int / int_to_ip için önceki split ve tam bölme uygulamasına karşı mikro kıyaslama.
+
+Usage / Kullanım:
+    python benchmarks/ip_conversion.py
+"""
+import random
+import timeit
+
+from cemirutils import IPGeolocation
+
+
+def legacy_ip_to_int(ip):
+    parts = ip.split('.')
+    return int(parts[0]) * 256 ** 3 + int(parts[1]) * 256 ** 2 + int(parts[2]) * 256 + int(parts[3])
+
+
+def legacy_int_to_ip(ip_int):
+    return f"{ip_int // (256 ** 3) % 256}.{ip_int // (256 ** 2) % 256}.{ip_int // 256 % 256}.{ip_int % 256}"
+
+
+def report(name, legacy, current, number):
+    legacy_ns = min(timeit.repeat(legacy, number=1, repeat=5)) / number * 1e9
+    current_ns = min(timeit.repeat(current, number=1, repeat=5)) / number * 1e9
+    print(f"{name:<12} legacy {legacy_ns:8.1f} ns/ip   new {current_ns:8.1f} ns/ip   speedup {legacy_ns / current_ns:5.2f}x")
+
+
+if __name__ == "__main__":
+    geo = IPGeolocation()
+    count = 200000
+    ints = [random.getrandbits(32) for _ in range(count)]
+    ips = [legacy_int_to_ip(n) for n in ints]
+
+    report("ip_to_int", lambda: [legacy_ip_to_int(ip) for ip in ips], lambda: [geo.ip_to_int(ip) for ip in ips], count)
+    report("int_to_ip", lambda: [legacy_int_to_ip(n) for n in ints], lambda: [geo.int_to_ip(n) for n in ints], count)
+    report("ips_to_ints", lambda: [legacy_ip_to_int(ip) for ip in ips], lambda: geo.ips_to_ints(ips), count)
+    report("ints_to_ips", lambda: [legacy_int_to_ip(n) for n in ints], lambda: geo.ints_to_ips(ints), count)
+
+    assert geo.ips_to_ints(ips) == ints and geo.ints_to_ips(ints) == ips
@@ -0,0 +1,58 @@
+"""
+Write throughput of CemirPostgreSQL inserting rows one autocommitted statement at a time, inside one transaction(), and as one batch() (a single round trip and a single commit). Uses a temporary table in the target database.
+
+CemirPostgreSQL ile satırları her biri ayrı onaylanan tek tek ifadelerle, tek bir transaction() içinde ve tek bir batch() olarak (tek gidiş-dönüş, tek commit) ekleme hızı kıyaslaması. Hedef veritabanında geçici bir tablo kullanır.
+
+Usage / Kullanım:
+    PGHOST=127.0.0.1 PGPORT=5432 PGUSER=postgres PGPASSWORD=secret PGDATABASE=postgres python benchmarks/postgres_batch.py [statements]
+"""
+import os
+import sys
+import time
+
+from cemirutils import CemirPostgreSQL
+
+
+INSERT = "INSERT INTO cemir_batch_bench (id, name) VALUES ($1, $2)"
+
+
+def main(statements):
+    db = CemirPostgreSQL(
+        dbhost=os.environ.get("PGHOST", "127.0.0.1"),
+        dbport=int(os.environ.get("PGPORT", 5432)),
+        dbuser=os.environ.get("PGUSER", "postgres"),
+        dbpassword=os.environ.get("PGPASSWORD", ""),
+        dbname=os.environ.get("PGDATABASE", "postgres"),
+        backend="wire",
+        pool_max_size=1,
+    )
+    db.raw("DROP TABLE IF EXISTS cemir_batch_bench; CREATE TABLE cemir_batch_bench (id int PRIMARY KEY, name text)")
+
+    def autocommit():
+        with db.connection() as connection:
+            for i in range(statements):
+                connection.execute(INSERT, (i, f"name {i}"))
+
+    def transaction():
+        with db.transaction() as connection:
+            for i in range(statements):
+                connection.execute(INSERT, (i, f"name {i}"))
+
+    def batch():
+        with db.batch() as statements_batch:
+            for i in range(statements):
+                statements_batch.execute(INSERT, (i, f"name {i}"))
+
+    for label, write in (("autocommit", autocommit), ("transaction()", transaction), ("batch()", batch)):
+        db.raw("TRUNCATE cemir_batch_bench")
+        started = time.perf_counter()
+        write()
+        elapsed = time.perf_counter() - started
+        print(f"{label:<15} {statements / elapsed:10,.0f} statements/s")
+
+    db.raw("DROP TABLE cemir_batch_bench")
+    db.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
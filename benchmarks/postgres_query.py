@@ -0,0 +1,75 @@
+"""
+Per-query latency of CemirPostgreSQL with the 'psql' subprocess backend against the 'wire' protocol backend, of parameterized queries with and without the prepared statement cache, and of CemirPostgreSQLAsync running statements one by one against pipeline(). Needs a reachable PostgreSQL server (and psql on PATH for the 'psql' backend).
+
+CemirPostgreSQL'in 'psql' alt süreç arka ucu ile 'wire' protokol arka ucunun, hazır ifade önbelleği olan/olmayan parametreli sorguların ve CemirPostgreSQLAsync ile tek tek çalıştırılan ifadelere karşı pipeline()'ın sorgu başına gecikme kıyaslaması. Erişilebilir bir PostgreSQL sunucusu (ve 'psql' arka ucu için PATH'te psql) gerekir.
+
+Usage / Kullanım:
+    PGHOST=127.0.0.1 PGPORT=5432 PGUSER=postgres PGPASSWORD=secret PGDATABASE=postgres python benchmarks/postgres_query.py [queries]
+"""
+import asyncio
+import os
+import shutil
+import sys
+import time
+
+from cemirutils import CemirPostgreSQL, CemirPostgreSQLAsync
+
+
+PARAMETERIZED_QUERY = "SELECT c.relname, c.relkind FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace WHERE c.oid > $1 AND n.nspname = $2 ORDER BY c.oid LIMIT 1"
+
+
+def settings():
+    return dict(
+        dbhost=os.environ.get("PGHOST", "127.0.0.1"),
+        dbport=int(os.environ.get("PGPORT", 5432)),
+        dbuser=os.environ.get("PGUSER", "postgres"),
+        dbpassword=os.environ.get("PGPASSWORD", ""),
+        dbname=os.environ.get("PGDATABASE", "postgres"),
+    )
+
+
+def run(backend, queries, statement_cache_size=None):
+    db = CemirPostgreSQL(
+        **settings(),
+        backend=backend,
+        statement_cache_size=statement_cache_size or 0,
+    )
+    db.raw("SELECT 1")  # warm up / ısınma
+    started = time.perf_counter()
+    for i in range(queries):
+        if statement_cache_size is None:
+            db.raw(f"SELECT {i}")
+        else:
+            db.raw(PARAMETERIZED_QUERY, params=(i, "pg_catalog"))
+    elapsed = time.perf_counter() - started
+    if backend == "wire":
+        db.close()
+    name = backend if statement_cache_size is None else f"{backend}, params, statement_cache_size={statement_cache_size}"
+    print(f"{name:<45} {elapsed / queries * 1000:9.3f} ms/query")
+
+
+async def run_async(queries, pipeline_size=50):
+    statements = [(PARAMETERIZED_QUERY, (i, "pg_catalog")) for i in range(queries)]
+    async with CemirPostgreSQLAsync(**settings(), pool_min_size=1, pool_max_size=1) as db:
+        await db.pipeline(statements[:pipeline_size])  # warm up / ısınma
+        started = time.perf_counter()
+        for sql, params in statements:
+            await db.raw(sql, params=params)
+        one_by_one = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for i in range(0, queries, pipeline_size):
+            await db.pipeline(statements[i:i + pipeline_size])
+        pipelined = time.perf_counter() - started
+    print(f"{'async, one by one':<45} {one_by_one / queries * 1000:9.3f} ms/query")
+    print(f"{f'async, pipeline({pipeline_size})':<45} {pipelined / queries * 1000:9.3f} ms/query")
+
+
+if __name__ == "__main__":
+    queries = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    if shutil.which("psql"):
+        run("psql", queries)
+    run("wire", queries)
+    run("wire", queries * 10, statement_cache_size=0)
+    run("wire", queries * 10, statement_cache_size=100)
+    asyncio.run(run_async(queries * 10))
@@ -0,0 +1,50 @@
+"""
+Decode throughput of CemirPostgreSQL wire reads with text against binary result formats, as rows and as columnar arrays. The rows come from generate_series, so no table is needed.
+
+CemirPostgreSQL wire okumalarında metin ve ikili sonuç biçimlerinin, satır ve kolon dizisi olarak çözme hızı kıyaslaması. Satırlar generate_series'ten gelir, tablo gerekmez.
+
+Usage / Kullanım:
+    PGHOST=127.0.0.1 PGPORT=5432 PGUSER=postgres PGPASSWORD=secret PGDATABASE=postgres python benchmarks/postgres_read.py [rows]
+"""
+import os
+import sys
+import time
+
+from cemirutils import CemirPostgreSQL
+
+
+QUERIES = {
+    "int8, float8, bool": "SELECT g::int8 AS id, g / 3.0::float8 AS f, g % 2 = 0 AS flag FROM generate_series(1, $1) g",
+    "+ timestamp": "SELECT g::int8 AS id, g / 3.0::float8 AS f, g % 2 = 0 AS flag, timestamp '2024-01-01' + g * interval '1 second' AS ts FROM generate_series(1, $1) g",
+    "+ uuid, jsonb": "SELECT g::int8 AS id, g % 2 = 0 AS flag, md5(g::text)::uuid AS u, jsonb_build_object('g', g) AS j FROM generate_series(1, $1) g",
+}
+
+
+def run(binary_results, rows):
+    db = CemirPostgreSQL(
+        dbhost=os.environ.get("PGHOST", "127.0.0.1"),
+        dbport=int(os.environ.get("PGPORT", 5432)),
+        dbuser=os.environ.get("PGUSER", "postgres"),
+        dbpassword=os.environ.get("PGPASSWORD", ""),
+        dbname=os.environ.get("PGDATABASE", "postgres"),
+        backend="wire",
+        binary_results=binary_results,
+    )
+    with db.connection() as connection:
+        for label, query in QUERIES.items():
+            connection.execute(query, (10,))  # prepare, learn the column types / hazırla, kolon türlerini öğren
+            started = time.perf_counter()
+            connection.execute(query, (rows,)).rows
+            as_rows = time.perf_counter() - started
+            started = time.perf_counter()
+            connection.execute(query, (rows,)).columnar()
+            as_columns = time.perf_counter() - started
+            name = f"{'binary' if binary_results else 'text'}, {label}"
+            print(f"{name:<30} rows {rows / as_rows:10,.0f}/s   columnar {rows / as_columns:10,.0f}/s")
+    db.close()
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    run(False, rows)
+    run(True, rows)
@@ -7,12 +7,21 @@ __all__ = [
     'CemirUtils',
     'CemirUtilsConditions',
     'CemirPostgreSQL',
+    'CemirPostgreSQLConnection',
+    'CemirPostgreSQLPool',
+    'CemirPostgreSQLError',
+    'CemirPostgreSQLBatch',
+    'CemirPostgreSQLAsync',
+    'CemirPostgreSQLAsyncConnection',
+    'CemirPostgreSQLAsyncPool',
     'IPGeolocation',
     'CemirUtilsEmail',
     'CemirUtilsDecorators',
     'CemirUtilsFunctionNotification',
     'CemirUtilsLoopTimer',
     'CemirUtilsHTTP',
+    'CemirUtilsHTTPSession',
+    'CemirUtilsHTTPAsync',
     'CemirUtilsAMP'
 ]
 
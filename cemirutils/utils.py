@@ -1,32 +1,55 @@
 import ast
+import asyncio
 import base64
+import bisect
 import csv
 import functools
+import gzip
+import hashlib
+import hmac
+import html
 import http.client
 import inspect
+import io
 import json
 import logging
+import mimetypes
+import mmap
+import numbers
 import os
+import posixpath
 import re
+import signal
 import smtplib
+import socket
 import sqlite3
 import ssl
+import struct
 import subprocess
 import sys
+import threading
 import time
+import uuid
 import zipfile
+import zlib
+from array import array
 from calendar import monthrange
-from datetime import datetime, timedelta
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import asynccontextmanager, contextmanager
+from collections import OrderedDict, namedtuple
+from datetime import date, datetime, time as datetime_time, timedelta, timezone
+from decimal import Decimal
 from email import encoders
 from email.mime.base import MIMEBase
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from email.utils import formataddr
+from email.utils import formataddr, formatdate, parsedate_to_datetime
 from functools import wraps
 from http.client import HTTPSConnection
 from http.server import SimpleHTTPRequestHandler, HTTPServer
 from urllib import request
-from urllib.parse import urlparse, urlencode
+from urllib.error import HTTPError
+from urllib.parse import quote, unquote, urlparse, urlencode
 
 ver = "2.2.4"
 
@@ -298,29 +321,517 @@ class CemirUtilsHTTP:
         """
         return [method for method in dir(CemirUtilsHTTP) if callable(getattr(CemirUtilsHTTP, method)) and not method.startswith("__")]
 
-    def server(self, port=8000, ip='127.0.0.1', ssl_cert=None, ssl_key=None, username=None, password=None, directory=None):
+    class SingleHTTPServer(HTTPServer):
         """
-        Starts an HTTP server on the specified IP and port with optional SSL and basic authentication.
+        HTTPServer with a configurable listen backlog and optional SO_REUSEPORT.
 
-        Belirtilen IP ve port üzerinde isteğe bağlı SSL ve temel kimlik doğrulama ile bir HTTP sunucusu başlatır.
+        Dinleme kuyruğu ayarlanabilen ve isteğe bağlı SO_REUSEPORT kullanan HTTPServer.
+        """
+
+        def __init__(self, server_address, handler_class, backlog=5, reuse_port=False):
+            self.request_queue_size = backlog
+            self.reuse_port = reuse_port
+            super().__init__(server_address, handler_class)
+
+        def server_bind(self):
+            if self.reuse_port:
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            super().server_bind()
+
+    class PooledHTTPServer(SingleHTTPServer):
+        """
+        HTTPServer that hands every connection to a bounded thread pool, so one slow client cannot block the others.
+
+        Her bağlantıyı sınırlı bir iş parçacığı havuzuna veren HTTPServer; yavaş bir istemci diğerlerini engelleyemez.
+        """
+
+        def __init__(self, server_address, handler_class, workers=32, backlog=5, reuse_port=False):
+            self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="CemirUtilsHTTP")
+            super().__init__(server_address, handler_class, backlog=backlog, reuse_port=reuse_port)
+
+        def process_request(self, request, client_address):
+            self.executor.submit(self.process_request_thread, request, client_address)
+
+        def process_request_thread(self, request, client_address):
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+
+        def server_close(self):
+            super().server_close()
+            self.executor.shutdown(wait=False)
+
+    class GzipCache:
+        """
+        Bounded LRU of gzip-compressed file bodies keyed by path and invalidated when the file's mtime or size changes, so each file is compressed once.
+
+        Yol ile anahtarlanan, dosyanın mtime veya boyutu değişince geçersizleşen, sınırlı boyutlu gzip gövde LRU önbelleği; her dosya bir kez sıkıştırılır.
+        """
+
+        COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript", "application/xml", "image/svg+xml")
+
+        def __init__(self, max_bytes=32 * 1024 * 1024, max_entry_bytes=8 * 1024 * 1024, min_size=256, level=6):
+            self.max_bytes = max_bytes
+            self.max_entry_bytes = max_entry_bytes
+            self.min_size = min_size
+            self.level = level
+            self.entries = OrderedDict()
+            self.size = 0
+            self.lock = threading.Lock()
+
+        def is_compressible(self, content_type, size):
+            return self.min_size <= size <= self.max_entry_bytes and content_type.startswith(self.COMPRESSIBLE_TYPES)
+
+        def get(self, path, fs):
+            """
+            Returns the gzip body for path, compressing and caching it on a miss.
+
+            path için gzip gövdesini döndürür; yoksa sıkıştırıp önbelleğe alır.
+            """
+            version = (fs.st_mtime_ns, fs.st_size)
+            with self.lock:
+                entry = self.entries.get(path)
+                if entry is not None and entry[0] == version:
+                    self.entries.move_to_end(path)
+                    return entry[1]
+
+            with open(path, 'rb') as f:
+                body = gzip.compress(f.read(), self.level)
+
+            with self.lock:
+                old = self.entries.pop(path, None)
+                if old is not None:
+                    self.size -= len(old[1])
+                if len(body) <= self.max_bytes:
+                    self.entries[path] = (version, body)
+                    self.size += len(body)
+                    while self.size > self.max_bytes:
+                        _, (_, evicted) = self.entries.popitem(last=False)
+                        self.size -= len(evicted)
+            return body
+
+        def variant(self, path, fs, content_type):
+            """
+            Returns (file, size, etag) for the gzip representation: a fresh precompressed .gz sibling when present, otherwise the cached compressed body.
+
+            gzip gösterimi için (dosya, boyut, etag) döndürür: varsa güncel .gz kardeş dosya, yoksa önbellekteki sıkıştırılmış gövde.
+            """
+            try:
+                gz_stat = os.stat(path + ".gz")
+                if gz_stat.st_mtime_ns >= fs.st_mtime_ns:
+                    return open(path + ".gz", 'rb'), gz_stat.st_size, f'"{gz_stat.st_mtime_ns:x}-{gz_stat.st_size:x}-gz"'
+            except OSError:
+                pass
+
+            if not self.is_compressible(content_type, fs.st_size):
+                return None
+            body = self.get(path, fs)
+            return io.BytesIO(body), len(body), f'"{fs.st_mtime_ns:x}-{fs.st_size:x}-gz"'
+
+    class BasicAuth:
+        """
+        Basic-auth verifier for the file servers. Credentials come from a single username/password pair and/or a password file with one "username:pbkdf2_sha256$iterations$salt$hash" line per user (see hash_password). Decisions are cached per raw Authorization header in a bounded LRU, so repeated requests skip base64 decoding and hashing; comparisons use hmac.compare_digest.
+
+        Dosya sunucuları için temel kimlik doğrulayıcı. Kimlik bilgileri tek bir kullanıcı adı/parola çiftinden ve/veya kullanıcı başına bir "kullanıcı:pbkdf2_sha256$yineleme$tuz$özet" satırı içeren parola dosyasından gelir (bkz. hash_password). Kararlar ham Authorization başlığı başına sınırlı bir LRU'da önbelleğe alınır; tekrarlanan isteklerde base64 çözme ve özetleme atlanır. Karşılaştırmalar hmac.compare_digest ile yapılır.
+        """
+
+        SCHEME = "pbkdf2_sha256"
+
+        def __init__(self, username=None, password=None, password_file=None, cache_size=1024):
+            self.password_file = password_file
+            self.cache_size = cache_size
+            self.cache = OrderedDict()
+            self.lock = threading.Lock()
+            self.users = {}
+            # Checked for unknown users so that they cost the same as a wrong password / Bilinmeyen kullanıcılar yanlış parola ile aynı süreyi harcasın diye kullanılır
+            self.dummy = ("plain", os.urandom(16))
+            if username and password:
+                self.users[username] = ("plain", password.encode('utf-8'))
+            if password_file:
+                self.load_password_file(password_file)
+
+        @classmethod
+        def hash_password(cls, password, iterations=100000, salt=None):
+            """
+            Returns a password file entry (without the "username:" prefix) for the given password.
+
+            Verilen parola için bir parola dosyası girdisi ("kullanıcı:" öneki olmadan) döndürür.
+
+            Parameters:
+            password (str): The password to hash. / Özetlenecek parola.
+            iterations (int): PBKDF2 iterations. Default is 100000. / PBKDF2 yineleme sayısı.
+            salt (bytes): Salt, random 16 bytes by default. / Tuz, varsayılan rastgele 16 bayt.
+
+            Returns:
+            str: "pbkdf2_sha256$iterations$salt$hash"
+            """
+            salt = salt or os.urandom(16)
+            digest = hashlib.pbkdf2_hmac("sha256", password.encode('utf-8'), salt, iterations)
+            return f"{cls.SCHEME}${iterations}${base64.b64encode(salt).decode()}${base64.b64encode(digest).decode()}"
+
+        def load_password_file(self, path):
+            """
+            Loads (or reloads) users from a password file and clears the decision cache. Blank lines and lines starting with # are skipped.
+
+            Kullanıcıları bir parola dosyasından yükler (veya yeniden yükler) ve karar önbelleğini temizler. Boş satırlar ve # ile başlayan satırlar atlanır.
+            """
+            users = {}
+            with open(path, 'r', encoding='utf-8') as f:
+                for number, line in enumerate(f, 1):
+                    line = line.strip()
+                    if not line or line.startswith("#"):
+                        continue
+                    username, _, entry = line.partition(":")
+                    try:
+                        scheme, iterations, salt, digest = entry.split("$")
+                        if scheme != self.SCHEME:
+                            raise ValueError(scheme)
+                        users[username] = (scheme, int(iterations), base64.b64decode(salt), base64.b64decode(digest))
+                    except ValueError:
+                        raise ValueError(f"Invalid password file entry on line {number} / {number}. satırda geçersiz parola dosyası girdisi")
+
+            with self.lock:
+                self.users = {name: user for name, user in self.users.items() if user[0] == "plain"}
+                self.users.update(users)
+                self.cache.clear()
+            if users:
+                iterations = max(user[1] for user in users.values())
+                self.dummy = (self.SCHEME, iterations, os.urandom(16), os.urandom(32))
+
+        def verify(self, username, password):
+            user = self.users.get(username)
+            known = user is not None
+            if not known:
+                user = self.dummy
+
+            password = password.encode('utf-8')
+            if user[0] == "plain":
+                matches = hmac.compare_digest(password, user[1])
+            else:
+                _, iterations, salt, digest = user
+                matches = hmac.compare_digest(hashlib.pbkdf2_hmac("sha256", password, salt, iterations), digest)
+            return known and matches
+
+        def check(self, auth_header):
+            """
+            Returns True when the Authorization header carries valid credentials.
+
+            Authorization başlığı geçerli kimlik bilgileri taşıyorsa True döndürür.
+            """
+            if auth_header is None:
+                return False
+
+            with self.lock:
+                allowed = self.cache.get(auth_header)
+                if allowed is not None:
+                    self.cache.move_to_end(auth_header)
+                    return allowed
+
+            try:
+                auth_type, auth_value = auth_header.split(None, 1)
+                if auth_type.lower() != 'basic':
+                    return False
+                credentials = base64.b64decode(auth_value.encode('utf-8'), validate=True).decode('utf-8')
+                auth_username, auth_password = credentials.split(':', 1)
+            except ValueError:
+                return False
+
+            allowed = self.verify(auth_username, auth_password)
+            with self.lock:
+                self.cache[auth_header] = allowed
+                if len(self.cache) > self.cache_size:
+                    self.cache.popitem(last=False)
+            return allowed
+
+    class AsyncFileServer:
+        """
+        asyncio static file server: one coroutine per connection instead of one thread, HTTP/1.1 keep-alive, requests parsed strictly in order so pipelined requests are answered one after another, and file bodies sent with loop.sendfile.
+
+        asyncio statik dosya sunucusu: iş parçacığı yerine bağlantı başına bir eşyordam, HTTP/1.1 keep-alive, ardışık (pipelined) isteklerin sırayla yanıtlanması için sıralı ayrıştırma ve dosya gövdeleri için loop.sendfile.
+        """
+
+        MAX_HEADER_LINES = 100
+
+        def __init__(self, directory=None, auth=None, gzip_cache=None, keepalive_timeout=75):
+            self.directory = os.path.abspath(directory or os.getcwd())
+            self.auth = auth
+            self.gzip_cache = gzip_cache
+            self.keepalive_timeout = keepalive_timeout
+
+        async def serve(self, ip='127.0.0.1', port=8000, ssl_context=None, backlog=100):
+            server = await asyncio.start_server(self.handle_connection, ip, port, ssl=ssl_context, backlog=backlog)
+            async with server:
+                await server.serve_forever()
+
+        async def handle_connection(self, reader, writer):
+            try:
+                while True:
+                    try:
+                        head = await asyncio.wait_for(self.read_head(reader), self.keepalive_timeout)
+                    except asyncio.TimeoutError:
+                        break
+                    if head is None:
+                        break
+                    if not await self.handle_request(reader, writer, *head):
+                        break
+            except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+                pass  # Client went away or sent an oversized line / İstemci ayrıldı veya çok uzun satır gönderdi
+            finally:
+                writer.close()
+
+        async def read_head(self, reader):
+            request_line = await reader.readline()
+            while request_line in (b"\r\n", b"\n"):
+                request_line = await reader.readline()  # Tolerate stray CRLF between requests / İstekler arasındaki fazladan CRLF'yi yok say
+            if not request_line:
+                return None
+
+            lines = []
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                lines.append(line)
+                if len(lines) > self.MAX_HEADER_LINES:
+                    raise ValueError("Too many headers / Çok fazla başlık")
+            return request_line.decode("latin-1"), http.client.parse_headers(io.BytesIO(b"".join(lines) + b"\r\n"))
+
+        async def handle_request(self, reader, writer, request_line, headers):
+            parts = request_line.split()
+            if len(parts) != 3 or not parts[2].startswith("HTTP/1."):
+                await self.send_error(writer, "GET", 400, False)
+                return False
+            method, target, version = parts
+
+            connection = (headers.get("Connection") or "").lower()
+            keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+            # Consume the request body so the next pipelined request starts at the right byte / Sonraki ardışık istek doğru bayttan başlasın diye gövdeyi tüket
+            if "chunked" in (headers.get("Transfer-Encoding") or "").lower():
+                await self.send_error(writer, method, 501, False)
+                return False
+            try:
+                length = int(headers.get("Content-Length") or 0)
+            except ValueError:
+                length = -1
+            if length < 0:
+                await self.send_error(writer, method, 400, False)
+                return False
+            if length:
+                await reader.readexactly(length)
+
+            if method not in ("GET", "HEAD"):
+                await self.send_error(writer, method, 501, keep_alive)
+                return keep_alive
+
+            if self.auth is not None and not self.auth.check(headers.get("Authorization")):
+                await self.send_response(writer, method, 401, [("WWW-Authenticate", 'Basic realm="CemirUtils"'), ("Content-Length", "12")], b"Unauthorized", keep_alive=keep_alive)
+                return keep_alive
+
+            url_path = target.split('?', 1)[0].split('#', 1)[0]
+            path = self.translate_path(url_path)
+            if os.path.isdir(path):
+                if not url_path.endswith('/'):
+                    location = url_path + '/' + target[len(url_path):]
+                    await self.send_response(writer, method, 301, [("Location", location), ("Content-Length", "0")], keep_alive=keep_alive)
+                    return keep_alive
+                for index in ("index.html", "index.htm"):
+                    if os.path.isfile(os.path.join(path, index)):
+                        path = os.path.join(path, index)
+                        break
+                else:
+                    listing = self.list_directory(path, url_path)
+                    if listing is None:
+                        await self.send_error(writer, method, 404, keep_alive)
+                    else:
+                        await self.send_response(writer, method, 200, [("Content-type", "text/html; charset=utf-8"), ("Content-Length", str(len(listing)))], listing, keep_alive=keep_alive)
+                    return keep_alive
+
+            if path.endswith("/") or not os.path.isfile(path):
+                await self.send_error(writer, method, 404, keep_alive)
+                return keep_alive
+            try:
+                content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+                status, response_headers, body, byte_range = CemirUtilsHTTP.file_response(path, headers, content_type, self.gzip_cache)
+            except OSError:
+                await self.send_error(writer, method, 404, keep_alive)
+                return keep_alive
+
+            await self.send_response(writer, method, status, response_headers, body, byte_range, keep_alive)
+            return keep_alive
+
+        def translate_path(self, url_path):
+            trailing_slash = url_path.rstrip().endswith('/')
+            path = self.directory
+            for word in posixpath.normpath(unquote(url_path)).split('/'):
+                if not word or os.path.dirname(word) or word in (os.curdir, os.pardir):
+                    continue
+                path = os.path.join(path, word)
+            return path + '/' if trailing_slash else path
+
+        def list_directory(self, path, url_path):
+            try:
+                names = sorted(os.listdir(path), key=str.lower)
+            except OSError:
+                return None
+
+            title = html.escape(unquote(url_path), quote=False)
+            items = []
+            for name in names:
+                link = name + '/' if os.path.isdir(os.path.join(path, name)) else name
+                items.append(f'<li><a href="{quote(link)}">{html.escape(link, quote=False)}</a></li>')
+            page = f'<!DOCTYPE HTML>\n<html>\n<head>\n<meta charset="utf-8">\n<title>Directory listing for {title}</title>\n</head>\n<body>\n<h1>Directory listing for {title}</h1>\n<hr>\n<ul>\n' + '\n'.join(items) + '\n</ul>\n<hr>\n</body>\n</html>\n'
+            return page.encode('utf-8', 'surrogateescape')
+
+        async def send_error(self, writer, method, status, keep_alive):
+            body = f"{status} {http.client.responses.get(status, '')}".encode('latin-1')
+            await self.send_response(writer, method, status, [("Content-Type", "text/plain"), ("Content-Length", str(len(body)))], body, keep_alive=keep_alive)
+
+        async def send_response(self, writer, method, status, headers, body=None, byte_range=None, keep_alive=True):
+            head = [f"HTTP/1.1 {status} {http.client.responses.get(status, '')}", "Server: CemirUtils", f"Date: {formatdate(usegmt=True)}"]
+            head += [f"{keyword}: {value}" for keyword, value in headers]
+            head.append("Connection: keep-alive" if keep_alive else "Connection: close")
+            writer.write(("\r\n".join(head) + "\r\n\r\n").encode('latin-1'))
+
+            try:
+                if method != "HEAD" and body is not None:
+                    if isinstance(body, bytes):
+                        writer.write(body)
+                    elif byte_range is None:
+                        writer.write(body.read())
+                    elif byte_range[1]:
+                        # Flush the head, then zero-copy the file (falls back to read/write for TLS) / Önce başlığı gönder, sonra dosyayı kopyasız aktar (TLS'te okuma/yazmaya düşer)
+                        await writer.drain()
+                        await asyncio.get_running_loop().sendfile(writer.transport, body, byte_range[0], byte_range[1])
+                await writer.drain()
+            finally:
+                if body is not None and not isinstance(body, bytes):
+                    body.close()
+
+    @staticmethod
+    def file_response(path, headers, content_type, gzip_cache=None):
+        """
+        Decides how to answer a GET for a regular file: ETag/Last-Modified validators, 304 for If-None-Match/If-Modified-Since, a single byte range (206/416) and the gzip variant when the client accepts it.
+
+        Normal bir dosya için GET yanıtına karar verir: ETag/Last-Modified doğrulayıcıları, If-None-Match/If-Modified-Since için 304, tek bayt aralığı (206/416) ve istemci kabul ediyorsa gzip çeşidi.
 
         Parameters:
-        port (int): The port number for the server. Default is 8000.
-        ip (str): The IP address for the server. Default is '127.0.0.1'.
-        ssl_cert (str): Path to the SSL certificate file.
-        ssl_key (str): Path to the SSL key file.
-        username (str): Username for basic authentication.
-        password (str): Password for basic authentication.
-        directory (str): Directory to serve files from.
+        path (str): File path. / Dosya yolu.
+        headers (Message): Request headers. / İstek başlıkları.
+        content_type (str): Content type of the file. / Dosyanın içerik türü.
+        gzip_cache (CemirUtilsHTTP.GzipCache): Compression cache, None disables gzip. / Sıkıştırma önbelleği, None gzip'i kapatır.
+
+        Returns:
+        tuple: (status, [(header, value)], body file or None, (offset, count) to sendfile or None for in-memory bodies)
+
+        Raises:
+        OSError: If the file cannot be opened. / Dosya açılamazsa.
         """
+        f = open(path, 'rb')
+        try:
+            fs = os.fstat(f.fileno())
+            size = fs.st_size
+            etag = f'"{fs.st_mtime_ns:x}-{size:x}"'
+            last_modified = formatdate(fs.st_mtime, usegmt=True)
+
+            vary = gzip_cache is not None and (gzip_cache.is_compressible(content_type, size) or os.path.isfile(path + ".gz"))
+            encoded = gzip_cache.variant(path, fs, content_type) if vary and not headers.get("Range") and CemirUtilsHTTP.accepts_gzip(headers) else None
+            if encoded:
+                f.close()
+                f, size, etag = encoded
+
+            validators = [("ETag", etag), ("Last-Modified", last_modified)]
+            if vary:
+                validators.append(("Vary", "Accept-Encoding"))
+
+            if CemirUtilsHTTP.is_not_modified(headers, etag, fs.st_mtime):
+                f.close()
+                return 304, validators, None, None
+
+            byte_range = CemirUtilsHTTP.parse_range(headers, size, etag, last_modified)
+            if byte_range == "unsatisfiable":
+                f.close()
+                return 416, [("Content-Range", f"bytes */{size}"), ("Content-Length", "0")], None, None
+
+            response_headers = [("Content-type", content_type), ("Accept-Ranges", "bytes")] + validators
+            if encoded:
+                response_headers.append(("Content-Encoding", "gzip"))
+
+            if byte_range:
+                start, end = byte_range
+                response_headers += [("Content-Range", f"bytes {start}-{end}/{size}"), ("Content-Length", str(end - start + 1))]
+                return 206, response_headers, f, (start, end - start + 1)
+
+            response_headers.append(("Content-Length", str(size)))
+            # In-memory gzip bodies go through a regular write / Bellekteki gzip gövdeleri normal yazma ile gider
+            return 200, response_headers, f, None if isinstance(f, io.BytesIO) else (0, size)
+        except Exception:
+            f.close()
+            raise
+
+    @staticmethod
+    def accepts_gzip(headers):
+        for coding in (headers.get("Accept-Encoding") or "").split(","):
+            name, _, params = coding.partition(";")
+            if name.strip().lower() in ("gzip", "*"):
+                q = params.strip().lower()
+                try:
+                    return not (q.startswith("q=") and float(q[2:] or 0) == 0)
+                except ValueError:
+                    return False
+        return False
+
+    @staticmethod
+    def is_not_modified(headers, etag, mtime):
+        if_none_match = headers.get("If-None-Match")
+        if if_none_match is not None:
+            tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+            return "*" in tags or etag in tags
+
+        if_modified_since = headers.get("If-Modified-Since")
+        if if_modified_since:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError, IndexError, OverflowError):
+                return False
+            return since.tzinfo is not None and int(mtime) <= since.timestamp()
+        return False
+
+    @staticmethod
+    def parse_range(headers, size, etag, last_modified):
+        range_header = headers.get("Range")
+        if not range_header or not range_header.startswith("bytes=") or "," in range_header:
+            return None  # Absent, foreign or multi-range: send the whole file / Yok, yabancı veya çoklu aralık: dosyanın tamamı gönderilir
+
+        if_range = headers.get("If-Range")
+        if if_range and if_range.strip() not in (etag, last_modified):
+            return None
+
+        first, _, last = range_header[6:].strip().partition("-")
+        try:
+            if first:
+                start = int(first)
+                end = min(int(last), size - 1) if last else size - 1
+            else:
+                start, end = max(size - int(last), 0), size - 1
+        except ValueError:
+            return None
+
+        if start >= size or start > end:
+            return "unsatisfiable"
+        return start, end
 
+    def _make_handler(self, directory=None, auth=None, gzip_cache=None):
         class CemirUtilsHTTPRequestHandler(SimpleHTTPRequestHandler):
             def __init__(self, *args, **kwargs):
                 super().__init__(*args, directory=directory, **kwargs)
 
             def do_GET(self):
-                if username and password:
-                    if not self.check_basic_auth(username, password):
+                if auth is not None:
+                    if not self.check_basic_auth():
                         self.send_response(401)
                         self.send_header('WWW-Authenticate', 'Basic realm="CemirUtils"')
                         self.end_headers()
@@ -329,35 +840,184 @@ class CemirUtilsHTTP:
 
                 super().do_GET()
 
-            def check_basic_auth(self, username, password):
-                auth_header = self.headers.get('Authorization')
-                if auth_header is None:
-                    return False
-
-                auth_type, auth_value = auth_header.split(None, 1)
-                if auth_type.lower() != 'basic':
-                    return False
-
-                encoded_credentials = auth_value.encode('utf-8')
-                credentials = base64.b64decode(encoded_credentials).decode('utf-8')
-                auth_username, auth_password = credentials.split(':', 1)
-
-                return auth_username == username and auth_password == password
-
-        httpd = HTTPServer((ip, port), CemirUtilsHTTPRequestHandler)
+            def do_HEAD(self):
+                if auth is not None and not self.check_basic_auth():
+                    self.send_response(401)
+                    self.send_header('WWW-Authenticate', 'Basic realm="CemirUtils"')
+                    self.end_headers()
+                    return
+
+                super().do_HEAD()
+
+            def check_basic_auth(self):
+                return auth.check(self.headers.get('Authorization'))
+
+            def send_head(self):
+                """
+                Serves regular files with ETag/Last-Modified validators, 304 answers for If-None-Match/If-Modified-Since and single byte-range (206) responses. Directories and redirects are left to SimpleHTTPRequestHandler.
+
+                Normal dosyaları ETag/Last-Modified doğrulayıcıları, If-None-Match/If-Modified-Since için 304 yanıtları ve tek bayt aralıklı (206) yanıtlarla sunar. Dizinler ve yönlendirmeler SimpleHTTPRequestHandler'a bırakılır.
+                """
+                self.byte_range = None
+                path = self.translate_path(self.path)
+                if os.path.isdir(path):
+                    if not urlparse(self.path).path.endswith('/'):
+                        return super().send_head()
+                    for index in ("index.html", "index.htm"):
+                        if os.path.isfile(os.path.join(path, index)):
+                            path = os.path.join(path, index)
+                            break
+                    else:
+                        return super().send_head()
+
+                if path.endswith("/"):
+                    self.send_error(404, "File not found")
+                    return None
+                try:
+                    status, response_headers, body, self.byte_range = CemirUtilsHTTP.file_response(path, self.headers, self.guess_type(path), gzip_cache)
+                except OSError:
+                    self.send_error(404, "File not found")
+                    return None
+
+                self.send_response(status)
+                for keyword, value in response_headers:
+                    self.send_header(keyword, value)
+                self.end_headers()
+                return body
+
+            def copyfile(self, source, outputfile):
+                if getattr(self, "byte_range", None) is None or outputfile is not self.wfile:
+                    return super().copyfile(source, outputfile)
+
+                # Zero-copy from the page cache to the socket (socket.sendfile uses os.sendfile and falls back for TLS) / Sayfa önbelleğinden sokete kopyasız aktarım
+                offset, count = self.byte_range
+                if count:
+                    self.connection.sendfile(source, offset, count)
+
+        return CemirUtilsHTTPRequestHandler
+
+    def server(self, port=8000, ip='127.0.0.1', ssl_cert=None, ssl_key=None, username=None, password=None, directory=None, mode='single', workers=32, processes=None, backlog=5, compression=True, compression_cache_size=32 * 1024 * 1024, password_file=None):
+        """
+        Starts an HTTP server on the specified IP and port with optional SSL and basic authentication.
 
-        if ssl_cert and ssl_key:
-            httpd.socket = ssl.wrap_socket(httpd.socket, certfile=ssl_cert, keyfile=ssl_key, server_side=True)
-            print(f"Starting HTTP server with SSL on https://{ip}:{port}")
+        Belirtilen IP ve port üzerinde isteğe bağlı SSL ve temel kimlik doğrulama ile bir HTTP sunucusu başlatır.
 
-        print(f"Starting HTTP server on http://{ip}:{port}")
-        httpd.serve_forever()
+        Parameters:
+        port (int): The port number for the server. Default is 8000.
+        ip (str): The IP address for the server. Default is '127.0.0.1'.
+        ssl_cert (str): Path to the SSL certificate file.
+        ssl_key (str): Path to the SSL key file.
+        username (str): Username for basic authentication.
+        password (str): Password for basic authentication.
+        directory (str): Directory to serve files from.
+        mode (str): 'single' (one request at a time), 'thread' (bounded thread pool), 'prefork' (one SO_REUSEPORT listener per process, each with a thread pool) or 'asyncio' (one event loop, keep-alive and pipelining, suited to many idle connections). Default is 'single'. / 'single' (tek tek istek), 'thread' (sınırlı iş parçacığı havuzu), 'prefork' (her süreçte iş parçacığı havuzlu, SO_REUSEPORT dinleyicisi) veya 'asyncio' (tek olay döngüsü, keep-alive ve ardışık istekler; çok sayıda boşta bağlantı için uygun).
+        workers (int): Thread pool size for 'thread' and per process for 'prefork'. Default is 32. / 'thread' için ve 'prefork'ta süreç başına iş parçacığı havuzu boyutu.
+        processes (int): Number of processes for 'prefork'. Default is os.cpu_count(). / 'prefork' için süreç sayısı.
+        backlog (int): Listen backlog. Default is 5. / Dinleme kuyruğu uzunluğu.
+        compression (bool): Answer Accept-Encoding: gzip with precompressed .gz siblings or cached on-the-fly gzip of text files. Default is True. / Accept-Encoding: gzip isteklerini .gz kardeş dosyalarla veya metin dosyalarının önbelleğe alınan anlık gzip'i ile yanıtla.
+        compression_cache_size (int): Byte limit of the gzip LRU cache. Default is 32 MiB. / gzip LRU önbelleğinin bayt sınırı.
+        password_file (str): Password file with one "username:hash" line per user, hashes made by CemirUtilsHTTP.BasicAuth.hash_password. Can be combined with username/password. / Kullanıcı başına bir "kullanıcı:özet" satırı içeren parola dosyası; özetler CemirUtilsHTTP.BasicAuth.hash_password ile üretilir. username/password ile birlikte kullanılabilir.
+        """
+        gzip_cache = self.GzipCache(max_bytes=compression_cache_size) if compression else None
+        auth = self.BasicAuth(username, password, password_file) if (username and password) or password_file else None
+        scheme = "https" if ssl_cert and ssl_key else "http"
+
+        def make_ssl_context():
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(certfile=ssl_cert, keyfile=ssl_key)
+            return context
+
+        if mode == 'asyncio':
+            file_server = self.AsyncFileServer(directory=directory, auth=auth, gzip_cache=gzip_cache)
+            print(f"Starting HTTP server (asyncio) on {scheme}://{ip}:{port}")
+            try:
+                asyncio.run(file_server.serve(ip, port, ssl_context=make_ssl_context() if scheme == "https" else None, backlog=backlog))
+            except KeyboardInterrupt:
+                pass
+            return
+
+        handler_class = self._make_handler(directory=directory, auth=auth, gzip_cache=gzip_cache)
+
+        if mode == 'prefork' and not (hasattr(os, 'fork') and hasattr(socket, 'SO_REUSEPORT')):
+            print("prefork needs os.fork and SO_REUSEPORT, falling back to thread mode / prefork için os.fork ve SO_REUSEPORT gerekli, thread moduna geçiliyor")
+            mode = 'thread'
+
+        def make_server(reuse_port=False):
+            if mode == 'single':
+                httpd = self.SingleHTTPServer((ip, port), handler_class, backlog=backlog, reuse_port=reuse_port)
+            elif mode in ('thread', 'prefork'):
+                httpd = self.PooledHTTPServer((ip, port), handler_class, workers=workers, backlog=backlog, reuse_port=reuse_port)
+            else:
+                raise ValueError(f"Unknown server mode: {mode} / Bilinmeyen sunucu modu: {mode}")
 
-    def send_request(self, url, method='GET', headers=None, data=None, destination=None):
-        """
-        Send an HTTP request to the given URL with the specified method, headers, and data, using the default User-Agent if not provided in headers. If destination is provided, download the file to the destination path.
+            if scheme == "https":
+                httpd.socket = make_ssl_context().wrap_socket(httpd.socket, server_side=True)
+            return httpd
 
-        Belirtilen URL'ye belirtilen yöntem, başlıklar ve verilerle bir HTTP isteği gönderir. Başlıklarda belirtilmemişse varsayılan Kullanıcı Aracısı'nı kullanır. Hedef belirtilmişse, dosyayı hedef yola indirir.
+        if mode != 'prefork':
+            httpd = make_server()
+            print(f"Starting HTTP server ({mode}) on {scheme}://{ip}:{port}")
+            try:
+                httpd.serve_forever()
+            finally:
+                httpd.server_close()
+            return
+
+        processes = processes or os.cpu_count() or 1
+        print(f"Starting HTTP server (prefork, {processes} processes) on {scheme}://{ip}:{port}")
+
+        # Children hold the read end; it hits EOF when the parent dies, even by SIGKILL / Çocuklar okuma ucunu tutar; üst süreç ölünce, SIGKILL ile bile, EOF gelir
+        parent_alive, parent_alive_writer = os.pipe()
+
+        def watch_parent(httpd):
+            os.read(parent_alive, 1)
+            httpd.shutdown()
+
+        children = []
+        for _ in range(processes):
+            pid = os.fork()
+            if pid == 0:
+                os.close(parent_alive_writer)
+                try:
+                    httpd = make_server(reuse_port=True)
+                    threading.Thread(target=watch_parent, args=(httpd,), daemon=True).start()
+                    httpd.serve_forever()
+                except KeyboardInterrupt:
+                    pass
+                except Exception as e:
+                    print(f"An error occurred: {e} / Hata oluştu: {e}")
+                finally:
+                    os._exit(0)
+            children.append(pid)
+
+        def stop(signum, frame):
+            sys.exit(0)
+
+        previous_handler = signal.signal(signal.SIGTERM, stop)
+        try:
+            while children:
+                os.waitpid(children[0], 0)
+                children.pop(0)
+        finally:
+            signal.signal(signal.SIGTERM, previous_handler)
+            os.close(parent_alive_writer)
+            os.close(parent_alive)
+            for pid in children:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except ProcessLookupError:
+                    pass
+            for pid in children:
+                try:
+                    os.waitpid(pid, 0)
+                except ChildProcessError:
+                    pass  # Already reaped / Zaten toplandı
+
+    def send_request(self, url, method='GET', headers=None, data=None, destination=None, buffer_size=65536, resume=False, progress_callback=None, checksum=None, verify_ssl=True):
+        """
+        Send an HTTP request to the given URL with the specified method, headers, and data, using the default User-Agent if not provided in headers. If destination is provided, stream the file to the destination path in fixed-size chunks so memory use stays flat.
+
+        Belirtilen URL'ye belirtilen yöntem, başlıklar ve verilerle bir HTTP isteği gönderir. Başlıklarda belirtilmemişse varsayılan Kullanıcı Aracısı'nı kullanır. Hedef belirtilmişse, bellek kullanımı sabit kalsın diye dosyayı sabit boyutlu parçalar halinde hedef yola akıtır.
 
         Parameters:
         url (str): The request URL.
@@ -365,6 +1025,11 @@ class CemirUtilsHTTP:
         headers (dict): The request headers.
         data (bytes): The request data.
         destination (str): Path to save the response content.
+        buffer_size (int): Size of the reusable download buffer in bytes. Default is 65536. / Yeniden kullanılan indirme tamponunun bayt boyutu.
+        resume (bool): Continue a partial destination file with a Range request. / Yarım kalmış hedef dosyayı Range isteğiyle sürdür.
+        progress_callback (callable): Called as progress_callback(bytes_done, total_bytes or None) after each chunk. / Her parçadan sonra progress_callback(inen_bayt, toplam_bayt veya None) olarak çağrılır.
+        checksum (str): hashlib algorithm name (e.g. 'sha256') computed incrementally over the file. / Dosya üzerinde artımlı hesaplanan hashlib algoritma adı (ör. 'sha256').
+        verify_ssl (bool): SSL verification control. / SSL doğrulama kontrolü.
 
         Returns:
         str: The response details in JSON format or an error message.
@@ -372,24 +1037,175 @@ class CemirUtilsHTTP:
 
         if headers is None or "User-Agent" not in headers:
             headers = self.default_headers.copy()
+        context = None if verify_ssl else ssl._create_unverified_context()
         try:
-            req = request.Request(url, headers=headers or self.default_headers, method=method, data=data)
-            with request.urlopen(req) as response:
-                content = response.read()
+            if not destination:
+                req = request.Request(url, headers=headers or self.default_headers, method=method, data=data)
+                with request.urlopen(req, context=context) as response:
+                    response.read()
+                    result = {
+                        "url": url,
+                        "method": method,
+                        "headers": dict(response.headers),
+                        "content": "Binary data (PDF, image, etc.)"
+                    }
+                    return json.dumps(result, indent=4)
+
+            offset = os.path.getsize(destination) if resume and os.path.isfile(destination) else 0
+            if offset:
+                headers = {**headers, "Range": f"bytes={offset}-"}
+
+            req = request.Request(url, headers=headers, method=method, data=data)
+            complete = False
+            try:
+                response = request.urlopen(req, context=context)
+            except HTTPError as e:
+                if e.code != 416 or not offset:
+                    raise
+                response, complete = e, True  # Range not satisfiable: the file is already complete / Dosya zaten tamamlanmış
+
+            with response:
+                if not complete and response.status != 206:
+                    offset = 0  # Server ignored the Range header, start over / Sunucu Range başlığını yok saydı, baştan başla
+
+                hasher = hashlib.new(checksum) if checksum else None
+                buffer = bytearray(buffer_size)
+                view = memoryview(buffer)
+
+                if hasher and offset:
+                    with open(destination, 'rb') as f:
+                        while True:
+                            n = f.readinto(buffer)
+                            if not n:
+                                break
+                            hasher.update(view[:n])
+
+                length = response.headers.get("Content-Length")
+                total = offset if complete else offset + int(length) if length is not None else None
+                done = offset
+
+                with open(destination, 'ab' if offset else 'wb') as f:
+                    if not complete:
+                        while True:
+                            n = response.readinto(buffer)
+                            if not n:
+                                break
+                            chunk = view[:n]
+                            f.write(chunk)
+                            if hasher:
+                                hasher.update(chunk)
+                            done += n
+                            if progress_callback:
+                                progress_callback(done, total)
+
                 result = {
                     "url": url,
                     "method": method,
                     "headers": dict(response.headers),
-                    "content": "Binary data (PDF, image, etc.)"
+                    "content": "Binary data (PDF, image, etc.)",
+                    "saved_to": destination,
+                    "bytes_written": done - offset,
+                    "resumed_from": offset
                 }
-                if destination:
-                    with open(destination, 'wb') as f:
-                        f.write(content)
-                    result["saved_to"] = destination
+                if hasher:
+                    result["checksum"] = {"algorithm": checksum, "hexdigest": hasher.hexdigest()}
                 return json.dumps(result, indent=4)
         except Exception as e:
             return f"Failed to send request to {url}, error: {str(e)}"
 
+    def download(self, url, destination, workers=4, part_size=8 * 1024 * 1024, headers=None, verify_ssl=True, progress_callback=None):
+        """
+        Downloads a file in parallel byte ranges over pooled connections, writing each part straight into a preallocated file with os.pwrite. Falls back to a single send_request stream when the server does not advertise Accept-Ranges or the platform has no os.pwrite.
+
+        Bir dosyayı havuzlanmış bağlantılar üzerinden paralel bayt aralıkları halinde indirir ve her parçayı os.pwrite ile önceden ayrılmış dosyaya doğrudan yazar. Sunucu Accept-Ranges bildirmiyorsa veya platformda os.pwrite yoksa tek akışlı send_request'e döner.
+
+        Parameters:
+        url (str): The file URL. / Dosya URL'si.
+        destination (str): Path to save the file. / Dosyanın kaydedileceği yol.
+        workers (int): Number of parallel connections. Default is 4. / Paralel bağlantı sayısı.
+        part_size (int): Size of each byte range. Default is 8 MiB. / Her bayt aralığının boyutu.
+        headers (dict): Request headers. / İstek başlıkları.
+        verify_ssl (bool): SSL verification control. / SSL doğrulama kontrolü.
+        progress_callback (callable): Called as progress_callback(bytes_done, total_bytes) as parts arrive. / Parçalar geldikçe progress_callback(inen_bayt, toplam_bayt) olarak çağrılır.
+
+        Returns:
+        str: The download details in JSON format or an error message.
+        """
+        try:
+            with CemirUtilsHTTPSession(max_pool_size=workers, verify_ssl=verify_ssl) as session:
+                status, response_headers, _ = session.request('HEAD', url, headers=headers)
+                length = response_headers.get('Content-Length')
+                ranged = status == 200 and length is not None and 'bytes' in (response_headers.get('Accept-Ranges') or '').lower()
+
+                if not ranged or not hasattr(os, 'pwrite'):
+                    return self.send_request(url, headers=headers, destination=destination, progress_callback=progress_callback, verify_ssl=verify_ssl)
+
+                size = int(length)
+                with open(destination, 'wb') as f:
+                    if size and hasattr(os, 'posix_fallocate'):
+                        os.posix_fallocate(f.fileno(), 0, size)
+                    else:
+                        f.truncate(size)
+
+                done = 0
+                lock = threading.Lock()
+                fd = os.open(destination, os.O_WRONLY)
+
+                def fetch_part(start, end):
+                    nonlocal done
+                    position = start
+
+                    def write(chunk):
+                        nonlocal position, done
+                        length = len(chunk)
+                        while chunk:
+                            n = os.pwrite(fd, chunk, position)
+                            position += n
+                            chunk = chunk[n:]
+                        if progress_callback:
+                            with lock:
+                                done += length
+                                progress_callback(done, size)
+
+                    part_status, _, received = session.request_into('GET', url, write, headers={**(headers or {}), 'Range': f'bytes={start}-{end}'})
+                    if part_status != 206 or received != end - start + 1:
+                        raise IOError(f"Range {start}-{end} failed with status {part_status} / {start}-{end} aralığı {part_status} durumu ile başarısız")
+
+                ranges = [(start, min(start + part_size, size) - 1) for start in range(0, size, part_size)]
+                executor = ThreadPoolExecutor(max_workers=workers)
+                pending = set()
+                try:
+                    # Keep about workers parts in flight instead of queueing every range up front / Tüm aralıkları baştan kuyruğa koymak yerine yaklaşık workers kadar parçayı yolda tut
+                    for start, end in ranges:
+                        if len(pending) >= workers:
+                            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                            for future in done:
+                                future.result()
+                        pending.add(executor.submit(fetch_part, start, end))
+                    for future in pending:
+                        future.result()
+                except BaseException:
+                    executor.shutdown(cancel_futures=True)  # Skip the parts not started yet / Henüz başlamamış parçaları atla
+                    os.close(fd)
+                    os.remove(destination)  # A preallocated, partly zero file would look complete by its size / Önceden ayrılmış, kısmen sıfır dosya boyutuna göre tamamlanmış görünürdü
+                    raise
+                executor.shutdown()
+                os.close(fd)
+
+                result = {
+                    "url": url,
+                    "method": "GET",
+                    "headers": dict(response_headers),
+                    "content": "Binary data (PDF, image, etc.)",
+                    "saved_to": destination,
+                    "bytes_written": size,
+                    "parts": len(ranges),
+                    "workers": workers
+                }
+                return json.dumps(result, indent=4)
+        except Exception as e:
+            return f"Failed to download {url}, error: {str(e)}"
+
     def get(self, url, params=None, headers=None, verify_ssl=True):
         """
         Sends a GET request.
@@ -537,531 +1353,1121 @@ class CemirUtilsHTTP:
             return content
 
 
-class CemirUtilsLoopTimer:
+class CemirUtilsHTTPSession:
     """
-    CemirUtilsLoopTimer is a utility class for measuring and reporting the execution time
-    of loops within a function.
+    HTTP client that keeps per-host pools of keep-alive http.client connections, so repeated calls skip the TCP and TLS handshake. Exposes the same get/post/put/delete/patch API as CemirUtilsHTTP; like it, they raise urllib.error.HTTPError for 4xx/5xx responses. The lower-level request() and request_into() return every status unchanged.
 
-    CemirUtilsLoopTimer, bir işlev içindeki döngülerin yürütme süresini ölçmek ve raporlamak
-    için kullanılan bir yardımcı sınıftır.
+    Tekrarlanan çağrıların TCP ve TLS el sıkışmasını atlaması için sunucu başına keep-alive http.client bağlantı havuzları tutan HTTP istemcisi. CemirUtilsHTTP ile aynı get/post/put/delete/patch arayüzünü sunar; onun gibi 4xx/5xx yanıtlarında urllib.error.HTTPError fırlatırlar. Alt düzey request() ve request_into() her durum kodunu olduğu gibi döndürür.
     """
 
-    def __init__(self):
+    RETRYABLE_ERRORS = (http.client.RemoteDisconnected, http.client.BadStatusLine, ConnectionResetError, BrokenPipeError)
+
+    def __init__(self, max_pool_size=10, idle_timeout=60, timeout=10, verify_ssl=True):
         """
-        Initializes a new instance of CemirUtilsLoopTimer, setting up an empty list to store
-        loop execution times.
+        Args:
+            max_pool_size (int): Idle connections kept per host. / Sunucu başına tutulan boşta bağlantı sayısı.
+            idle_timeout (float): Seconds after which an idle connection is evicted. / Boşta bağlantının çıkarılacağı saniye.
+            timeout (float): Socket timeout per request. / İstek başına soket zaman aşımı.
+            verify_ssl (bool): Default SSL verification control. / Varsayılan SSL doğrulama kontrolü.
+        """
+        self.default_headers = {"User-Agent": "CemirUtils"}
+        self.max_pool_size = max_pool_size
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.verify_ssl = verify_ssl
+        self.ssl_context = ssl.create_default_context()
+        self.unverified_ssl_context = ssl._create_unverified_context()
+        self._pools = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _acquire(self, scheme, host, port, verify_ssl):
+        key = (scheme, host, port, verify_ssl)
+        now = time.monotonic()
+        with self._lock:
+            pool = self._pools.get(key, [])
+            while pool:
+                conn, last_used = pool.pop()
+                if now - last_used < self.idle_timeout:
+                    return key, conn, True
+                conn.close()
+
+        if scheme == "https":
+            context = self.ssl_context if verify_ssl else self.unverified_ssl_context
+            conn = http.client.HTTPSConnection(host, port, timeout=self.timeout, context=context)
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=self.timeout)
+        return key, conn, False
 
-        CemirUtilsLoopTimer'ın yeni bir örneğini başlatır ve döngü yürütme sürelerini depolamak
-        için boş bir liste oluşturur.
+    def _release(self, key, conn):
+        with self._lock:
+            pool = self._pools.setdefault(key, [])
+            if len(pool) < self.max_pool_size:
+                pool.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    def evict_idle(self):
         """
-        self.loop_times = []
+        Closes pooled connections that have been idle longer than idle_timeout.
 
-    class LoopTimerContext:
+        idle_timeout süresinden uzun süredir boşta olan havuz bağlantılarını kapatır.
         """
-        Context manager class for timing individual loops.
+        now = time.monotonic()
+        with self._lock:
+            for key, pool in self._pools.items():
+                fresh = []
+                for conn, last_used in pool:
+                    if now - last_used < self.idle_timeout:
+                        fresh.append((conn, last_used))
+                    else:
+                        conn.close()
+                self._pools[key] = fresh
 
-        Bireysel döngüleri zamanlamak için bağlam yöneticisi sınıfı.
+    def close(self):
         """
+        Closes every pooled connection.
 
-        def __init__(self, timer):
-            """
-            Initializes the LoopTimerContext with a reference to the parent timer.
+        Havuzdaki tüm bağlantıları kapatır.
+        """
+        with self._lock:
+            pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            for conn, _ in pool:
+                conn.close()
 
-            LoopTimerContext'i üst zamanlayıcıya bir referans ile başlatır.
+    def pool_info(self):
+        """
+        Returns the number of idle pooled connections per host.
 
-            Args:
-                timer (CemirUtilsLoopTimer): The parent timer instance.
-            """
-            self.timer = timer
+        Sunucu başına havuzdaki boşta bağlantı sayısını döndürür.
+        """
+        with self._lock:
+            return {f"{scheme}://{host}:{port}": len(pool) for (scheme, host, port, _), pool in self._pools.items()}
 
-        def __enter__(self):
-            """
-            Starts timing when entering the context.
+    def request(self, method, url, body=None, headers=None, verify_ssl=None):
+        """
+        Sends a request over a pooled connection and reads the whole response.
 
-            Bağlama girildiğinde zamanlamayı başlatır.
+        Havuzdaki bir bağlantı üzerinden istek gönderir ve yanıtın tamamını okur.
 
-            Returns:
-                self
-            """
-            self.start = time.time()
-            return self
+        Parameters:
+        method (str): The HTTP method. / HTTP yöntemi.
+        url (str): The request URL. / İstek URL'si.
+        body (bytes): The request body. / İstek gövdesi.
+        headers (dict): Request headers. / İstek başlıkları.
+        verify_ssl (bool): SSL verification control, defaults to the session setting. / SSL doğrulama kontrolü, varsayılan oturum ayarı.
 
-        def __exit__(self, *args):
-            """
-            Stops timing and records the elapsed time when exiting the context.
+        Returns:
+        tuple: (status, headers, body bytes)
+        """
+        key, conn, response = self._open(method, url, body, headers, verify_ssl)
+        try:
+            content = response.read()
+        except Exception:
+            conn.close()
+            raise
 
-            Bağlamdan çıkarken zamanlamayı durdurur ve geçen süreyi kaydeder.
-            """
-            self.timer.loop_times.append(time.time() - self.start)
+        self._finish(key, conn, response)
+        return response.status, response.headers, content
 
-    def check_loop(self):
+    def request_into(self, method, url, write, body=None, headers=None, verify_ssl=None, buffer_size=65536):
         """
-        Returns a LoopTimerContext instance for timing a loop.
+        Sends a request over a pooled connection and streams the response body to write() through one reusable buffer.
 
-        Bir döngüyü zamanlamak için bir LoopTimerContext örneği döndürür.
+        Havuzdaki bir bağlantı üzerinden istek gönderir ve yanıt gövdesini yeniden kullanılan tek bir tampon üzerinden write() fonksiyonuna akıtır.
+
+        Parameters:
+        method (str): The HTTP method. / HTTP yöntemi.
+        url (str): The request URL. / İstek URL'si.
+        write (callable): Called with a memoryview for every chunk; the view is reused, so copy it if you keep it. / Her parça için bir memoryview ile çağrılır; görünüm yeniden kullanılır, saklanacaksa kopyalanmalıdır.
+        body (bytes): The request body. / İstek gövdesi.
+        headers (dict): Request headers. / İstek başlıkları.
+        verify_ssl (bool): SSL verification control, defaults to the session setting. / SSL doğrulama kontrolü, varsayılan oturum ayarı.
+        buffer_size (int): Size of the read buffer in bytes. / Okuma tamponunun bayt boyutu.
 
         Returns:
-            LoopTimerContext
+        tuple: (status, headers, number of body bytes)
         """
-        return self.LoopTimerContext(self)
+        key, conn, response = self._open(method, url, body, headers, verify_ssl)
+        buffer = bytearray(buffer_size)
+        view = memoryview(buffer)
+        total = 0
+        try:
+            while True:
+                n = response.readinto(buffer)
+                if not n:
+                    break
+                write(view[:n])
+                total += n
+        except Exception:
+            conn.close()
+            raise
 
-    def extract_loops(self, code):
+        self._finish(key, conn, response)
+        return response.status, response.headers, total
+
+    def _open(self, method, url, body, headers, verify_ssl):
+        if headers is None or "User-Agent" not in headers:
+            headers = {**self.default_headers, **(headers or {})}
+        if verify_ssl is None:
+            verify_ssl = self.verify_ssl
+
+        parsed_url = urlparse(url)
+        port = parsed_url.port or (443 if parsed_url.scheme == "https" else 80)
+        path = parsed_url.path or "/"
+        if parsed_url.query:
+            path += "?" + parsed_url.query
+
+        while True:
+            key, conn, reused = self._acquire(parsed_url.scheme, parsed_url.hostname, port, verify_ssl)
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                return key, conn, conn.getresponse()
+            except self.RETRYABLE_ERRORS:
+                conn.close()
+                if reused:
+                    continue  # The server dropped an idle keep-alive connection, retry on a fresh one / Sunucu boştaki bağlantıyı kapattı, yenisiyle tekrar dene
+                raise
+            except Exception:
+                conn.close()
+                raise
+
+    def _finish(self, key, conn, response):
+        if response.will_close:
+            conn.close()
+        else:
+            self._release(key, conn)
+
+    def _send(self, method, url, data=None, headers=None, verify_ssl=None):
+        if data:
+            data = urlencode(data).encode('utf-8')
+            if not any(name.lower() == 'content-type' for name in headers or ()):
+                headers = {**(headers or {}), 'Content-Type': 'application/x-www-form-urlencoded'}
+
+        status, response_headers, content = self.request(method, url, body=data, headers=headers, verify_ssl=verify_ssl)
+        if status >= 400:
+            raise HTTPError(url, status, http.client.responses.get(status, ""), response_headers, io.BytesIO(content))
+        content = content.decode('utf-8')
+
+        if 'application/json' in (response_headers.get('Content-Type') or ''):
+            return json.loads(content)
+        else:
+            return content
+
+    def get(self, url, params=None, headers=None, verify_ssl=None):
         """
-        Extracts loop nodes from the given code.
+        Sends a GET request over a pooled connection.
 
-        Verilen koddaki döngü düğümlerini çıkarır.
+        Havuzdaki bir bağlantı üzerinden GET isteği gönderir.
 
-        Args:
-            code (str): The source code to analyze.
+        Parameters:
+        url (str): The request URL.
+        params (dict): URL parameters.
+        headers (dict): Request headers.
+        verify_ssl (bool): SSL verification control.
 
         Returns:
-            list: A list of tuples containing loop nodes and their types.
+        dict, str: JSON response or plain text.
         """
-        return [(node, type(node).__name__) for node in ast.walk(ast.parse(code)) if isinstance(node, (ast.For, ast.While))]
+        if params:
+            url += '?' + urlencode(params)
+        return self._send('GET', url, headers=headers, verify_ssl=verify_ssl)
 
-    def loop_timer_decorator(self, func):
+    def post(self, url, data=None, headers=None, verify_ssl=None):
         """
-        Decorator to measure and print the execution time of loops within a function.
+        Sends a POST request over a pooled connection.
 
-        Bir işlev içindeki döngülerin yürütme süresini ölçmek ve yazdırmak için dekoratör.
+        Havuzdaki bir bağlantı üzerinden POST isteği gönderir.
 
-        Args:
-            func (function): The function to decorate.
+        Parameters:
+        url (str): The request URL.
+        data (dict): Data to be sent.
+        headers (dict): Request headers.
+        verify_ssl (bool): SSL verification control.
 
         Returns:
-            function: The wrapped function with timing logic.
+        dict, str: JSON response or plain text.
         """
+        return self._send('POST', url, data=data, headers=headers, verify_ssl=verify_ssl)
 
-        def wrapper(*args, **kwargs):
-            start_func_time = time.time()
-            func_code = inspect.getsource(func)
-            loop_nodes = self.extract_loops(func_code)
-            result = func(*args, **kwargs)
-            end_func_time = time.time()
+    def put(self, url, data=None, headers=None, verify_ssl=None):
+        """
+        Sends a PUT request over a pooled connection.
 
-            cprint("------------------")
-            for i, (node, node_type) in enumerate(loop_nodes):
-                cprint(f"Loop {i + 1} ({node_type} at line {node.lineno}): {self.loop_times[i]:.2f} seconds")
-            cprint(f"Total execution time of '{func.__name__}': {end_func_time - start_func_time:.2f} seconds")
-            cprint("------------------")
+        Havuzdaki bir bağlantı üzerinden PUT isteği gönderir.
 
-            self.loop_times.clear()
-            return result
+        Parameters:
+        url (str): The request URL.
+        data (dict): Data to be sent.
+        headers (dict): Request headers.
+        verify_ssl (bool): SSL verification control.
 
-        return wrapper
+        Returns:
+        dict, str: JSON response or plain text.
+        """
+        return self._send('PUT', url, data=data, headers=headers, verify_ssl=verify_ssl)
 
-    def loop(self, func):
+    def delete(self, url, headers=None, verify_ssl=None):
         """
-        Decorates a function to time its loops and print their execution times.
+        Sends a DELETE request over a pooled connection.
 
-        Bir işlevi zamanlamak ve döngü yürütme sürelerini yazdırmak için süsler.
+        Havuzdaki bir bağlantı üzerinden DELETE isteği gönderir.
 
-        Args:
-            func (function): The function to decorate.
+        Parameters:
+        url (str): The request URL.
+        headers (dict): Request headers.
+        verify_ssl (bool): SSL verification control.
 
         Returns:
-            function: The decorated function.
+        dict, str: JSON response or plain text.
         """
-        return self.loop_timer_decorator(func)
+        return self._send('DELETE', url, headers=headers, verify_ssl=verify_ssl)
 
+    def patch(self, url, data=None, headers=None, verify_ssl=None):
+        """
+        Sends a PATCH request over a pooled connection.
 
-class CemirUtilsDecorators:
-    def __init__(self):
-        pass
+        Havuzdaki bir bağlantı üzerinden PATCH isteği gönderir.
 
-    @staticmethod
-    def webhook_request(url, headers=None):
+        Parameters:
+        url (str): The request URL.
+        data (dict): Data to be sent.
+        headers (dict): Request headers.
+        verify_ssl (bool): SSL verification control.
+
+        Returns:
+        dict, str: JSON response or plain text.
         """
-        Creates a decorator to send the result of a function to a specified webhook URL via a POST request.
+        return self._send('PATCH', url, data=data, headers=headers, verify_ssl=verify_ssl)
 
-        :param url: The URL of the webhook.
-        :param headers: Optional headers to include in the request.
-        :return: A decorator that sends the function result as a JSON payload to the specified URL.
 
-        Belirtilen webhook URL'sine POST isteğiyle bir işlevin sonucunu göndermek için bir dekoratör oluşturur.
+class CemirUtilsHTTPAsync:
+    """
+    asyncio HTTP/1.1 client built on asyncio.open_connection with the same get/post/put/delete/patch API as CemirUtilsHTTP; like it, they raise urllib.error.HTTPError for 4xx/5xx responses, while the lower-level request() returns every status unchanged. A semaphore bounds the number of requests in flight and idle keep-alive connections are reused per host.
 
-        :param url: Webhook'un URL'si.
-        :param headers: İsteğe dahil edilecek isteğe bağlı başlıklar.
-        :return: İşlev sonucunu JSON yükü olarak belirtilen URL'ye gönderen bir dekoratör.
-        """
+    asyncio.open_connection üzerine kurulu, CemirUtilsHTTP ile aynı get/post/put/delete/patch arayüzüne sahip asyncio HTTP/1.1 istemcisi; onun gibi 4xx/5xx yanıtlarında urllib.error.HTTPError fırlatırlar, alt düzey request() ise her durum kodunu olduğu gibi döndürür. Bir semafor eşzamanlı istek sayısını sınırlar, boştaki keep-alive bağlantılar sunucu başına yeniden kullanılır.
+    """
 
-        def decorator(func):
-            @functools.wraps(func)
-            def wrapper(*args, **kwargs):
-                parsed_url = urlparse(url)
-                conn = HTTPSConnection(parsed_url.netloc)
-                default_headers = {'Content-type': 'application/json'}
-                if headers:
-                    default_headers.update(headers)
-                payload = json.dumps(func(*args, **kwargs))
-                conn.request('POST', parsed_url.path, body=payload, headers=default_headers)
-                response = conn.getresponse()
-                response_data = response.read().decode()
-                return json.loads(response_data)
+    RETRYABLE_ERRORS = (ConnectionResetError, BrokenPipeError, asyncio.IncompleteReadError)
 
-            return wrapper
+    def __init__(self, concurrency=100, timeout=10, verify_ssl=True, max_pool_size=10):
+        """
+        Args:
+            concurrency (int): Maximum requests in flight. / Aynı anda en fazla istek sayısı.
+            timeout (float): Per-request timeout in seconds. / İstek başına zaman aşımı (saniye).
+            verify_ssl (bool): Default SSL verification control. / Varsayılan SSL doğrulama kontrolü.
+            max_pool_size (int): Idle connections kept per host. / Sunucu başına tutulan boşta bağlantı sayısı.
+        """
+        self.default_headers = {"User-Agent": "CemirUtils"}
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.verify_ssl = verify_ssl
+        self.max_pool_size = max_pool_size
+        self.ssl_context = ssl.create_default_context()
+        self.unverified_ssl_context = ssl._create_unverified_context()
+        self._semaphore = None
+        self._pools = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """
+        Closes every pooled connection.
+
+        Havuzdaki tüm bağlantıları kapatır.
+        """
+        pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            for _, writer in pool:
+                writer.close()
+
+    async def _acquire(self, scheme, host, port, verify_ssl):
+        key = (scheme, host, port, verify_ssl)
+        pool = self._pools.get(key, [])
+        while pool:
+            reader, writer = pool.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return key, reader, writer, True
+            writer.close()
+
+        context = None
+        if scheme == "https":
+            context = self.ssl_context if verify_ssl else self.unverified_ssl_context
+        reader, writer = await asyncio.open_connection(host, port, ssl=context)
+        return key, reader, writer, False
+
+    def _release(self, key, reader, writer):
+        pool = self._pools.setdefault(key, [])
+        if len(pool) < self.max_pool_size:
+            pool.append((reader, writer))
+        else:
+            writer.close()
 
-        return decorator
+    @staticmethod
+    async def _read_head(reader):
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Connection closed before the response / Bağlantı yanıttan önce kapandı")
+        version, status = status_line.split(None, 2)[:2]
+
+        lines = []
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            lines.append(line)
+        return version, int(status), http.client.parse_headers(io.BytesIO(b"".join(lines) + b"\r\n"))
 
     @staticmethod
-    def timeit(func):
-        """
-        Creates a decorator to measure the execution time of a function.
+    async def _read_body(reader, method, status, response_headers):
+        if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+            return b"", True
+
+        if "chunked" in (response_headers.get("Transfer-Encoding") or "").lower():
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass  # Skip trailers / Ek başlıkları atla
+                    return b"".join(chunks), True
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+
+        length = response_headers.get("Content-Length")
+        if length is not None:
+            return await reader.readexactly(int(length)), True
+
+        return await reader.read(), False
+
+    async def _exchange(self, method, url, body, headers, verify_ssl):
+        parsed_url = urlparse(url)
+        port = parsed_url.port or (443 if parsed_url.scheme == "https" else 80)
+        path = parsed_url.path or "/"
+        if parsed_url.query:
+            path += "?" + parsed_url.query
+
+        request_headers = {"Host": parsed_url.netloc, **self.default_headers, **(headers or {})}
+        if body is not None or method in ("POST", "PUT", "PATCH"):
+            request_headers["Content-Length"] = str(len(body or b""))  # Strict servers answer 411 without it / Katı sunucular bu olmadan 411 döndürür
+        head = f"{method} {path} HTTP/1.1\r\n" + "".join(f"{k}: {v}\r\n" for k, v in request_headers.items()) + "\r\n"
+        payload = head.encode("latin-1") + (body or b"")
+
+        while True:
+            key, reader, writer, reused = await self._acquire(parsed_url.scheme, parsed_url.hostname, port, verify_ssl)
+            try:
+                writer.write(payload)
+                await writer.drain()
+                version, status, response_headers = await self._read_head(reader)
+            except self.RETRYABLE_ERRORS:
+                writer.close()
+                if reused:
+                    continue  # The server dropped an idle keep-alive connection, retry on a fresh one / Sunucu boştaki bağlantıyı kapattı, yenisiyle tekrar dene
+                raise
+            except BaseException:
+                writer.close()
+                raise
 
-        :param func: The function to be decorated.
-        :return: The decorated function with execution time measurement.
+            try:
+                content, keep_alive = await self._read_body(reader, method, status, response_headers)
+            except BaseException:
+                writer.close()
+                raise
 
-        Bir işlevin yürütme süresini ölçmek için bir dekoratör oluşturur.
+            if keep_alive and version == b"HTTP/1.1" and (response_headers.get("Connection") or "").lower() != "close":
+                self._release(key, reader, writer)
+            else:
+                writer.close()
+            return status, response_headers, content
 
-        :param func: Dekore edilecek işlev.
-        :return: Yürütme süresi ölçümü ile dekore edilmiş işlev.
+    async def request(self, method, url, body=None, headers=None, timeout=None, verify_ssl=None):
         """
+        Sends a request, waiting for a concurrency slot first, and reads the whole response.
 
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            start_time = time.time()
-            result = func(*args, **kwargs)
-            end_time = time.time()
-            elapsed_time = end_time - start_time
-            print(f"Function '{func.__name__}' took {elapsed_time:.4f} seconds")
-            return result
+        Önce eşzamanlılık yuvası bekleyerek bir istek gönderir ve yanıtın tamamını okur.
 
-        return wrapper
+        Parameters:
+        method (str): The HTTP method. / HTTP yöntemi.
+        url (str): The request URL. / İstek URL'si.
+        body (bytes): The request body. / İstek gövdesi.
+        headers (dict): Request headers. / İstek başlıkları.
+        timeout (float): Timeout for this request, defaults to the client setting. / Bu istek için zaman aşımı, varsayılan istemci ayarı.
+        verify_ssl (bool): SSL verification control, defaults to the client setting. / SSL doğrulama kontrolü, varsayılan istemci ayarı.
 
-    @staticmethod
-    def log(func):
+        Returns:
+        tuple: (status, headers, body bytes)
         """
-        Creates a decorator to log the function call and its return value.
-
-        :param func: The function to be decorated.
-        :return: The decorated function with logging.
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        if verify_ssl is None:
+            verify_ssl = self.verify_ssl
 
-        İşlev çağrısını ve dönüş değerini kaydetmek için bir dekoratör oluşturur.
+        async with self._semaphore:
+            return await asyncio.wait_for(self._exchange(method, url, body, headers, verify_ssl), timeout or self.timeout)
 
-        :param func: Dekore edilecek işlev.
-        :return: Kayıt ile dekore edilmiş işlev.
-        """
+    async def _send(self, method, url, data=None, headers=None, timeout=None, verify_ssl=None):
+        if data:
+            data = urlencode(data).encode('utf-8')
+            if not any(name.lower() == 'content-type' for name in headers or ()):
+                headers = {**(headers or {}), 'Content-Type': 'application/x-www-form-urlencoded'}
 
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            print(f"Calling function '{func.__name__}' with arguments {args} and keyword arguments {kwargs}")
-            result = func(*args, **kwargs)
-            print(f"Function '{func.__name__}' returned {result}")
-            return result
+        status, response_headers, content = await self.request(method, url, body=data, headers=headers, timeout=timeout, verify_ssl=verify_ssl)
+        if status >= 400:
+            raise HTTPError(url, status, http.client.responses.get(status, ""), response_headers, io.BytesIO(content))
+        content = content.decode('utf-8')
 
-        return wrapper
+        if 'application/json' in (response_headers.get('Content-Type') or ''):
+            return json.loads(content)
+        else:
+            return content
 
-    @staticmethod
-    def retry(retries=3, delay=1):
+    async def get(self, url, params=None, headers=None, timeout=None, verify_ssl=None):
         """
-        Creates a decorator to retry a function if it raises an exception.
+        Sends a GET request.
 
-        :param retries: The number of retries.
-        :param delay: The delay between retries in seconds.
-        :return: The decorated function with retry logic.
+        Bir GET isteği gönderir.
 
-        Bir işlevin bir istisna yükseltmesi durumunda yeniden denemek için bir dekoratör oluşturur.
+        Parameters:
+        url (str): The request URL.
+        params (dict): URL parameters.
+        headers (dict): Request headers.
+        timeout (float): Per-request timeout.
+        verify_ssl (bool): SSL verification control.
 
-        :param retries: Yeniden deneme sayısı.
-        :param delay: Yeniden denemeler arasındaki gecikme süresi (saniye cinsinden).
-        :return: Yeniden deneme mantığı ile dekore edilmiş işlev.
+        Returns:
+        dict, str: JSON response or plain text.
         """
+        if params:
+            url += '?' + urlencode(params)
+        return await self._send('GET', url, headers=headers, timeout=timeout, verify_ssl=verify_ssl)
 
-        def decorator(func):
-            @wraps(func)
-            def wrapper(*args, **kwargs):
-                for attempt in range(1, retries + 1):
-                    try:
-                        return func(*args, **kwargs)
-                    except Exception as e:
-                        print(f"Attempt {attempt} failed: {e}")
-                        if attempt < retries:
-                            time.sleep(delay)
-                print(f"Function '{func.__name__}' failed after {retries} attempts")
+    async def post(self, url, data=None, headers=None, timeout=None, verify_ssl=None):
+        """
+        Sends a POST request.
 
-            return wrapper
+        Bir POST isteği gönderir.
 
-        return decorator
+        Parameters:
+        url (str): The request URL.
+        data (dict): Data to be sent.
+        headers (dict): Request headers.
+        timeout (float): Per-request timeout.
+        verify_ssl (bool): SSL verification control.
 
-    @staticmethod
-    def cache(func):
+        Returns:
+        dict, str: JSON response or plain text.
         """
-        Creates a decorator to cache the result of a function call.
-
-        :param func: The function to be decorated.
-        :return: The decorated function with caching.
+        return await self._send('POST', url, data=data, headers=headers, timeout=timeout, verify_ssl=verify_ssl)
 
-        Bir işlev çağrısının sonucunu önbelleğe almak için bir dekoratör oluşturur.
-
-        :param func: Dekore edilecek işlev.
-        :return: Önbellekleme ile dekore edilmiş işlev.
+    async def put(self, url, data=None, headers=None, timeout=None, verify_ssl=None):
         """
-        cache_data = {}
+        Sends a PUT request.
 
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            key = (args, frozenset(kwargs.items()))
-            if key in cache_data:
-                print(f"Returning cached result for {func.__name__} with args {args} and kwargs {kwargs}")
-                return cache_data[key]
-            result = func(*args, **kwargs)
-            cache_data[key] = result
-            return result
+        Bir PUT isteği gönderir.
 
-        return wrapper
+        Parameters:
+        url (str): The request URL.
+        data (dict): Data to be sent.
+        headers (dict): Request headers.
+        timeout (float): Per-request timeout.
+        verify_ssl (bool): SSL verification control.
 
-    @staticmethod
-    def deprecate(message):
+        Returns:
+        dict, str: JSON response or plain text.
         """
-        Creates a decorator to mark a function as deprecated.
-
-        :param message: The deprecation message.
-        :return: The decorated function with a deprecation warning.
-
-        Bir işlevi kullanımdan kaldırılmış olarak işaretlemek için bir dekoratör oluşturur.
+        return await self._send('PUT', url, data=data, headers=headers, timeout=timeout, verify_ssl=verify_ssl)
 
-        :param message: Kullanımdan kaldırma mesajı.
-        :return: Kullanımdan kaldırma uyarısı ile dekore edilmiş işlev.
+    async def delete(self, url, headers=None, timeout=None, verify_ssl=None):
         """
+        Sends a DELETE request.
 
-        def decorator(func):
-            @functools.wraps(func)
-            def wrapper(*args, **kwargs):
-                print(f"WARNING: {func.__name__} is deprecated. {message}")
-                return func(*args, **kwargs)
+        Bir DELETE isteği gönderir.
 
-            return wrapper
+        Parameters:
+        url (str): The request URL.
+        headers (dict): Request headers.
+        timeout (float): Per-request timeout.
+        verify_ssl (bool): SSL verification control.
 
-        return decorator
+        Returns:
+        dict, str: JSON response or plain text.
+        """
+        return await self._send('DELETE', url, headers=headers, timeout=timeout, verify_ssl=verify_ssl)
 
-    @staticmethod
-    def debug(func):
+    async def patch(self, url, data=None, headers=None, timeout=None, verify_ssl=None):
         """
-        Creates a decorator to debug a function by printing its arguments and return value.
+        Sends a PATCH request.
 
-        :param func: The function to be decorated.
-        :return: The decorated function with debugging.
+        Bir PATCH isteği gönderir.
 
-        Bir işlevi hata ayıklamak için, işlevin argümanlarını ve dönüş değerini yazdıran bir dekoratör oluşturur.
+        Parameters:
+        url (str): The request URL.
+        data (dict): Data to be sent.
+        headers (dict): Request headers.
+        timeout (float): Per-request timeout.
+        verify_ssl (bool): SSL verification control.
 
-        :param func: Dekore edilecek işlev.
-        :return: Hata ayıklama ile dekore edilmiş işlev.
+        Returns:
+        dict, str: JSON response or plain text.
         """
+        return await self._send('PATCH', url, data=data, headers=headers, timeout=timeout, verify_ssl=verify_ssl)
 
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            print(f"DEBUG: Calling function '{func.__name__}' with arguments {args} and keyword arguments {kwargs}")
-            result = func(*args, **kwargs)
-            print(f"DEBUG: Function '{func.__name__}' returned {result}")
-            return result
+    async def gather_many(self, requests, return_exceptions=False):
+        """
+        Runs many requests concurrently within the concurrency limit and returns their results in order.
 
-        return wrapper
+        Birçok isteği eşzamanlılık sınırı içinde aynı anda çalıştırır ve sonuçları sırayla döndürür.
 
-    @staticmethod
-    def cache_with_expiry(expiry_time):
+        Parameters:
+        requests (iterable): Dicts with "method" (default GET), "url" and optional params/data/headers/timeout/verify_ssl. / "method" (varsayılan GET), "url" ve isteğe bağlı params/data/headers/timeout/verify_ssl içeren sözlükler.
+        return_exceptions (bool): Return exceptions in place of results instead of raising. / Hata fırlatmak yerine hataları sonuç yerine döndür.
+
+        Returns:
+        list: JSON responses or plain texts in request order. / İstek sırasıyla JSON yanıtları veya düz metinler.
         """
-        Creates a decorator to cache the result of a function call with an expiry time.
+        calls = []
+        for req in requests:
+            req = dict(req)
+            method = req.pop("method", "GET").lower()
+            calls.append(getattr(self, method)(**req))
+        return await asyncio.gather(*calls, return_exceptions=return_exceptions)
 
-        :param expiry_time: The time in seconds after which the cache expires.
-        :return: The decorated function with caching and expiry.
 
-        Bir işlev çağrısının sonucunu belirli bir süre sonra sona erecek şekilde önbelleğe almak için bir dekoratör oluşturur.
+class CemirUtilsLoopTimer:
+    """
+    CemirUtilsLoopTimer is a utility class for measuring and reporting the execution time
+    of loops within a function.
 
-        :param expiry_time: Önbelleğin sona erme süresi (saniye cinsinden).
-        :return: Önbellekleme ve sona erme ile dekore edilmiş işlev.
+    CemirUtilsLoopTimer, bir işlev içindeki döngülerin yürütme süresini ölçmek ve raporlamak
+    için kullanılan bir yardımcı sınıftır.
+    """
+
+    def __init__(self):
         """
-        cache_data = {}
+        Initializes a new instance of CemirUtilsLoopTimer, setting up an empty list to store
+        loop execution times.
 
-        def decorator(func):
-            def wrapper(*args, **kwargs):
-                key = (args, frozenset(kwargs.items()))
-                if key in cache_data:
-                    if time.time() - cache_data[key]["timestamp"] < expiry_time:
-                        print(f"Returning cached result for {func.__name__} with args {args} and kwargs {kwargs}")
-                        return cache_data[key]["result"]
-                result = func(*args, **kwargs)
-                cache_data[key] = {"result": result, "timestamp": time.time()}
-                return result
+        CemirUtilsLoopTimer'ın yeni bir örneğini başlatır ve döngü yürütme sürelerini depolamak
+        için boş bir liste oluşturur.
+        """
+        self.loop_times = []
 
-            return wrapper
+    class LoopTimerContext:
+        """
+        Context manager class for timing individual loops.
 
-        return decorator
+        Bireysel döngüleri zamanlamak için bağlam yöneticisi sınıfı.
+        """
 
-    @staticmethod
-    def before_after(func):
+        def __init__(self, timer):
+            """
+            Initializes the LoopTimerContext with a reference to the parent timer.
+
+            LoopTimerContext'i üst zamanlayıcıya bir referans ile başlatır.
+
+            Args:
+                timer (CemirUtilsLoopTimer): The parent timer instance.
+            """
+            self.timer = timer
+
+        def __enter__(self):
+            """
+            Starts timing when entering the context.
+
+            Bağlama girildiğinde zamanlamayı başlatır.
+
+            Returns:
+                self
+            """
+            self.start = time.time()
+            return self
+
+        def __exit__(self, *args):
+            """
+            Stops timing and records the elapsed time when exiting the context.
+
+            Bağlamdan çıkarken zamanlamayı durdurur ve geçen süreyi kaydeder.
+            """
+            self.timer.loop_times.append(time.time() - self.start)
+
+    def check_loop(self):
         """
-        Creates a decorator to execute actions before and after a function call.
+        Returns a LoopTimerContext instance for timing a loop.
 
-        :param func: The function to be decorated.
-        :return: The decorated function with before and after actions.
+        Bir döngüyü zamanlamak için bir LoopTimerContext örneği döndürür.
 
-        Bir işlev çağrısından önce ve sonra eylemler gerçekleştirmek için bir dekoratör oluşturur.
+        Returns:
+            LoopTimerContext
+        """
+        return self.LoopTimerContext(self)
 
-        :param func: Dekore edilecek işlev.
-        :return: Önce ve sonra eylemler ile dekore edilmiş işlev.
+    def extract_loops(self, code):
         """
+        Extracts loop nodes from the given code.
 
-        def wrapper(*args, **kwargs):
-            print("Starting transaction")
-            result = func(*args, **kwargs)
-            print("Committing transaction")
-            return result
+        Verilen koddaki döngü düğümlerini çıkarır.
 
-        return wrapper
+        Args:
+            code (str): The source code to analyze.
 
-    @staticmethod
-    def rate_limit(max_calls, period):
+        Returns:
+            list: A list of tuples containing loop nodes and their types.
         """
-        Creates a decorator to limit the rate of function calls.
+        return [(node, type(node).__name__) for node in ast.walk(ast.parse(code)) if isinstance(node, (ast.For, ast.While))]
 
-        :param max_calls: The maximum number of calls allowed within the period.
-        :param period: The time period in seconds for the rate limit.
-        :return: The decorated function with rate limiting.
+    def loop_timer_decorator(self, func):
+        """
+        Decorator to measure and print the execution time of loops within a function.
 
-        Bir işlev çağrılarının oranını sınırlamak için bir dekoratör oluşturur.
+        Bir işlev içindeki döngülerin yürütme süresini ölçmek ve yazdırmak için dekoratör.
 
-        :param max_calls: Belirli bir zaman dilimi içinde izin verilen maksimum çağrı sayısı.
-        :param period: Oran sınırı için zaman dilimi (saniye cinsinden).
-        :return: Oran sınırlaması ile dekore edilmiş işlev.
+        Args:
+            func (function): The function to decorate.
+
+        Returns:
+            function: The wrapped function with timing logic.
         """
-        call_times = []
 
-        def decorator(func):
-            def wrapper(*args, **kwargs):
-                nonlocal call_times
-                now = time.time()
-                call_times.append(now)
-                call_times = [t for t in call_times if now - t < period]
-                if len(call_times) > max_calls:
-                    raise RuntimeError("Rate limit exceeded")
-                return func(*args, **kwargs)
+        def wrapper(*args, **kwargs):
+            start_func_time = time.time()
+            func_code = inspect.getsource(func)
+            loop_nodes = self.extract_loops(func_code)
+            result = func(*args, **kwargs)
+            end_func_time = time.time()
 
-            return wrapper
+            cprint("------------------")
+            for i, (node, node_type) in enumerate(loop_nodes):
+                cprint(f"Loop {i + 1} ({node_type} at line {node.lineno}): {self.loop_times[i]:.2f} seconds")
+            cprint(f"Total execution time of '{func.__name__}': {end_func_time - start_func_time:.2f} seconds")
+            cprint("------------------")
 
-        return decorator
+            self.loop_times.clear()
+            return result
 
+        return wrapper
 
-class CemirUtilsFunctionNotification:
-    """
-    CemirUtilsFunctionNotification
+    def loop(self, func):
+        """
+        Decorates a function to time its loops and print their execution times.
 
-    This class provides functionality to send email notifications when a function is called.
+        Bir işlevi zamanlamak ve döngü yürütme sürelerini yazdırmak için süsler.
 
-    Attributes:
-        smtp_server (str): The SMTP server address.
-        smtp_port (int): The SMTP server port.
-        smtp_user (str): The SMTP server username.
-        smtp_password (str): The SMTP server password.
-        from_email (str): The email address from which notifications are sent.
+        Args:
+            func (function): The function to decorate.
 
-    Methods:
-        notify(to_email, subject): Decorator to notify when the decorated function is called.
-        send_notification(to_email, subject, func_name, result): Sends an email notification with the function call details.
-    """
+        Returns:
+            function: The decorated function.
+        """
+        return self.loop_timer_decorator(func)
 
-    """
-    CemirUtilsFunctionNotification
 
-    Bu sınıf, bir işlev çağrıldığında e-posta bildirimleri göndermek için işlevsellik sağlar.
+class CemirUtilsDecorators:
+    def __init__(self):
+        pass
 
-    Nitelikler:
-        smtp_server (str): SMTP sunucusunun adresi.
-        smtp_port (int): SMTP sunucusunun portu.
-        smtp_user (str): SMTP sunucusunun kullanıcı adı.
-        smtp_password (str): SMTP sunucusunun şifresi.
-        from_email (str): Bildirimlerin gönderileceği e-posta adresi.
+    @staticmethod
+    def webhook_request(url, headers=None):
+        """
+        Creates a decorator to send the result of a function to a specified webhook URL via a POST request.
 
-    Metotlar:
-        notify(to_email, subject): Dekoratör, süslenen işlev çağrıldığında bildirimde bulunur.
-        send_notification(to_email, subject, func_name, result): İşlev çağrısı detaylarıyla bir e-posta bildirimi gönderir.
-    """
+        :param url: The URL of the webhook.
+        :param headers: Optional headers to include in the request.
+        :return: A decorator that sends the function result as a JSON payload to the specified URL.
 
-    def __init__(self, smtp_server, smtp_port, smtp_user, smtp_password):
-        self.smtp_server = smtp_server
-        self.smtp_port = smtp_port
-        self.smtp_user = smtp_user
-        self.smtp_password = smtp_password
-        self.from_email = smtp_user
+        Belirtilen webhook URL'sine POST isteğiyle bir işlevin sonucunu göndermek için bir dekoratör oluşturur.
+
+        :param url: Webhook'un URL'si.
+        :param headers: İsteğe dahil edilecek isteğe bağlı başlıklar.
+        :return: İşlev sonucunu JSON yükü olarak belirtilen URL'ye gönderen bir dekoratör.
+        """
 
-    def notify(self, to_email, subject):
         def decorator(func):
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
-                result = func(*args, **kwargs)
-                self.send_notification(to_email, subject, func.__name__, result)
-                return result
+                parsed_url = urlparse(url)
+                conn = HTTPSConnection(parsed_url.netloc)
+                default_headers = {'Content-type': 'application/json'}
+                if headers:
+                    default_headers.update(headers)
+                payload = json.dumps(func(*args, **kwargs))
+                conn.request('POST', parsed_url.path, body=payload, headers=default_headers)
+                response = conn.getresponse()
+                response_data = response.read().decode()
+                return json.loads(response_data)
 
             return wrapper
 
         return decorator
 
-    def send_notification(self, to_email, subject, func_name, result):
-        try:
-            body = f"The function {func_name} was called."
-            body += f"\n\nReturn: {result}"
-            body += f"\n\nThe subject: {subject}"
-            body += f"\n\nTime: {datetime.now()}"
+    @staticmethod
+    def timeit(func):
+        """
+        Creates a decorator to measure the execution time of a function.
 
-            msg = MIMEMultipart()
-            msg['From'] = self.from_email
-            msg['To'] = to_email
-            msg['Subject'] = subject
+        :param func: The function to be decorated.
+        :return: The decorated function with execution time measurement.
 
-            msg.attach(MIMEText(body, 'plain'))
+        Bir işlevin yürütme süresini ölçmek için bir dekoratör oluşturur.
 
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_user, self.smtp_password)
-                server.send_message(msg)
+        :param func: Dekore edilecek işlev.
+        :return: Yürütme süresi ölçümü ile dekore edilmiş işlev.
+        """
 
-            print("Email was sent!")
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start_time = time.time()
+            result = func(*args, **kwargs)
+            end_time = time.time()
+            elapsed_time = end_time - start_time
+            print(f"Function '{func.__name__}' took {elapsed_time:.4f} seconds")
+            return result
 
-        except smtplib.SMTPAuthenticationError:
-            error_message = "Error: The server didn't accept the username/password combination."
-            logging.error(error_message)
-        except smtplib.SMTPConnectError:
-            error_message = "Error: Unable to establish a connection to the email server."
-            logging.error(error_message)
-        except smtplib.SMTPServerDisconnected:
-            error_message = "Error: Server unexpectedly disconnected."
-            logging.error(error_message)
-        except Exception as e:
-            error_message = f"An error occurred: {e}"
-            logging.error(error_message)
+        return wrapper
+
+    @staticmethod
+    def log(func):
+        """
+        Creates a decorator to log the function call and its return value.
 
+        :param func: The function to be decorated.
+        :return: The decorated function with logging.
 
-class CemirUtilsEmail:
+        İşlev çağrısını ve dönüş değerini kaydetmek için bir dekoratör oluşturur.
+
+        :param func: Dekore edilecek işlev.
+        :return: Kayıt ile dekore edilmiş işlev.
+        """
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            print(f"Calling function '{func.__name__}' with arguments {args} and keyword arguments {kwargs}")
+            result = func(*args, **kwargs)
+            print(f"Function '{func.__name__}' returned {result}")
+            return result
+
+        return wrapper
+
+    @staticmethod
+    def retry(retries=3, delay=1):
+        """
+        Creates a decorator to retry a function if it raises an exception.
+
+        :param retries: The number of retries.
+        :param delay: The delay between retries in seconds.
+        :return: The decorated function with retry logic.
+
+        Bir işlevin bir istisna yükseltmesi durumunda yeniden denemek için bir dekoratör oluşturur.
+
+        :param retries: Yeniden deneme sayısı.
+        :param delay: Yeniden denemeler arasındaki gecikme süresi (saniye cinsinden).
+        :return: Yeniden deneme mantığı ile dekore edilmiş işlev.
+        """
+
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                for attempt in range(1, retries + 1):
+                    try:
+                        return func(*args, **kwargs)
+                    except Exception as e:
+                        print(f"Attempt {attempt} failed: {e}")
+                        if attempt < retries:
+                            time.sleep(delay)
+                print(f"Function '{func.__name__}' failed after {retries} attempts")
+
+            return wrapper
+
+        return decorator
+
+    @staticmethod
+    def cache(func):
+        """
+        Creates a decorator to cache the result of a function call.
+
+        :param func: The function to be decorated.
+        :return: The decorated function with caching.
+
+        Bir işlev çağrısının sonucunu önbelleğe almak için bir dekoratör oluşturur.
+
+        :param func: Dekore edilecek işlev.
+        :return: Önbellekleme ile dekore edilmiş işlev.
+        """
+        cache_data = {}
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, frozenset(kwargs.items()))
+            if key in cache_data:
+                print(f"Returning cached result for {func.__name__} with args {args} and kwargs {kwargs}")
+                return cache_data[key]
+            result = func(*args, **kwargs)
+            cache_data[key] = result
+            return result
+
+        return wrapper
+
+    @staticmethod
+    def deprecate(message):
+        """
+        Creates a decorator to mark a function as deprecated.
+
+        :param message: The deprecation message.
+        :return: The decorated function with a deprecation warning.
+
+        Bir işlevi kullanımdan kaldırılmış olarak işaretlemek için bir dekoratör oluşturur.
+
+        :param message: Kullanımdan kaldırma mesajı.
+        :return: Kullanımdan kaldırma uyarısı ile dekore edilmiş işlev.
+        """
+
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                print(f"WARNING: {func.__name__} is deprecated. {message}")
+                return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    @staticmethod
+    def debug(func):
+        """
+        Creates a decorator to debug a function by printing its arguments and return value.
+
+        :param func: The function to be decorated.
+        :return: The decorated function with debugging.
+
+        Bir işlevi hata ayıklamak için, işlevin argümanlarını ve dönüş değerini yazdıran bir dekoratör oluşturur.
+
+        :param func: Dekore edilecek işlev.
+        :return: Hata ayıklama ile dekore edilmiş işlev.
+        """
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            print(f"DEBUG: Calling function '{func.__name__}' with arguments {args} and keyword arguments {kwargs}")
+            result = func(*args, **kwargs)
+            print(f"DEBUG: Function '{func.__name__}' returned {result}")
+            return result
+
+        return wrapper
+
+    @staticmethod
+    def cache_with_expiry(expiry_time):
+        """
+        Creates a decorator to cache the result of a function call with an expiry time.
+
+        :param expiry_time: The time in seconds after which the cache expires.
+        :return: The decorated function with caching and expiry.
+
+        Bir işlev çağrısının sonucunu belirli bir süre sonra sona erecek şekilde önbelleğe almak için bir dekoratör oluşturur.
+
+        :param expiry_time: Önbelleğin sona erme süresi (saniye cinsinden).
+        :return: Önbellekleme ve sona erme ile dekore edilmiş işlev.
+        """
+        cache_data = {}
+
+        def decorator(func):
+            def wrapper(*args, **kwargs):
+                key = (args, frozenset(kwargs.items()))
+                if key in cache_data:
+                    if time.time() - cache_data[key]["timestamp"] < expiry_time:
+                        print(f"Returning cached result for {func.__name__} with args {args} and kwargs {kwargs}")
+                        return cache_data[key]["result"]
+                result = func(*args, **kwargs)
+                cache_data[key] = {"result": result, "timestamp": time.time()}
+                return result
+
+            return wrapper
+
+        return decorator
+
+    @staticmethod
+    def before_after(func):
+        """
+        Creates a decorator to execute actions before and after a function call.
+
+        :param func: The function to be decorated.
+        :return: The decorated function with before and after actions.
+
+        Bir işlev çağrısından önce ve sonra eylemler gerçekleştirmek için bir dekoratör oluşturur.
+
+        :param func: Dekore edilecek işlev.
+        :return: Önce ve sonra eylemler ile dekore edilmiş işlev.
+        """
+
+        def wrapper(*args, **kwargs):
+            print("Starting transaction")
+            result = func(*args, **kwargs)
+            print("Committing transaction")
+            return result
+
+        return wrapper
+
+    @staticmethod
+    def rate_limit(max_calls, period):
+        """
+        Creates a decorator to limit the rate of function calls.
+
+        :param max_calls: The maximum number of calls allowed within the period.
+        :param period: The time period in seconds for the rate limit.
+        :return: The decorated function with rate limiting.
+
+        Bir işlev çağrılarının oranını sınırlamak için bir dekoratör oluşturur.
+
+        :param max_calls: Belirli bir zaman dilimi içinde izin verilen maksimum çağrı sayısı.
+        :param period: Oran sınırı için zaman dilimi (saniye cinsinden).
+        :return: Oran sınırlaması ile dekore edilmiş işlev.
+        """
+        call_times = []
+
+        def decorator(func):
+            def wrapper(*args, **kwargs):
+                nonlocal call_times
+                now = time.time()
+                call_times.append(now)
+                call_times = [t for t in call_times if now - t < period]
+                if len(call_times) > max_calls:
+                    raise RuntimeError("Rate limit exceeded")
+                return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+
+class CemirUtilsFunctionNotification:
     """
-    CemirUtilsEmail
+    CemirUtilsFunctionNotification
 
-    This class provides methods to send emails with optional HTML content and attachments.
+    This class provides functionality to send email notifications when a function is called.
 
     Attributes:
-        smtp_host (str): The SMTP host address.
-        smtp_port (int): The SMTP port number.
-        smtp_user (str): The SMTP username.
-        smtp_pass (str): The SMTP password.
-        smtp_ssl (bool): Use SSL for SMTP connection.
+        smtp_server (str): The SMTP server address.
+        smtp_port (int): The SMTP server port.
+        smtp_user (str): The SMTP server username.
+        smtp_password (str): The SMTP server password.
+        from_email (str): The email address from which notifications are sent.
 
     Methods:
-        html_to_plain(html): Converts HTML content to plain text.
-        zip_attachments(attachments): Zips multiple attachment files into a single ZIP file.
-        send_email(to_email, subject, body_html, attachments=None, zip_files=False): Sends an email with HTML content and optional attachments.
+        notify(to_email, subject): Decorator to notify when the decorated function is called.
+        send_notification(to_email, subject, func_name, result): Sends an email notification with the function call details.
     """
 
     """
-    CemirUtilsEmail
+    CemirUtilsFunctionNotification
 
-    Bu sınıf, isteğe bağlı HTML içeriği ve eklerle e-posta göndermek için yöntemler sağlar.
+    Bu sınıf, bir işlev çağrıldığında e-posta bildirimleri göndermek için işlevsellik sağlar.
 
     Nitelikler:
-        smtp_host (str): SMTP sunucusunun adresi.
-        smtp_port (int): SMTP port numarası.
-        smtp_user (str): SMTP kullanıcı adı.
-        smtp_pass (str): SMTP şifresi.
-        smtp_ssl (bool): SMTP bağlantısı için SSL kullanın.
-
-    Metotlar:
+        smtp_server (str): SMTP sunucusunun adresi.
+        smtp_port (int): SMTP sunucusunun portu.
+        smtp_user (str): SMTP sunucusunun kullanıcı adı.
+        smtp_password (str): SMTP sunucusunun şifresi.
+        from_email (str): Bildirimlerin gönderileceği e-posta adresi.
+
+    Metotlar:
+        notify(to_email, subject): Dekoratör, süslenen işlev çağrıldığında bildirimde bulunur.
+        send_notification(to_email, subject, func_name, result): İşlev çağrısı detaylarıyla bir e-posta bildirimi gönderir.
+    """
+
+    def __init__(self, smtp_server, smtp_port, smtp_user, smtp_password):
+        self.smtp_server = smtp_server
+        self.smtp_port = smtp_port
+        self.smtp_user = smtp_user
+        self.smtp_password = smtp_password
+        self.from_email = smtp_user
+
+    def notify(self, to_email, subject):
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                result = func(*args, **kwargs)
+                self.send_notification(to_email, subject, func.__name__, result)
+                return result
+
+            return wrapper
+
+        return decorator
+
+    def send_notification(self, to_email, subject, func_name, result):
+        try:
+            body = f"The function {func_name} was called."
+            body += f"\n\nReturn: {result}"
+            body += f"\n\nThe subject: {subject}"
+            body += f"\n\nTime: {datetime.now()}"
+
+            msg = MIMEMultipart()
+            msg['From'] = self.from_email
+            msg['To'] = to_email
+            msg['Subject'] = subject
+
+            msg.attach(MIMEText(body, 'plain'))
+
+            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
+                server.starttls()
+                server.login(self.smtp_user, self.smtp_password)
+                server.send_message(msg)
+
+            print("Email was sent!")
+
+        except smtplib.SMTPAuthenticationError:
+            error_message = "Error: The server didn't accept the username/password combination."
+            logging.error(error_message)
+        except smtplib.SMTPConnectError:
+            error_message = "Error: Unable to establish a connection to the email server."
+            logging.error(error_message)
+        except smtplib.SMTPServerDisconnected:
+            error_message = "Error: Server unexpectedly disconnected."
+            logging.error(error_message)
+        except Exception as e:
+            error_message = f"An error occurred: {e}"
+            logging.error(error_message)
+
+
+class CemirUtilsEmail:
+    """
+    CemirUtilsEmail
+
+    This class provides methods to send emails with optional HTML content and attachments.
+
+    Attributes:
+        smtp_host (str): The SMTP host address.
+        smtp_port (int): The SMTP port number.
+        smtp_user (str): The SMTP username.
+        smtp_pass (str): The SMTP password.
+        smtp_ssl (bool): Use SSL for SMTP connection.
+
+    Methods:
+        html_to_plain(html): Converts HTML content to plain text.
+        zip_attachments(attachments): Zips multiple attachment files into a single ZIP file.
+        send_email(to_email, subject, body_html, attachments=None, zip_files=False): Sends an email with HTML content and optional attachments.
+    """
+
+    """
+    CemirUtilsEmail
+
+    Bu sınıf, isteğe bağlı HTML içeriği ve eklerle e-posta göndermek için yöntemler sağlar.
+
+    Nitelikler:
+        smtp_host (str): SMTP sunucusunun adresi.
+        smtp_port (int): SMTP port numarası.
+        smtp_user (str): SMTP kullanıcı adı.
+        smtp_pass (str): SMTP şifresi.
+        smtp_ssl (bool): SMTP bağlantısı için SSL kullanın.
+
+    Metotlar:
         html_to_plain(html): HTML içeriğini düz metne dönüştürür.
         zip_attachments(attachments): Birden fazla eki tek bir ZIP dosyasında arşivler.
         send_email(to_email, subject, body_html, attachments=None, zip_files=False): HTML içeriği ve isteğe bağlı eklerle bir e-posta gönderir.
@@ -1095,356 +2501,3572 @@ class CemirUtilsEmail:
                     zipf.write(file_path, os.path.basename(file_path))
         return zip_filename
 
-    def send_email(self, to_email, subject, body_html, attachments=None, zip_files=False, sender_name=None):
-        try:
-            # Check if all attachment files exist
-            if attachments:
-                missing_files = [file_path for file_path in attachments if not os.path.isfile(file_path)]
-                if missing_files:
-                    error_message = f"{datetime.now()}: Missing attachment files: {', '.join(missing_files)}"
-                    logging.error(error_message)
-                    print(error_message)
-                    return  # Exit without sending the email
+    def send_email(self, to_email, subject, body_html, attachments=None, zip_files=False, sender_name=None):
+        try:
+            # Check if all attachment files exist
+            if attachments:
+                missing_files = [file_path for file_path in attachments if not os.path.isfile(file_path)]
+                if missing_files:
+                    error_message = f"{datetime.now()}: Missing attachment files: {', '.join(missing_files)}"
+                    logging.error(error_message)
+                    print(error_message)
+                    return  # Exit without sending the email
+
+            # Set up the server
+            if self.smtp_ssl:
+                context = ssl.create_default_context()
+                server = smtplib.SMTP_SSL(self.smtp_host, self.smtp_port, context=context)
+            else:
+                server = smtplib.SMTP(self.smtp_host, self.smtp_port)
+                server.starttls()
+
+            # Login to the server
+            server.login(self.smtp_user, self.smtp_pass)
+
+            # Create the email
+            msg = MIMEMultipart('alternative')
+
+            msg['From'] = formataddr((str(sender_name or ""), self.smtp_user))
+
+
+            msg['To'] = to_email
+            msg['Subject'] = subject
+
+            # Convert HTML to plain text
+            body_plain = self.html_to_plain(body_html)
+
+            # Attach plain text and HTML parts
+            part1 = MIMEText(body_plain, 'plain')
+            part2 = MIMEText(body_html, 'html')
+            msg.attach(part1)
+            msg.attach(part2)
+
+            # Handle attachments
+            if attachments:
+                if zip_files:
+                    zip_filename = self.zip_attachments(attachments)
+                    with open(zip_filename, 'rb') as f:
+                        part = MIMEBase('application', 'octet-stream')
+                        part.set_payload(f.read())
+                    encoders.encode_base64(part)
+                    part.add_header(
+                        'Content-Disposition',
+                        f'attachment; filename={zip_filename}',
+                    )
+                    msg.attach(part)
+                    os.remove(zip_filename)  # Temp zip dosyasını sil
+                else:
+                    for file_path in attachments:
+                        if os.path.isfile(file_path):
+                            with open(file_path, 'rb') as f:
+                                part = MIMEBase('application', 'octet-stream')
+                                part.set_payload(f.read())
+                                encoders.encode_base64(part)
+
+                            part.add_header(
+                                'Content-Disposition',
+                                f'attachment; filename={os.path.basename(file_path)}',
+                            )
+                            msg.attach(part)
+
+            # Send the email
+            server.sendmail(self.smtp_user, to_email, msg.as_string())
+
+            # Close the server
+            server.quit()
+
+            print("Email sent successfully")
+        except smtplib.SMTPAuthenticationError:
+            error_message = "Error: The server didn't accept the username/password combination."
+            logging.error(error_message)
+            print(error_message)
+        except smtplib.SMTPConnectError:
+            error_message = "Error: Unable to establish a connection to the email server."
+            logging.error(error_message)
+            print(error_message)
+        except smtplib.SMTPServerDisconnected:
+            error_message = "Error: Server unexpectedly disconnected."
+            logging.error(error_message)
+            print(error_message)
+        except Exception as e:
+            error_message = f"An error occurred: {e}"
+            logging.error(error_message)
+            print(error_message)
+
+
+class CemirUtilsConditions:
+    """
+    CemirUtilsConditions
+
+    This class provides functionality to collect and evaluate conditions within a function.
+
+    Attributes:
+        conditions (list): A list to store conditions.
+
+    Methods:
+        condition_collector(func): A decorator to collect and evaluate conditions within the decorated function.
+    """
+
+    """
+    CemirUtilsConditions
+
+    Bu sınıf, bir işlev içindeki koşulları toplamak ve değerlendirmek için işlevsellik sağlar.
+
+    Nitelikler:
+        conditions (list): Koşulları depolamak için bir liste.
+
+    Metotlar:
+        condition_collector(func): Süslenen işlev içindeki koşulları toplamak ve değerlendirmek için bir dekoratör.
+    """
+
+    def __init__(self):
+        self.conditions = []
+
+    def condition_collector(self, func):
+        def wrapper(*args, **kwargs):
+            self.conditions.clear()
+            source_lines, starting_line_number = inspect.getsourcelines(func)
+            local_vars = {}
+
+            def trace_function(frame, event, arg):
+                if event == 'return':
+                    local_vars.update(frame.f_locals)
+                return trace_function
+
+            sys.settrace(trace_function)
+            result = func(*args, **kwargs)
+            sys.settrace(None)
+
+            skip_next_conditions = False
+
+            for idx, line in enumerate(source_lines):
+                stripped_line = line.strip()
+                if stripped_line.startswith("if"):
+                    skip_next_conditions = False  # Reset at the start of each new if block
+                    condition = stripped_line.split(":")[0].strip()
+                    try:
+                        if eval(condition.split(" ", 1)[1], globals(), local_vars):
+                            self.conditions.append((stripped_line, starting_line_number + idx))
+                            skip_next_conditions = True
+                    except Exception:
+                        pass
+                elif stripped_line.startswith("elif"):
+                    if not skip_next_conditions:
+                        condition = stripped_line.split(":")[0].strip()
+                        try:
+                            if eval(condition.split(" ", 1)[1], globals(), local_vars):
+                                self.conditions.append((stripped_line, starting_line_number + idx))
+                                skip_next_conditions = True
+                        except Exception:
+                            pass
+                elif stripped_line.startswith("else"):
+                    if not skip_next_conditions:
+                        self.conditions.append((stripped_line, starting_line_number + idx))
+                    skip_next_conditions = True
+
+            # Print the collected conditions with line numbers
+            for condition, line_num in self.conditions:
+                print(f"Line {line_num}: {condition}")
+
+            return result
+
+        return wrapper
+
+
+class Dict2Dot(dict):
+    """
+    A dictionary subclass that allows for dot notation access to dictionary attributes.
+
+    Bir sözlük alt sınıfı olup, sözlük öğelerine nokta notasyonu ile erişim sağlar.
+
+    Methods:
+    ----------
+    __getattr__(self, key):
+        Returns the value of the given key. If the value is a dictionary, it converts it to a Dict2Dot object.
+        Verilen anahtarın değerini döndürür. Eğer değer bir sözlük ise, bunu Dict2Dot nesnesine dönüştürür.
+    """
+
+    def __getattr__(self, key):
+        """
+        Returns the value of the given key. If the value is a dictionary, it converts it to a Dict2Dot object.
+
+        Verilen anahtarın değerini döndürür. Eğer değer bir sözlük ise, bunu Dict2Dot nesnesine dönüştürür.
+
+        Parameters:
+        ----------
+        key : str
+            The key to retrieve the value for.
+            Değerini almak için anahtar.
+
+        Raises:
+        ----------
+        AttributeError
+            If the key does not exist in the dictionary.
+            Anahtar sözlükte bulunamazsa.
+        """
+        if key in self:
+            value = self[key]
+            if isinstance(value, dict):
+                return Dict2Dot(value)
+            return value
+        else:
+            raise AttributeError(f"'{self.__class__.__name__}' objesinde '{key}' anahtarı bulunamadı.")
+
+
+class IPGeolocation:
+    class RangeIndex:
+        """
+        Sorted in-memory IP range table answered with bisect.
+
+        Bisect ile sorgulanan sıralı, bellek içi IP aralık tablosu.
+        """
+
+        def __init__(self, starts, ends, country_idx, countries):
+            """
+            Args:
+                starts (array): Sorted range start addresses. / Sıralı aralık başlangıç adresleri.
+                ends (array): Range end addresses. / Aralık bitiş adresleri.
+                country_idx (array): Index into countries for each range. / Her aralık için countries içindeki sıra.
+                countries (list): Interned (country_code, country_name) tuples. / Tekilleştirilmiş (ülke kodu, ülke adı) demetleri.
+            """
+            self.starts = starts
+            self.ends = ends
+            self.country_idx = country_idx
+            self.countries = countries
+
+        def __len__(self):
+            return len(self.starts)
+
+        def lookup(self, ip_int):
+            """
+            Returns the (country_code, country_name) tuple for the given integer IP or None.
+
+            Verilen tam sayı IP için (ülke kodu, ülke adı) demetini veya None döndürür.
+            """
+            i = bisect.bisect_right(self.starts, ip_int) - 1
+            if i >= 0 and ip_int <= self.ends[i]:
+                return self.countries[self.country_idx[i]]
+            return None
+
+        def numpy_columns(self, np):
+            """
+            Returns (starts, ends, country_idx) as zero-copy NumPy arrays.
+
+            (starts, ends, country_idx) sütunlarını kopyasız NumPy dizileri olarak döndürür.
+            """
+            return np.frombuffer(self.starts, dtype=np.uint32), np.frombuffer(self.ends, dtype=np.uint32), np.frombuffer(self.country_idx, dtype=np.uint16)
+
+    class RangeIndex6:
+        """
+        Sorted in-memory IPv6 range table. 128-bit addresses are split into paired 64-bit arrays and answered with bisect.
+
+        Sıralı, bellek içi IPv6 aralık tablosu. 128 bit adresler eşli 64 bit dizilere bölünür ve bisect ile sorgulanır.
+        """
+
+        def __init__(self, starts_hi, starts_lo, ends_hi, ends_lo, country_idx, countries):
+            self.starts_hi = starts_hi
+            self.starts_lo = starts_lo
+            self.ends_hi = ends_hi
+            self.ends_lo = ends_lo
+            self.country_idx = country_idx
+            self.countries = countries
+
+        def __len__(self):
+            return len(self.starts_hi)
+
+        def lookup(self, ip_int):
+            """
+            Returns the (country_code, country_name) tuple for the given 128-bit integer IP or None.
+
+            Verilen 128 bit tam sayı IP için (ülke kodu, ülke adı) demetini veya None döndürür.
+            """
+            hi, lo = ip_int >> 64, ip_int & 0xFFFFFFFFFFFFFFFF
+            # Narrow to the ranges sharing the high word, then bisect the low word inside them / Üst kelimesi aynı aralıklara daralt, sonra alt kelimeyi içlerinde ara
+            first = bisect.bisect_left(self.starts_hi, hi)
+            last = bisect.bisect_right(self.starts_hi, hi, first)
+            i = bisect.bisect_right(self.starts_lo, lo, first, last) - 1
+            if i < first:
+                i = first - 1
+            if i >= 0 and (hi, lo) <= (self.ends_hi[i], self.ends_lo[i]):
+                return self.countries[self.country_idx[i]]
+            return None
+
+    class MappedIndex(RangeIndex):
+        """
+        Read-only RangeIndex backed by an mmap of the binary database, shared between processes through the page cache.
+
+        İkili veritabanının mmap'i üzerinde çalışan salt okunur RangeIndex; sayfa önbelleği üzerinden süreçler arasında paylaşılır.
+
+        File layout / Dosya düzeni (big-endian):
+            header: magic b"CIPG", version (H), reserved (H), range count (I), country count (I), crc32 of the rest (I)
+            starts: count x uint32, ends: count x uint32, country_idx: count x uint16
+            countries: country count x (code length (B), code, name length (H), name) in UTF-8
+        """
+
+        MAGIC = b"CIPG"
+        VERSION = 1
+        HEADER = struct.Struct(">4sHHIII")
+
+        class Column:
+            """
+            Sequence view over a big-endian column inside the mmap, usable with bisect.
+
+            mmap içindeki big-endian bir sütun üzerinde bisect ile kullanılabilen dizi görünümü.
+            """
+
+            def __init__(self, buffer, offset, count, fmt):
+                self.buffer = buffer
+                self.offset = offset
+                self.count = count
+                self.fmt = fmt
+                self.unpack_from = struct.Struct(fmt).unpack_from
+                self.size = struct.calcsize(fmt)
+
+            def __len__(self):
+                return self.count
+
+            def __getitem__(self, i):
+                if not 0 <= i < self.count:
+                    raise IndexError(i)
+                return self.unpack_from(self.buffer, self.offset + i * self.size)[0]
+
+        def __init__(self, path, verify=True):
+            """
+            Args:
+                path (str): Path of the binary database. / İkili veritabanının yolu.
+                verify (bool): Verify the crc32 checksum while opening. / Açarken crc32 sağlamasını doğrula.
+            """
+            self.path = path
+            with open(path, "rb") as f:
+                self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            magic, version, _, count, country_count, checksum = self.HEADER.unpack_from(self.mmap, 0)
+            if magic != self.MAGIC:
+                raise ValueError(f"{path} is not a CemirUtils IP database / {path} bir CemirUtils IP veritabanı değil")
+            if version != self.VERSION:
+                raise ValueError(f"Unsupported IP database version: {version} / Desteklenmeyen IP veritabanı sürümü: {version}")
+            if verify:
+                # Checksum the mapped pages in place; slicing the mmap would copy the whole file / Eşlenen sayfaların sağlaması yerinde alınır; mmap dilimi tüm dosyayı kopyalardı
+                with memoryview(self.mmap) as view, view[self.HEADER.size:] as payload:
+                    valid = zlib.crc32(payload) == checksum
+                if not valid:
+                    raise ValueError(f"{path} checksum mismatch / {path} sağlama toplamı uyuşmuyor")
+
+            offset = self.HEADER.size
+            starts = self.Column(self.mmap, offset, count, ">I")
+            ends = self.Column(self.mmap, offset + 4 * count, count, ">I")
+            country_idx = self.Column(self.mmap, offset + 8 * count, count, ">H")
+
+            countries = []
+            offset += 10 * count
+            for _ in range(country_count):
+                code_length = self.mmap[offset]
+                code = self.mmap[offset + 1:offset + 1 + code_length].decode("utf-8")
+                offset += 1 + code_length
+                name_length, = struct.unpack_from(">H", self.mmap, offset)
+                name = self.mmap[offset + 2:offset + 2 + name_length].decode("utf-8")
+                offset += 2 + name_length
+                countries.append((code, name))
+
+            super().__init__(starts, ends, country_idx, countries)
+
+        def numpy_columns(self, np):
+            return tuple(np.frombuffer(self.mmap, dtype=np.dtype(column.fmt.replace("I", "u4").replace("H", "u2")), count=column.count, offset=column.offset)
+                         for column in (self.starts, self.ends, self.country_idx))
+
+        def close(self):
+            self.mmap.close()
+
+        @classmethod
+        def write(cls, index, path):
+            """
+            Serializes a RangeIndex to the binary format, replacing the target atomically.
+
+            Bir RangeIndex'i ikili biçime yazar; hedef dosyayı atomik olarak değiştirir.
+            """
+            columns = []
+            for column in (array('I', index.starts), array('I', index.ends), array('H', index.country_idx)):
+                if sys.byteorder == "little":
+                    column.byteswap()
+                columns.append(column.tobytes())
+
+            for code, name in index.countries:
+                code, name = code.encode("utf-8"), name.encode("utf-8")
+                columns.append(struct.pack(">B", len(code)) + code + struct.pack(">H", len(name)) + name)
+
+            payload = b"".join(columns)
+            header = cls.HEADER.pack(cls.MAGIC, cls.VERSION, 0, len(index), len(index.countries), zlib.crc32(payload))
+
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(header)
+                f.write(payload)
+            os.replace(tmp_path, path)
+
+    def __init__(self, in_memory=False, cache_size=0, cache_ttl=None):
+        """
+        Args:
+            in_memory (bool): Answer lookups from an in-memory bisect index instead of SQLite. / Sorguları SQLite yerine bellek içi bisect indeksinden yanıtla.
+            cache_size (int): Maximum number of get_ip_location results kept in the LRU cache, 0 disables it. / LRU önbellekte tutulacak en fazla get_ip_location sonucu, 0 kapatır.
+            cache_ttl (float, optional): Seconds a cached result stays valid. / Önbellekteki sonucun geçerli kalacağı saniye.
+        """
+        self.database_url = "https://download.ip2location.com/lite/IP2LOCATION-LITE-DB1.CSV.ZIP"
+        self.database_file = "IP2LOCATION-LITE-DB1.CSV"
+        self.download_path = os.path.join(os.getcwd(), "ip_database.zip")
+        self.db_file = os.path.join(os.getcwd(), "ip_geolocation.db")
+        self.binary_file = os.path.join(os.getcwd(), "ip_geolocation.bin")
+        self.database6_url = "https://download.ip2location.com/lite/IP2LOCATION-LITE-DB1.IPV6.CSV.ZIP"
+        self.download6_path = os.path.join(os.getcwd(), "ip_database_ipv6.zip")
+        self.connection = None
+        self.cursor = None
+        self.in_memory = in_memory
+        self.index = None
+        self.index6 = None
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self._cache_generation = 0
+        self._refresh_lock = threading.Lock()
+
+    OCTETS = tuple(str(octet) for octet in range(256))
+
+    def ip_to_int(self, ip):
+        """
+        Converts an IP address to an integer. Only strict dotted-quad IPv4 is accepted.
+
+        Bir IP adresini tam sayıya dönüştürür. Yalnızca kesin noktalı dörtlü IPv4 kabul edilir.
+
+        Args:
+            ip (str): The IP address to convert. / Dönüştürülecek IP adresi.
+
+        Returns:
+            int: The integer representation of the IP address. / IP adresinin tam sayı temsili.
+
+        Raises:
+            ValueError: If the address is not a valid IPv4 address. / Adres geçerli bir IPv4 adresi değilse.
+        """
+        try:
+            return int.from_bytes(socket.inet_pton(socket.AF_INET, ip), "big")
+        except (OSError, TypeError):
+            raise ValueError(f"Invalid IPv4 address: {ip!r} / Geçersiz IPv4 adresi: {ip!r}") from None
+
+    def int_to_ip(self, ip_int):
+        """
+        Converts an integer to an IP address.
+
+        Bir tam sayıyı IP adresine dönüştürür.
+
+        Args:
+            ip_int (int): The integer to convert. / Dönüştürülecek tam sayı.
+
+        Returns:
+            str: The IP address representation of the integer. / Tam sayının IP adresi temsili.
+
+        Raises:
+            ValueError: If the integer is outside the IPv4 range. / Tam sayı IPv4 aralığı dışındaysa.
+        """
+        if not 0 <= ip_int <= 0xFFFFFFFF:
+            raise ValueError(f"Integer out of IPv4 range: {ip_int} / Tam sayı IPv4 aralığı dışında: {ip_int}")
+        octets = self.OCTETS
+        return f"{octets[ip_int >> 24]}.{octets[ip_int >> 16 & 255]}.{octets[ip_int >> 8 & 255]}.{octets[ip_int & 255]}"
+
+    def ips_to_ints(self, ips):
+        """
+        Converts a list of IP addresses to integers in one pass.
+
+        Bir IP adresi listesini tek geçişte tam sayılara dönüştürür.
+
+        Args:
+            ips (iterable): IPv4 address strings. / IPv4 adres metinleri.
+
+        Returns:
+            list: Integer representations in input order. / Girdi sırasıyla tam sayı temsilleri.
+
+        Raises:
+            ValueError: If any address is not a valid IPv4 address. / Herhangi bir adres geçerli bir IPv4 adresi değilse.
+        """
+        if not isinstance(ips, (list, tuple)):
+            ips = list(ips)
+
+        inet_pton, af_inet = socket.inet_pton, socket.AF_INET
+        try:
+            packed = b"".join([inet_pton(af_inet, ip) for ip in ips])
+        except (OSError, TypeError):
+            for ip in ips:
+                self.ip_to_int(ip)  # Raises ValueError naming the first bad address / İlk hatalı adresi belirten ValueError fırlatır
+            raise
+        return list(struct.unpack(f">{len(packed) // 4}I", packed))
+
+    def ints_to_ips(self, ip_ints):
+        """
+        Converts a list of integers to IP addresses.
+
+        Bir tam sayı listesini IP adreslerine dönüştürür.
+
+        Args:
+            ip_ints (iterable): Integers in the IPv4 range. / IPv4 aralığındaki tam sayılar.
+
+        Returns:
+            list: IP address strings in input order. / Girdi sırasıyla IP adresi metinleri.
+
+        Raises:
+            ValueError: If any integer is outside the IPv4 range. / Herhangi bir tam sayı IPv4 aralığı dışındaysa.
+        """
+        ip_ints = list(ip_ints)
+        if ip_ints and not (0 <= min(ip_ints) and max(ip_ints) <= 0xFFFFFFFF):
+            raise ValueError("Integer out of IPv4 range / Tam sayı IPv4 aralığı dışında")
+        octets = self.OCTETS
+        return [f"{octets[n >> 24]}.{octets[n >> 16 & 255]}.{octets[n >> 8 & 255]}.{octets[n & 255]}" for n in ip_ints]
+
+    def ip6_to_int(self, ip):
+        """
+        Converts an IPv6 address, including the IPv4-mapped ::ffff:a.b.c.d form, to a 128-bit integer.
+
+        IPv4 eşlemeli ::ffff:a.b.c.d biçimi dahil bir IPv6 adresini 128 bit tam sayıya dönüştürür.
+
+        Args:
+            ip (str): The IPv6 address to convert. / Dönüştürülecek IPv6 adresi.
+
+        Returns:
+            int: The integer representation of the IP address. / IP adresinin tam sayı temsili.
+
+        Raises:
+            ValueError: If the address is not a valid IPv6 address. / Adres geçerli bir IPv6 adresi değilse.
+        """
+        try:
+            return int.from_bytes(socket.inet_pton(socket.AF_INET6, ip), "big")
+        except (OSError, TypeError):
+            raise ValueError(f"Invalid IPv6 address: {ip!r} / Geçersiz IPv6 adresi: {ip!r}") from None
+
+    def int_to_ip6(self, ip_int):
+        """
+        Converts a 128-bit integer to an IPv6 address.
+
+        128 bit bir tam sayıyı IPv6 adresine dönüştürür.
+
+        Args:
+            ip_int (int): The integer to convert. / Dönüştürülecek tam sayı.
+
+        Returns:
+            str: The compressed IPv6 address. / Sıkıştırılmış IPv6 adresi.
+
+        Raises:
+            ValueError: If the integer is outside the IPv6 range. / Tam sayı IPv6 aralığı dışındaysa.
+        """
+        if not 0 <= ip_int < 1 << 128:
+            raise ValueError(f"Integer out of IPv6 range: {ip_int} / Tam sayı IPv6 aralığı dışında: {ip_int}")
+        return socket.inet_ntop(socket.AF_INET6, ip_int.to_bytes(16, "big"))
+
+    def download_database(self, force_download=False, extract=True):
+        """
+        Downloads the IP2Location database.
+
+        IP2Location veritabanını indirir.
+
+        Args:
+            force_download (bool): Whether to force the download of the zip file. / Zip dosyasını yeniden indirme zorunluluğu.
+            extract (bool): Whether to extract the CSV into the working directory. / CSV'nin çalışma dizinine çıkarılıp çıkarılmayacağı.
+        """
+        try:
+            if force_download or not (os.path.isfile(self.database_file) or os.path.isfile(self.download_path)):
+                # Download the database file
+                print("Downloading the database file... / Veritabanı dosyasını indiriyor...")
+                request.urlretrieve(self.database_url, self.download_path)
+                print("Database file downloaded! / Veritabanı dosyası indirildi!")
+
+            if extract and (force_download or not os.path.isfile(self.database_file)):
+                # Extract the zip file
+                with zipfile.ZipFile(self.download_path, "r") as zip_ref:
+                    zip_ref.extractall(os.getcwd())
+        except Exception as e:
+            print(f"An error occurred: {e} / Hata oluştu: {e}")
+
+    def iter_csv_rows(self, source=None):
+        """
+        Streams (ip_start, ip_end, country_code, country_name) rows with integer addresses, reading the CSV straight out of the zip when it is not extracted or the zip is newer.
+
+        Adresleri tam sayı olan (ip_start, ip_end, ülke kodu, ülke adı) satırlarını akış olarak üretir; CSV çıkarılmamışsa veya zip daha yeniyse doğrudan zip içinden okur.
+
+        Args:
+            source (str, optional): Local zip or CSV file to read instead of the downloaded database. / İndirilen veritabanı yerine okunacak yerel zip veya CSV dosyası.
+
+        Yields:
+            tuple: (int, int, str, str)
+        """
+        if source is not None:
+            zip_path = csv_path = source
+            use_zip = zipfile.is_zipfile(source)
+        else:
+            zip_path, csv_path = self.download_path, self.database_file
+            use_zip = os.path.isfile(zip_path) and (not os.path.isfile(csv_path) or os.path.getmtime(zip_path) > os.path.getmtime(csv_path))
+
+        if use_zip:
+            with zipfile.ZipFile(zip_path, "r") as zip_ref:
+                member = next(name for name in zip_ref.namelist() if name.upper().endswith(".CSV"))
+                with zip_ref.open(member) as raw:
+                    yield from self._parse_csv_rows(io.TextIOWrapper(raw, encoding="utf-8", newline=""))
+        else:
+            with open(csv_path, "r", encoding="utf-8", newline="") as csvfile:
+                yield from self._parse_csv_rows(csvfile)
+
+    @staticmethod
+    def _parse_csv_rows(csvfile):
+        for row in csv.reader(csvfile):
+            if not row[0].isdigit():
+                continue  # Skip the header row / Başlık satırını atla
+            yield int(row[0]), int(row[1]), row[2], row[3]
+
+    def create_sqlite_db(self, db_file=None, source=None):
+        """
+        Creates the SQLite database and bulk imports the CSV file into it.
+
+        SQLite veritabanını oluşturur ve CSV dosyasını toplu olarak içine aktarır.
+
+        Args:
+            db_file (str, optional): Database path to build. Defaults to self.db_file. / Oluşturulacak veritabanı yolu. Varsayılan self.db_file.
+            source (str, optional): Local zip or CSV file to import. / İçe aktarılacak yerel zip veya CSV dosyası.
+        """
+        try:
+            self.connection = self._build_sqlite_db(db_file or self.db_file, source)
+            self.cursor = self.connection.cursor()
+            self.cache_clear()
+        except Exception as e:
+            print(f"An error occurred: {e} / Hata oluştu: {e}")
+
+    def _build_sqlite_db(self, db_file, source=None):
+        connection = sqlite3.connect(db_file)
+        cursor = connection.cursor()
+
+        # Bulk load pragmas, only for the build / Yalnızca oluşturma sırasında toplu yükleme ayarları
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=OFF")
+
+        print("Creating SQLite database table... / SQLite veritabanı tablosu oluşturuluyor...")
+        with connection:
+            # sqlite3 autocommits DDL outside a transaction; without BEGIN a failed load would leave the old table dropped / sqlite3 işlem dışındaki DDL'i kendiliğinden onaylar; BEGIN olmadan başarısız bir yükleme eski tabloyu silinmiş bırakırdı
+            cursor.execute("BEGIN")
+            # Create the table
+            cursor.execute("DROP TABLE IF EXISTS ip_geolocation")
+            cursor.execute('''CREATE TABLE ip_geolocation
+                        (ip_start INTEGER PRIMARY KEY,
+                        ip_end INTEGER NOT NULL,
+                        country_code TEXT,
+                        country_name TEXT)''')
+
+            # Stream the CSV rows into the database / CSV satırlarını veritabanına akıt
+            cursor.executemany("INSERT INTO ip_geolocation VALUES (?, ?, ?, ?)", self.iter_csv_rows(source))
+            cursor.execute("CREATE INDEX idx_ip_geolocation_ip_end ON ip_geolocation (ip_end)")
+
+        # Fold the WAL back so the file is self-contained and can be swapped / WAL'ı geri katla ki dosya tek başına taşınabilsin
+        cursor.execute("PRAGMA journal_mode=DELETE")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        print("SQLite database table created! / SQLite veritabanı tablosu oluşturuldu!")
+        return connection
+
+    def load_memory_index(self, force_download=False):
+        """
+        Loads the CSV ranges into compact sorted arrays for bisect lookups.
+
+        CSV aralıklarını bisect sorguları için sıkıştırılmış sıralı dizilere yükler.
+
+        Args:
+            force_download (bool): Whether to force the download of the zip file. / Zip dosyasını yeniden indirme zorunluluğu.
+
+        Returns:
+            IPGeolocation.RangeIndex: The loaded index. / Yüklenen indeks.
+        """
+        self.index = self._build_range_index(force_download)
+        self.cache_clear()
+        return self.index
+
+    def _build_range_index(self, force_download=False, source=None):
+        if source is None:
+            self.download_database(force_download, extract=False)
+
+        starts = array('I')
+        ends = array('I')
+        country_idx = array('H')
+        countries = []
+        interned = {}
+
+        previous = -1
+        for ip_start, ip_end, country_code, country_name in self.iter_csv_rows(source):
+            if ip_start <= previous:
+                raise ValueError(f"CSV is not sorted by ip_start at {ip_start} / CSV ip_start'a göre sıralı değil: {ip_start}")
+            previous = ip_start
+
+            country = (country_code, country_name)
+            idx = interned.get(country)
+            if idx is None:
+                idx = interned[country] = len(countries)
+                countries.append(country)
+
+            starts.append(ip_start)
+            ends.append(ip_end)
+            country_idx.append(idx)
+
+        return self.RangeIndex(starts, ends, country_idx, countries)
+
+    def build_binary_db(self, binary_file=None, force_download=False):
+        """
+        Converts IP2LOCATION-LITE-DB1.CSV into the compact binary database that open_binary_db memory-maps.
+
+        IP2LOCATION-LITE-DB1.CSV dosyasını open_binary_db'nin bellek eşlediği sıkıştırılmış ikili veritabanına dönüştürür.
+
+        Args:
+            binary_file (str, optional): Output path. Defaults to self.binary_file. / Çıktı yolu. Varsayılan self.binary_file.
+            force_download (bool): Whether to force the download of the zip file. / Zip dosyasını yeniden indirme zorunluluğu.
+
+        Returns:
+            str: Path of the written file. / Yazılan dosyanın yolu.
+        """
+        binary_file = binary_file or self.binary_file
+        self.MappedIndex.write(self._build_range_index(force_download), binary_file)
+        return binary_file
+
+    def open_binary_db(self, binary_file=None, verify=True):
+        """
+        Memory-maps the binary database read-only and uses it for in-memory lookups.
+
+        İkili veritabanını salt okunur olarak bellek eşler ve bellek içi sorgular için kullanır.
+
+        Args:
+            binary_file (str, optional): Path of the binary database. Defaults to self.binary_file. / İkili veritabanının yolu. Varsayılan self.binary_file.
+            verify (bool): Verify the header checksum. / Başlık sağlamasını doğrula.
+
+        Returns:
+            IPGeolocation.MappedIndex: The mapped index. / Eşlenen indeks.
+        """
+        self.index = self.MappedIndex(binary_file or self.binary_file, verify=verify)
+        self.in_memory = True
+        self.cache_clear()
+        return self.index
+
+    def load_ipv6_index(self, force_download=False, source=None):
+        """
+        Loads IP2LOCATION-LITE-DB1.IPV6 ranges into paired 64-bit arrays for IPv6 lookups. The new index replaces the old one in a single assignment, so it can be reloaded while lookups run.
+
+        IPv6 sorguları için IP2LOCATION-LITE-DB1.IPV6 aralıklarını eşli 64 bit dizilere yükler. Yeni indeks eskisinin yerine tek atamayla geçer; sorgular sürerken yeniden yüklenebilir.
+
+        Args:
+            force_download (bool): Whether to force the download of the zip file. / Zip dosyasını yeniden indirme zorunluluğu.
+            source (str, optional): Local IPv6 zip or CSV file to load instead of downloading. / İndirmek yerine yüklenecek yerel IPv6 zip veya CSV dosyası.
+
+        Returns:
+            IPGeolocation.RangeIndex6: The loaded index. / Yüklenen indeks.
+        """
+        if source is None:
+            if force_download or not os.path.isfile(self.download6_path):
+                print("Downloading the IPv6 database file... / IPv6 veritabanı dosyasını indiriyor...")
+                request.urlretrieve(self.database6_url, self.download6_path)
+                print("IPv6 database file downloaded! / IPv6 veritabanı dosyası indirildi!")
+            source = self.download6_path
+
+        self.index6 = self._build_range_index6(source)
+        self.cache_clear()
+        return self.index6
+
+    def _build_range_index6(self, source):
+        mask = 0xFFFFFFFFFFFFFFFF
+        starts_hi, starts_lo = array('Q'), array('Q')
+        ends_hi, ends_lo = array('Q'), array('Q')
+        country_idx = array('H')
+        countries = []
+        interned = {}
+
+        previous = -1
+        for ip_start, ip_end, country_code, country_name in self.iter_csv_rows(source):
+            if ip_start <= previous:
+                raise ValueError(f"CSV is not sorted by ip_start at {ip_start} / CSV ip_start'a göre sıralı değil: {ip_start}")
+            previous = ip_start
+
+            country = (country_code, country_name)
+            idx = interned.get(country)
+            if idx is None:
+                idx = interned[country] = len(countries)
+                countries.append(country)
+
+            starts_hi.append(ip_start >> 64)
+            starts_lo.append(ip_start & mask)
+            ends_hi.append(ip_end >> 64)
+            ends_lo.append(ip_end & mask)
+            country_idx.append(idx)
+
+        return self.RangeIndex6(starts_hi, starts_lo, ends_hi, ends_lo, country_idx, countries)
+
+    def refresh_database(self, source=None, background=True, source6=None):
+        """
+        Rebuilds the active database (memory index, binary database or SQLite file) off to the side and swaps it in atomically, together with the IPv6 index when one is loaded. Lookups keep reading the previous snapshot until the swap and never see a half-built table.
+
+        Etkin veritabanını (bellek indeksi, ikili veritabanı veya SQLite dosyası) ve yüklüyse IPv6 indeksini ayrı bir yerde yeniden oluşturur ve atomik olarak değiştirir. Sorgular değişime kadar önceki anlık görüntüyü okur, yarım oluşturulmuş tabloyu asla görmez.
+
+        Args:
+            source (str, optional): Local zip or CSV file to load instead of downloading. / İndirmek yerine yüklenecek yerel zip veya CSV dosyası.
+            background (bool): Run the rebuild on a daemon thread. / Yeniden oluşturmayı arka plan iş parçacığında çalıştır.
+            source6 (str, optional): Local IPv6 zip or CSV file for the loaded IPv6 index. Without it the IPv6 database is downloaded again when source is not given either, and left as is otherwise. / Yüklü IPv6 indeksi için yerel IPv6 zip veya CSV dosyası. Verilmezse, source da verilmemişse IPv6 veritabanı yeniden indirilir, aksi halde olduğu gibi bırakılır.
+
+        Returns:
+            threading.Thread or bool: The refresh thread when background is True, otherwise whether the refresh succeeded. / background True ise yenileme iş parçacığı, değilse yenilemenin başarılı olup olmadığı.
+        """
+        if background:
+            thread = threading.Thread(target=self._refresh_database, args=(source, source6), name="IPGeolocationRefresh", daemon=True)
+            thread.start()
+            return thread
+        return self._refresh_database(source, source6)
+
+    def _refresh_database(self, source, source6=None):
+        with self._refresh_lock:
+            try:
+                # Build the IPv6 index first; it is swapped in with the IPv4 one under a single cache generation / Önce IPv6 indeksi oluşturulur; IPv4 ile birlikte tek önbellek kuşağında değiştirilir
+                index6 = None
+                if self.index6 is not None and (source6 is not None or source is None):
+                    if source6 is None:
+                        print("Downloading the IPv6 database file... / IPv6 veritabanı dosyasını indiriyor...")
+                        tmp_download = f"{self.download6_path}.tmp"
+                        request.urlretrieve(self.database6_url, tmp_download)
+                        os.replace(tmp_download, self.download6_path)
+                        source6 = self.download6_path
+                    index6 = self._build_range_index6(source6)
+
+                if source is None:
+                    print("Downloading the database file... / Veritabanı dosyasını indiriyor...")
+                    tmp_download = f"{self.download_path}.tmp"
+                    request.urlretrieve(self.database_url, tmp_download)
+                    os.replace(tmp_download, self.download_path)
+                    source = self.download_path
+
+                index = self.index
+                if isinstance(index, self.MappedIndex):
+                    self.MappedIndex.write(self._build_range_index(source=source), index.path)
+                    self.index = self.MappedIndex(index.path)
+                elif self.in_memory:
+                    self.index = self._build_range_index(source=source)
+                else:
+                    tmp_db = f"{self.db_file}.tmp"
+                    if os.path.exists(tmp_db):
+                        os.remove(tmp_db)
+                    self._build_sqlite_db(tmp_db, source).close()
+                    os.replace(tmp_db, self.db_file)
+
+                if index6 is not None:
+                    self.index6 = index6
+                self.cache_clear()
+                return True
+            except Exception as e:
+                print(f"An error occurred: {e} / Hata oluştu: {e}")
+                return False
+
+    def _memory_index(self, force_download=False):
+        if self.index is None or force_download:
+            self.load_memory_index(force_download)
+        return self.index
+
+    def get_ip_locations(self, ip_addresses, force_download=False):
+        """
+        Returns the country codes for many IPv4 addresses at once using the in-memory index. Uses a vectorized searchsorted when NumPy is installed and bisect otherwise.
+
+        Birden çok IPv4 adresinin ülke kodlarını bellek içi indeks ile tek seferde döndürür. NumPy kuruluysa vektörel searchsorted, değilse bisect kullanır.
+
+        Args:
+            ip_addresses (iterable): IPv4 strings or integers (NumPy integer scalars included), or a NumPy array of them. / IPv4 metinleri veya tam sayıları (NumPy tam sayı skalerleri dahil) ya da bunların NumPy dizisi.
+            force_download (bool): Whether to force the download of the zip file. / Zip dosyasını yeniden indirme zorunluluğu.
+
+        Returns:
+            list or numpy.ndarray: Country codes in input order, None where no range matches. A NumPy array input returns an object array. / Girdi sırasıyla ülke kodları, eşleşme yoksa None. NumPy girdisi object dizisi döndürür.
+        """
+        index = self._memory_index(force_download)
+
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+
+        if np is None:
+            return [code for _, code in self.iter_ip_locations(ip_addresses)]
+
+        is_ndarray = isinstance(ip_addresses, np.ndarray)
+        if is_ndarray and ip_addresses.dtype.kind in "iu":
+            ip_ints = ip_addresses.astype(np.int64, copy=False)
+        else:
+            to_int = self.ip_to_int
+            ip_ints = np.fromiter((int(ip) if isinstance(ip, numbers.Integral) else to_int(ip) for ip in ip_addresses), dtype=np.int64)
+
+        if not len(index):
+            result = np.full(len(ip_ints), None, dtype=object)
+            return result if is_ndarray else result.tolist()
+
+        starts, ends, country_idx = index.numpy_columns(np)
+        codes = np.array([country[0] for country in index.countries] + [None], dtype=object)
+
+        positions = np.searchsorted(starts, ip_ints, side="right") - 1
+        clipped = positions.clip(0)
+        found = (positions >= 0) & (ip_ints <= ends[clipped])
+        result = codes[np.where(found, country_idx[clipped], len(codes) - 1)]
+
+        return result if is_ndarray else result.tolist()
+
+    def iter_ip_locations(self, ip_addresses, force_download=False):
+        """
+        Lazily yields (ip_address, country_code) pairs from the in-memory index, for log pipelines.
+
+        Bellek içi indeksten (ip_adresi, ülke_kodu) çiftlerini tembel olarak üretir; log işleme hatları içindir.
+
+        Args:
+            ip_addresses (iterable): IPv4 strings or integers (NumPy integer scalars included). / IPv4 metinleri veya tam sayıları (NumPy tam sayı skalerleri dahil).
+            force_download (bool): Whether to force the download of the zip file. / Zip dosyasını yeniden indirme zorunluluğu.
+
+        Yields:
+            tuple: (ip_address, country_code or None)
+        """
+        index = self._memory_index(force_download)
+        starts, ends, country_idx = index.starts, index.ends, index.country_idx
+        codes = [country[0] for country in index.countries]
+        bisect_right = bisect.bisect_right
+        to_int = self.ip_to_int
+
+        for ip in ip_addresses:
+            ip_int = int(ip) if isinstance(ip, numbers.Integral) else to_int(ip)
+            i = bisect_right(starts, ip_int) - 1
+            yield ip, codes[country_idx[i]] if i >= 0 and ip_int <= ends[i] else None
+
+    def cache_info(self):
+        """
+        Returns the LRU cache statistics.
+
+        LRU önbellek istatistiklerini döndürür.
+
+        Returns:
+            dict: hits, misses, evictions, size, max_size and ttl. / İsabet, ıska, çıkarma, boyut, en büyük boyut ve ttl.
+        """
+        with self._cache_lock:
+            return {**self._cache_stats, "size": len(self._cache), "max_size": self.cache_size, "ttl": self.cache_ttl}
+
+    def cache_clear(self):
+        """
+        Drops every cached lookup result. Called automatically whenever the database is reloaded.
+
+        Önbellekteki tüm sorgu sonuçlarını siler. Veritabanı her yeniden yüklendiğinde otomatik çağrılır.
+        """
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_generation += 1
+
+    def get_ip_location(self, ip_address, force_download=False):
+        """
+        Returns the location information for the given IP address. When cache_size is set, results are served from an LRU cache keyed by the address as passed, so repeated lookups skip both the conversion and the database.
+
+        Verilen IP adresinin lokasyon bilgisini döndürür. cache_size verilmişse sonuçlar, verilen adresle anahtarlanan bir LRU önbellekten sunulur; tekrarlanan sorgular dönüşümü ve veritabanını atlar.
+
+        Args:
+            ip_address (str): The IP address to lookup. / Sorgulanacak IP adresi.
+            force_download (bool): Whether to force the download of the zip file. / Zip dosyasını yeniden indirme zorunluluğu.
+
+        Returns:
+            dict: The location information for the IP address. / IP adresinin lokasyon bilgisi.
+        """
+        if not self.cache_size:
+            return self._get_ip_location(ip_address, force_download)
+
+        generation = self._cache_generation
+        if not force_download:
+            with self._cache_lock:
+                entry = self._cache.get(ip_address)
+                if entry is not None and (self.cache_ttl is None or time.monotonic() - entry[1] < self.cache_ttl):
+                    self._cache.move_to_end(ip_address)
+                    self._cache_stats["hits"] += 1
+                    return dict(entry[0])
+                self._cache_stats["misses"] += 1
+
+        result = self._get_ip_location(ip_address, force_download)
+        if result is not None:
+            with self._cache_lock:
+                # Skip results computed against a snapshot that was swapped out meanwhile / Bu arada değiştirilen anlık görüntüden gelen sonucu saklama
+                if generation == self._cache_generation:
+                    self._cache[ip_address] = (result, time.monotonic())
+                    self._cache.move_to_end(ip_address)
+                    while len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+                        self._cache_stats["evictions"] += 1
+            result = dict(result)
+        return result
+
+    def _get_ip_location(self, ip_address, force_download=False):
+        try:
+            if ":" in ip_address:
+                ip_int = self.ip6_to_int(ip_address)
+                if ip_int >> 32 != 0xFFFF:
+                    if self.index6 is None or force_download:
+                        self.load_ipv6_index(force_download)
+                    country = self.index6.lookup(ip_int)
+                    if country:
+                        return {"status": True, "ip_address": ip_address, "ipint": ip_int, "country_code": country[0], "country_name": country[1]}
+                    else:
+                        return {"status": False, "ip_address": ip_address}
+
+                # IPv4-mapped ::ffff:a.b.c.d is answered from the IPv4 table / IPv4 eşlemeli adres IPv4 tablosundan yanıtlanır
+                ip_int &= 0xFFFFFFFF
+            else:
+                ip_int = self.ip_to_int(ip_address)
+
+            if self.in_memory:
+                index = self._memory_index(force_download)
+                country = index.lookup(ip_int)
+                if country:
+                    return {"status": True, "ip_address": ip_address, "ipint": ip_int, "country_code": country[0], "country_name": country[1]}
+                else:
+                    return {"status": False, "ip_address": ip_address}
+
+            # Create the SQLite database if it does not exist or if force download is requested
+            if not os.path.isfile(self.db_file) or force_download:
+                self.download_database(force_download, extract=False)
+                self.create_sqlite_db()
+
+            # Query the location information for the IP address
+            print("Querying the location information for the IP address... / IP adresinin lokasyon bilgisini sorguluyor...")
+            self.connection = sqlite3.connect(self.db_file)
+            self.cursor = self.connection.cursor()
+
+            # SQLite query
+            query = "SELECT * FROM ip_geolocation WHERE ip_end >= ? ORDER BY ip_end LIMIT 1"
+            self.cursor.execute(query, (ip_int,))
+            row = self.cursor.fetchone()
+            if row and row[0] <= ip_int:
+                return {"status": True, "ip_address": ip_address, "ipint": ip_int, "country_code": row[2], "country_name": row[3]}
+            else:
+                return {"status": False, "ip_address": ip_address}
+        except Exception as e:
+            print(f"An error occurred: {e} / Hata oluştu: {e}")
+            return None
+
+
+_PG_INT16 = struct.Struct("!h")
+_PG_INT32 = struct.Struct("!i")
+_PG_STATS_LOCK = threading.Lock()
+_PG_TIMESTAMP_RE = re.compile(r"(\d{4,})-(\d\d)-(\d\d)[ T](\d\d):(\d\d):(\d\d)(?:\.(\d{1,6}))?(?:([+-])(\d\d)(?::?(\d\d))?(?::?(\d\d))?)?$")
+_PG_TIME_RE = re.compile(r"(\d\d):(\d\d):(\d\d)(?:\.(\d{1,6}))?$")
+
+
+def _pg_bool(value):
+    return value == b"t"
+
+
+def _pg_bytea(value):
+    return bytes.fromhex(value[2:].decode()) if value.startswith(b"\\x") else value
+
+
+def _pg_date(value):
+    value = value.decode()
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return value  # infinity, BC dates / sonsuz, MÖ tarihleri
+
+
+def _pg_time(value):
+    value = value.decode()
+    match = _PG_TIME_RE.match(value)
+    if match is None:
+        return value
+    hour, minute, second, fraction = match.groups()
+    return datetime_time(int(hour), int(minute), int(second), int((fraction or "0").ljust(6, "0")))
+
+
+def _pg_timestamp(value):
+    value = value.decode()
+    match = _PG_TIMESTAMP_RE.match(value)
+    if match is None:
+        return value  # infinity, BC dates / sonsuz, MÖ tarihleri
+    year, month, day, hour, minute, second, fraction, sign, tz_hours, tz_minutes, tz_seconds = match.groups()
+    tzinfo = None
+    if sign:
+        offset = timedelta(hours=int(tz_hours), minutes=int(tz_minutes or 0), seconds=int(tz_seconds or 0))
+        tzinfo = timezone(-offset if sign == "-" else offset)
+    try:
+        return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second), int((fraction or "0").ljust(6, "0")), tzinfo)
+    except ValueError:
+        return value
+
+
+_PG_EPOCH = datetime(2000, 1, 1)
+_PG_EPOCH_UTC = datetime(2000, 1, 1, tzinfo=timezone.utc)
+_PG_INFINITY = {2 ** 63 - 1: "infinity", -2 ** 63: "-infinity", 2 ** 31 - 1: "infinity", -2 ** 31: "-infinity"}
+
+
+def _pg_binary_date(days):
+    try:
+        return _PG_EPOCH.date() + timedelta(days=days)
+    except OverflowError:
+        return _PG_INFINITY.get(days, days)
+
+
+def _pg_binary_timestamp(microseconds):
+    try:
+        return _PG_EPOCH + timedelta(microseconds=microseconds)
+    except OverflowError:
+        return _PG_INFINITY.get(microseconds, microseconds)
+
+
+def _pg_binary_timestamptz(microseconds):
+    try:
+        return _PG_EPOCH_UTC + timedelta(microseconds=microseconds)
+    except OverflowError:
+        return _PG_INFINITY.get(microseconds, microseconds)
+
+
+class CemirPostgreSQLError(Exception):
+    """
+    Error reported by the PostgreSQL server (ErrorResponse) or raised by the wire protocol client.
+
+    PostgreSQL sunucusunun bildirdiği (ErrorResponse) veya wire protokol istemcisinin fırlattığı hata.
+    """
+
+    def __init__(self, message, fields=None):
+        super().__init__(message)
+        self.fields = fields or {}
+        self.severity = self.fields.get("S")
+        self.code = self.fields.get("C")
+        self.detail = self.fields.get("D")
+
+
+class _CemirPostgreSQLProtocol:
+    """
+    I/O-free parts of the PostgreSQL v3 protocol shared by CemirPostgreSQLConnection and CemirPostgreSQLAsyncConnection: message encoding, row decoding, authentication steps and the prepared statement cache.
+
+    CemirPostgreSQLConnection ve CemirPostgreSQLAsyncConnection'ın paylaştığı, G/Ç içermeyen PostgreSQL v3 protokol parçaları: mesaj kodlama, satır çözme, kimlik doğrulama adımları ve hazır ifade önbelleği.
+    """
+
+    PROTOCOL_VERSION = 196608
+    SSL_REQUEST_CODE = 80877103
+
+    # Decoders for text-format values by type OID, taking the raw bytes / Metin biçimli değerler için tür OID'sine göre, ham baytları alan çözücüler
+    TEXT_DECODERS = {
+        16: _pg_bool, 17: _pg_bytea, 20: int, 21: int, 23: int, 26: int, 114: json.loads, 700: float, 701: float,
+        1082: _pg_date, 1083: _pg_time, 1114: _pg_timestamp, 1184: _pg_timestamp, 3802: json.loads,
+        1700: lambda value: Decimal(value.decode()), 2950: lambda value: uuid.UUID(value.decode()),
+    }
+
+    # Types requested in binary format when binary_results is on: (struct format for fixed-width values or None, per-value function or None).
+    # They decode to the same Python values as the text format; float4 and numeric stay text because their binary form would change the value or cost more to decode.
+    # binary_results açıkken ikili biçimde istenen türler: (sabit genişlikli değerler için struct biçimi veya None, değer başına fonksiyon veya None).
+    # Metin biçimiyle aynı Python değerlerine çözülürler; float4 ve numeric metin kalır, çünkü ikili biçimleri değeri değiştirir veya çözmesi daha pahalıdır.
+    BINARY_DECODERS = {
+        16: ("?", None), 17: (None, bytes), 20: ("!q", None), 21: ("!h", None), 23: ("!i", None), 26: ("!I", None), 701: ("!d", None),
+        1082: ("!i", _pg_binary_date), 1114: ("!q", _pg_binary_timestamp), 1184: ("!q", _pg_binary_timestamptz),
+        114: (None, json.loads), 3802: (None, lambda value: json.loads(value[1:])), 2950: (None, lambda value: uuid.UUID(bytes=value)),
+    }
+
+    class Result:
+        """
+        Columns, rows (tuples) and command tag of one statement.
+
+        Bir ifadenin kolonları, satırları (demetler) ve komut etiketi.
+        """
+
+        __slots__ = ("columns", "command", "arrays", "types", "_rows")
+
+        def __init__(self, columns=None, rows=None, command=None, arrays=None, types=None):
+            self.columns = columns
+            self.command = command
+            self.arrays = arrays
+            self.types = types
+            self._rows = rows if rows is not None or arrays is not None else []
+
+        @property
+        def rows(self):
+            """
+            Rows as tuples, built from the decoded columns on first access.
+
+            Demet olarak satırlar; ilk erişimde çözülmüş kolonlardan oluşturulur.
+            """
+            if self._rows is None:
+                self._rows = list(zip(*self.arrays))
+            return self._rows
+
+        @property
+        def rowcount(self):
+            """
+            Rows affected according to the command tag ("INSERT 0 5" -> 5), None when the tag has no count.
+
+            Komut etiketine göre etkilenen satır sayısı ("INSERT 0 5" -> 5), etikette sayı yoksa None.
+            """
+            count = (self.command or "").rsplit(" ", 1)[-1]
+            return int(count) if count.isdigit() else None
+
+        def dicts(self):
+            return [dict(zip(self.columns, row)) for row in self.rows]
+
+        def columnar(self):
+            """
+            Column name -> list of values, without building row tuples; suited to analytics reads.
+
+            Kolon adı -> değer listesi; satır demetleri oluşturulmaz, analitik okumalar için uygundur.
+            """
+            arrays = self.arrays
+            if arrays is None:
+                arrays = [list(values) for values in zip(*self.rows)] or [[] for _ in self.columns]
+            return dict(zip(self.columns, arrays))
+
+        def __repr__(self):
+            return f"Result(command={self.command!r}, columns={self.columns!r}, rows={len(self.rows)})"
+
+    def __init__(self, host, port, user, password, dbname, timeout=10, statement_cache_size=100, statement_stats=None, binary_results=False):
+        self.host = host
+        self.port = int(port)
+        self.user = user
+        self.password = password or ""
+        self.dbname = dbname
+        self.timeout = timeout
+        self.parameters = {}
+        self.backend_pid = None
+        self.backend_secret = None
+        self.transaction_status = None
+        self.statement_cache_size = statement_cache_size
+        self.statement_stats = statement_stats if statement_stats is not None else {"hits": 0, "misses": 0, "evictions": 0}
+        self.binary_results = binary_results
+        self._statements = OrderedDict()
+        self._formats = {}
+        self._statement_counter = 0
+        self._parsed = 0
+        self._transaction_depth = 0
+
+    def _startup_message(self, application_name):
+        params = {"user": self.user, "database": self.dbname, "client_encoding": "UTF8", "application_name": application_name}
+        payload = _PG_INT32.pack(self.PROTOCOL_VERSION) + b"".join(f"{key}\0{value}\0".encode() for key, value in params.items()) + b"\0"
+        return _PG_INT32.pack(len(payload) + 4) + payload
+
+    def _auth_step(self, code, body, scram):
+        """
+        Answers one AuthenticationRequest (code != 0); returns (message to send or None, SCRAM state).
+
+        Bir AuthenticationRequest'i (code != 0) yanıtlar; (gönderilecek mesaj veya None, SCRAM durumu) döndürür.
+        """
+        if code == 3:
+            return self._message(b"p", self.password.encode() + b"\0"), scram
+        elif code == 5:
+            inner = hashlib.md5((self.password + self.user).encode()).hexdigest().encode()
+            return self._message(b"p", b"md5" + hashlib.md5(inner + body[4:8]).hexdigest().encode() + b"\0"), scram
+        elif code == 10:
+            if b"SCRAM-SHA-256" not in body[4:].split(b"\0"):
+                raise CemirPostgreSQLError("Server offers no supported SASL mechanism / Sunucu desteklenen bir SASL mekanizması sunmuyor")
+            scram = {"nonce": base64.b64encode(os.urandom(18)).decode()}
+            scram["client_first_bare"] = f"n=,r={scram['nonce']}"
+            first = ("n,," + scram["client_first_bare"]).encode()
+            return self._message(b"p", b"SCRAM-SHA-256\0" + _PG_INT32.pack(len(first)) + first), scram
+        elif code == 11 and scram is not None:
+            server_first = body[4:].decode()
+            attributes = dict(item.split("=", 1) for item in server_first.split(","))
+            if not attributes["r"].startswith(scram["nonce"]):
+                raise CemirPostgreSQLError("SCRAM nonce mismatch / SCRAM nonce uyuşmazlığı")
+            salted = hashlib.pbkdf2_hmac("sha256", self.password.encode(), base64.b64decode(attributes["s"]), int(attributes["i"]))
+            client_key = hmac.new(salted, b"Client Key", hashlib.sha256).digest()
+            without_proof = f"c=biws,r={attributes['r']}"
+            auth_message = f"{scram['client_first_bare']},{server_first},{without_proof}".encode()
+            signature = hmac.new(hashlib.sha256(client_key).digest(), auth_message, hashlib.sha256).digest()
+            proof = base64.b64encode(bytes(a ^ b for a, b in zip(client_key, signature))).decode()
+            server_key = hmac.new(salted, b"Server Key", hashlib.sha256).digest()
+            scram["server_signature"] = base64.b64encode(hmac.new(server_key, auth_message, hashlib.sha256).digest()).decode()
+            return self._message(b"p", f"{without_proof},p={proof}".encode()), scram
+        elif code == 12 and scram is not None:
+            attributes = dict(item.split("=", 1) for item in body[4:].decode().split(","))
+            if not hmac.compare_digest(attributes.get("v", ""), scram["server_signature"]):
+                raise CemirPostgreSQLError("SCRAM server signature mismatch / SCRAM sunucu imzası uyuşmazlığı")
+        else:
+            raise CemirPostgreSQLError(f"Unsupported authentication method: {code} / Desteklenmeyen kimlik doğrulama yöntemi")
+        return None, scram
+
+    @staticmethod
+    def _message(kind, payload):
+        return kind + _PG_INT32.pack(len(payload) + 4) + payload
+
+    @staticmethod
+    def _error(body):
+        fields = {item[:1].decode(): item[1:].decode("utf-8", "replace") for item in body.split(b"\0") if item}
+        message = f"{fields.get('S', 'ERROR')}: {fields.get('M', '')}"
+        if fields.get("D"):
+            message += f"\nDETAIL: {fields['D']}"
+        return CemirPostgreSQLError(message, fields)
+
+    def _row_description(self, body):
+        """
+        Returns column names, type OIDs and a decoder per column, chosen by the format code the server reports.
+
+        Kolon adlarını, tür OID'lerini ve sunucunun bildirdiği biçim koduna göre seçilen kolon başına çözücüyü döndürür.
+        """
+        (count,) = _PG_INT16.unpack_from(body)
+        columns, types, decoders = [], [], []
+        position = 2
+        for _ in range(count):
+            end = body.index(b"\0", position)
+            columns.append(body[position:end].decode())
+            type_oid = _PG_INT32.unpack_from(body, end + 7)[0]
+            types.append(type_oid)
+            if _PG_INT16.unpack_from(body, end + 17)[0] == 1:
+                decoders.append(self.BINARY_DECODERS[type_oid])
+            else:
+                decoders.append((None, self.TEXT_DECODERS.get(type_oid, bytes.decode)))
+            position = end + 19
+        return columns, types, decoders
+
+    @staticmethod
+    def _decode_column(values, decoder):
+        unpack, function = decoder
+        if unpack is None:
+            return [None if value is None else function(value) for value in values]
+
+        # Fixed-width values are unpacked for the whole column in one struct.iter_unpack call / Sabit genişlikli değerler tüm kolon için tek struct.iter_unpack çağrısıyla açılır
+        present = [value for value in values if value is not None] if None in values else values
+        decoded = [item for (item,) in struct.iter_unpack(unpack, b"".join(present))]
+        if function is not None:
+            decoded = list(map(function, decoded))
+        if present is values:
+            return decoded
+        decoded = iter(decoded)
+        return [None if value is None else next(decoded) for value in values]
+
+    @classmethod
+    def _decode_columns(cls, bodies, decoders):
+        """
+        Splits DataRow bodies into per-column raw values and decodes each column in one pass.
+
+        DataRow gövdelerini kolon başına ham değerlere ayırır ve her kolonu tek geçişte çözer.
+        """
+        if bodies and all(unpack is not None for unpack, _ in decoders):
+            # Only fixed-width binary columns: rows without NULLs all have the same length, so each column is unpacked straight from the joined rows with a strided struct / Yalnızca sabit genişlikli ikili kolonlar: NULL içermeyen satırlar aynı uzunluktadır, her kolon birleştirilmiş satırlardan adımlı bir struct ile doğrudan açılır
+            formats = [unpack.lstrip("!") for unpack, _ in decoders]
+            row_size = 2 + sum(4 + struct.calcsize("!" + fmt) for fmt in formats)
+            if all(len(body) == row_size for body in bodies):
+                data, arrays, offset = b"".join(bodies), [], 2
+                for fmt, (_, function) in zip(formats, decoders):
+                    offset += 4
+                    size = struct.calcsize("!" + fmt)
+                    column = [value for (value,) in struct.iter_unpack(f"!{offset}x{fmt}{row_size - offset - size}x", data)]
+                    arrays.append(list(map(function, column)) if function is not None else column)
+                    offset += size
+                return arrays
+
+        arrays = [[] for _ in decoders]
+        unpack_from = _PG_INT32.unpack_from
+        for body in bodies:
+            position = 2
+            for array in arrays:
+                (size,) = unpack_from(body, position)
+                position += 4
+                if size < 0:
+                    array.append(None)
+                else:
+                    array.append(body[position:position + size])
+                    position += size
+        return [cls._decode_column(array, decoder) for array, decoder in zip(arrays, decoders)]
+
+    @staticmethod
+    def _encode_param(value):
+        if value is None:
+            return None
+        if isinstance(value, bool):
+            return b"t" if value else b"f"
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return b"\\x" + bytes(value).hex().encode()
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, ensure_ascii=False).encode()
+        if isinstance(value, (datetime, date, datetime_time)):
+            return value.isoformat().encode()
+        return str(value).encode()
+
+    @classmethod
+    def _bind_message(cls, portal, statement, params, result_formats=b"\0\0"):
+        parts = [portal.encode(), b"\0", statement.encode(), b"\0", _PG_INT16.pack(0), _PG_INT16.pack(len(params))]
+        for value in params:
+            encoded = cls._encode_param(value)
+            if encoded is None:
+                parts.append(_PG_INT32.pack(-1))
+            else:
+                parts.append(_PG_INT32.pack(len(encoded)))
+                parts.append(encoded)
+        parts.append(result_formats)
+        return cls._message(b"B", b"".join(parts))
+
+    def _count(self, key):
+        with _PG_STATS_LOCK:  # statement_stats may be shared by pooled connections / statement_stats havuzdaki bağlantılarca paylaşılabilir
+            self.statement_stats[key] += 1
+
+    def _statement(self, sql):
+        """
+        Returns (statement name, messages to send before Bind, cache hit) for sql. On a miss a named statement is parsed and cached; the least recently used one is closed when the cache is full.
+
+        sql için (ifade adı, Bind'dan önce gönderilecek mesajlar, önbellek isabeti) döndürür. Iskalamada isimli bir ifade ayrıştırılıp önbelleğe alınır; önbellek doluysa en eski kullanılan kapatılır.
+        """
+        if not self.statement_cache_size:
+            return "", self._message(b"P", b"\0" + sql.encode() + b"\0" + _PG_INT16.pack(0)), False
+
+        name = self._statements.get(sql)
+        if name is not None:
+            self._statements.move_to_end(sql)
+            self._count("hits")
+            return name, b"", True
+
+        self._count("misses")
+        self._statement_counter += 1
+        name = f"cemir_{self._statement_counter}"
+        messages = self._message(b"P", name.encode() + b"\0" + sql.encode() + b"\0" + _PG_INT16.pack(0))
+        self._statements[sql] = name
+        if len(self._statements) > self.statement_cache_size:
+            _, evicted = self._statements.popitem(last=False)
+            self._formats.pop(evicted, None)
+            messages = self._message(b"C", b"S" + evicted.encode() + b"\0") + messages
+            self._count("evictions")
+        self._parsed = 0
+        return name, messages, False
+
+    def _uncache(self, sql, cached, invalid):
+        """
+        Drops sql from the cache after an error if its Parse failed (nothing was prepared) or the cached plan became invalid. Returns the statement name to close on the server, or None.
+
+        Hata sonrasında Parse başarısız olduysa (hiçbir şey hazırlanmadıysa) veya önbellekteki plan geçersizleştiyse sql'i önbellekten çıkarır. Sunucuda kapatılacak ifade adını veya None döndürür.
+        """
+        name = self._statements.get(sql)
+        if name is None or (cached and not invalid) or (not cached and self._parsed):
+            return None
+        del self._statements[sql]
+        self._formats.pop(name, None)
+        return name if cached else None
+
+    def _result_formats(self, name):
+        """
+        Encoded result format codes for Bind: binary for the columns of a cached statement whose types have a binary decoder, text otherwise.
+
+        Bind için kodlanmış sonuç biçim kodları: önbellekteki ifadenin ikili çözücüsü olan türdeki kolonları için ikili, diğerleri için metin.
+        """
+        return self._formats.get(name, b"\0\0") if self.binary_results else b"\0\0"
+
+    def _remember_formats(self, sql, name, types):
+        """
+        Records the column types of a cached statement after its first run, so the following runs can ask for binary results.
+
+        Önbellekteki ifadenin kolon türlerini ilk çalıştırmadan sonra kaydeder; sonraki çalıştırmalar ikili sonuç isteyebilir.
+        """
+        if not self.binary_results or name in self._formats or self._statements.get(sql) != name:
+            return
+        codes = [1 if type_oid in self.BINARY_DECODERS else 0 for type_oid in types or ()]
+        self._formats[name] = _PG_INT16.pack(len(codes)) + b"".join(map(_PG_INT16.pack, codes)) if any(codes) else b"\0\0"
+
+    def _pipeline_messages(self, statements):
+        """
+        Encodes Parse (on cache misses), Bind, Describe and Execute for each (sql, params) pair followed by a single Sync. Returns (data, lookups, known) for _pipeline_done.
+
+        Her (sql, params) çifti için Parse (önbellek ıskalamalarında), Bind, Describe ve Execute mesajlarını ve ardından tek bir Sync kodlar. _pipeline_done için (veri, aramalar, bilinen adlar) döndürür.
+        """
+        known = set(self._statements.values())
+        messages, lookups = [], []
+        for sql, params in statements:
+            name, parse, cached = self._statement(sql)
+            known.add(name)
+            lookups.append((sql, name, cached))
+            messages += (parse, self._bind_message("", name, params, self._result_formats(name)), self._message(b"D", b"P\0"), self._message(b"E", b"\0" + _PG_INT32.pack(0)))
+        self._parsed = 0
+        return b"".join(messages) + self._message(b"S", b""), lookups, known
+
+    def _pipeline_done(self, lookups, known, results, error):
+        """
+        Updates the statement cache after a pipeline: remembers result formats when it succeeded, drops the statements that were never prepared and an invalidated cached plan when it failed. Returns the statement names to close on the server.
+
+        Pipeline sonrasında ifade önbelleğini günceller: başarılıysa sonuç biçimlerini kaydeder, başarısızsa hiç hazırlanmamış ifadeleri ve geçersizleşen önbellek planını çıkarır. Sunucuda kapatılacak ifade adlarını döndürür.
+        """
+        if error is None:
+            for (sql, name, _), result in zip(lookups, results):
+                self._remember_formats(sql, name, result.types)
+            return []
+
+        # Everything after the failed statement was skipped, including Parse and the Close of evicted statements / Başarısız ifadeden sonraki her şey, Parse ve çıkarılan ifadelerin Close mesajları dahil, atlandı
+        misses = [(sql, name) for sql, name, cached in lookups if not cached and name]
+        for sql, name in misses[self._parsed:]:
+            if self._statements.get(sql) == name:
+                del self._statements[sql]
+        if len(results) < len(lookups):
+            sql, name, cached = lookups[len(results)]
+            if cached and error.code == "0A000" and self._statements.get(sql) == name:
+                del self._statements[sql]
+                self._formats.pop(name, None)
+        return sorted(known.difference(self._statements.values(), [""]))
+
+    def _transaction_commands(self):
+        """
+        (start, commit, rollback) SQL of a transaction() block: BEGIN/COMMIT/ROLLBACK when no transaction is open, otherwise a savepoint named after the nesting depth.
+
+        transaction() bloğunun (başlat, onayla, geri al) SQL'i: açık işlem yoksa BEGIN/COMMIT/ROLLBACK, varsa iç içe derinliğe göre adlandırılan bir savepoint.
+        """
+        if self.transaction_status == "I" and not self._transaction_depth:
+            return "BEGIN", "COMMIT", "ROLLBACK"
+        name = f"cemir_savepoint_{self._transaction_depth}"
+        return f"SAVEPOINT {name}", f"RELEASE SAVEPOINT {name}", f"ROLLBACK TO SAVEPOINT {name}; RELEASE SAVEPOINT {name}"
+
+
+class CemirPostgreSQLBatch:
+    """
+    Statements collected with execute() and sent together, inside one transaction, as a single pipeline (one Sync), so N statements cost one round trip and one commit instead of N. Statements in a savepoint() block may fail without failing the batch: the block is rolled back to its savepoint and the rest of the batch goes on in another round trip. Any other error rolls the whole batch back.
+
+    execute() ile toplanan ve tek bir işlem içinde tek bir pipeline (tek Sync) olarak birlikte gönderilen ifadeler; N ifade N yerine tek gidiş-dönüş ve tek commit sürer. savepoint() bloğundaki ifadeler batch'i başarısız kılmadan hata verebilir: blok savepoint'ine geri alınır ve batch'in kalanı bir sonraki gidiş-dönüşte devam eder. Diğer hatalar tüm batch'i geri alır.
+
+    Örnek/Example:
+        with db.batch() as batch:
+            batch.execute("INSERT INTO users (name) VALUES ($1)", ("Cem",))
+            with batch.savepoint():
+                batch.execute("INSERT INTO emails (email) VALUES ($1)", ("cem@example.com",))
+        print(batch.results)
+    """
+
+    def __init__(self, run=None):
+        """
+        Args:
+            run (callable, optional): run() tarafından batch ile çağrılır; db.batch() bunu havuzdaki bir bağlantıya bağlar / Called with the batch by run(); db.batch() binds it to a pooled connection.
+        """
+        self.statements = []
+        self.results = None
+        self._run = run
+        self._operations = []
+        self._savepoints = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.run()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            await self.run()
+
+    def __len__(self):
+        return len(self.statements)
+
+    def execute(self, sql, params=()):
+        """
+        Batch'e bir ifade ekler; run() çağrılana kadar hiçbir şey gönderilmez.
+        Adds a statement to the batch; nothing is sent until run().
+
+        Args:
+            sql (str): $1, $2 yer tutuculu SQL / SQL with $1, $2 placeholders.
+            params (tuple, optional): Parametre değerleri / Parameter values.
+
+        Returns:
+            int: İfadenin results içindeki sırası / The statement's index in results.
+        """
+        self._operations.append((sql, params, len(self.statements), tuple(self._savepoints)))
+        self.statements.append((sql, params))
+        return len(self.statements) - 1
+
+    @contextmanager
+    def savepoint(self):
+        """
+        with bloğunda eklenen ifadeler bir savepoint altında çalışır. Biri başarısız olursa blok geri alınır, başarısız ifadenin sonucu hata olur, bloktaki sonraki ifadeler çalışmaz (None) ve batch devam eder. Bloklar iç içe kullanılabilir.
+        Statements added in the with block run under a savepoint. If one fails, the block is rolled back, the failed statement's result is the error, the statements after it in the block are not run (None) and the batch goes on. Blocks nest.
+        """
+        name = f"cemir_batch_{len(self._savepoints) + 1}"
+        self._operations.append((f"SAVEPOINT {name}", (), None, tuple(self._savepoints)))
+        self._savepoints.append(name)
+        try:
+            yield self
+        finally:
+            self._operations.append((f"RELEASE SAVEPOINT {name}", (), None, tuple(self._savepoints)))
+            self._savepoints.pop()
+
+    def run(self):
+        """
+        Batch'i oluştururken verilen fonksiyonla çalıştırır; with bloğundan çıkışta da çağrılır.
+        Runs the batch with the function given at construction; also called on leaving the with block.
+
+        Returns:
+            list: İfade başına sonuçlar (self.results) / Per-statement results (self.results).
+        """
+        if self._run is None:
+            raise CemirPostgreSQLError("Batch is not bound to a connection, use connection.run_batch(batch) / Batch bir bağlantıya bağlı değil, connection.run_batch(batch) kullanın")
+        return self._run(self)
+
+    def _plan(self, transaction):
+        # BEGIN/COMMIT are sent in the same pipeline as the statements / BEGIN/COMMIT ifadelerle aynı pipeline'da gönderilir
+        if not transaction:
+            return list(self._operations)
+        return [("BEGIN", (), None, ())] + self._operations + [("COMMIT", (), None, ())]
+
+    def _resume(self, operations, done, error, results):
+        """
+        Stores the results of a sent pipeline and returns the operations to send next: [] when the batch finished, a rollback to the innermost savepoint followed by the rest of the batch when a statement in a savepoint block failed, or None when the error fails the batch.
+
+        Gönderilen pipeline'ın sonuçlarını kaydeder ve sonra gönderilecek işlemleri döndürür: batch bittiyse [], savepoint bloğundaki bir ifade başarısız olduysa en içteki savepoint'e geri dönüş ve batch'in kalanı, hata batch'i başarısız kılıyorsa None.
+        """
+        for (_, _, index, _), result in zip(operations, done):
+            if index is not None:
+                results[index] = result
+        if error is None:
+            return []
+        if len(done) >= len(operations) or not operations[len(done)][3]:
+            return None
+
+        _, _, index, savepoints = operations[len(done)]
+        if index is not None:
+            results[index] = error
+        name = savepoints[-1]
+        release = f"RELEASE SAVEPOINT {name}"
+        end = next(position for position in range(len(done) + 1, len(operations)) if operations[position][0] == release and operations[position][3] == savepoints)
+        return [(f"ROLLBACK TO SAVEPOINT {name}", (), None, savepoints[:-1])] + operations[end:]
+
+
+class CemirPostgreSQLConnection(_CemirPostgreSQLProtocol):
+    """
+    Pure-Python PostgreSQL v3 wire protocol connection: startup, cleartext/MD5/SCRAM-SHA-256 authentication, simple and extended query, and rows decoded to Python types by column type. It needs no client library or psql binary. A connection runs one query at a time.
+
+    Saf Python PostgreSQL v3 wire protokol bağlantısı: başlangıç, düz metin/MD5/SCRAM-SHA-256 kimlik doğrulama, basit ve genişletilmiş sorgu, kolon türüne göre Python türlerine çözülen satırlar. İstemci kütüphanesi veya psql gerektirmez. Bir bağlantı aynı anda tek sorgu çalıştırır.
+    """
+
+    COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\n": "\\n", "\r": "\\r", "\t": "\\t"})
+
+    def __init__(self, host, port, user, password, dbname, timeout=10, ssl_context=None, application_name="CemirUtils", statement_cache_size=100, statement_stats=None, binary_results=False):
+        """
+        Opens the connection and authenticates.
+
+        Bağlantıyı açar ve kimlik doğrular.
+
+        Args:
+            host (str): Veritabanı hostu, unix soketi için dizin / Database host, or a directory for a unix socket.
+            port (int): Veritabanı portu / Database port.
+            user (str): Veritabanı kullanıcısı / Database user.
+            password (str): Veritabanı şifresi / Database password.
+            dbname (str): Veritabanı adı / Database name.
+            timeout (float, optional): Soket zaman aşımı / Socket timeout. Default is 10.
+            ssl_context (ssl.SSLContext, optional): Verilirse bağlantı TLS'e yükseltilir / Upgrade the connection to TLS when given.
+            application_name (str, optional): Sunucuya bildirilen uygulama adı / Application name reported to the server.
+            statement_cache_size (int, optional): SQL metnine göre önbelleğe alınan hazır ifade sayısı, 0 kapatır / Prepared statements cached by SQL text, 0 disables. Default is 100.
+            statement_stats (dict, optional): hits/misses/evictions sayaçları; bağlantılar arasında paylaşılabilir / hits/misses/evictions counters, may be shared between connections.
+            binary_results (bool, optional): Önbellekteki ifadeler ilk çalıştırmadan sonra BINARY_DECODERS türlerini ikili biçimde ister / Cached statements ask for BINARY_DECODERS types in binary format after their first run. Default is False.
+
+        Raises:
+            CemirPostgreSQLError: Kimlik doğrulama veya başlangıç hatası / Authentication or startup error.
+            OSError: Bağlantı hatası / Connection error.
+        """
+        super().__init__(host, port, user, password, dbname, timeout, statement_cache_size, statement_stats, binary_results)
+        self._sock = None
+        self._rfile = None
+        self._connect(ssl_context, application_name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def closed(self):
+        return self._sock is None
+
+    def close(self):
+        """
+        Sends Terminate and closes the socket.
+
+        Terminate gönderir ve soketi kapatır.
+        """
+        if self._sock is None:
+            return
+        try:
+            self._sock.sendall(b"X\x00\x00\x00\x04")
+        except OSError:
+            pass
+        self._abort()
+
+    def _abort(self):
+        sock, self._sock = self._sock, None
+        if sock is not None:
+            self._rfile.close()
+            sock.close()
+
+    def _connect(self, ssl_context, application_name):
+        if self.host.startswith("/"):
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            sock.connect(os.path.join(self.host, f".s.PGSQL.{self.port}"))
+        else:
+            sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        try:
+            if ssl_context is not None:
+                sock.sendall(_PG_INT32.pack(8) + _PG_INT32.pack(self.SSL_REQUEST_CODE))
+                if sock.recv(1) != b"S":
+                    raise CemirPostgreSQLError("Server does not accept SSL / Sunucu SSL kabul etmiyor")
+                sock = ssl_context.wrap_socket(sock, server_hostname=self.host)
+
+            self._sock = sock
+            self._rfile = sock.makefile("rb")
+            sock.sendall(self._startup_message(application_name))
+
+            self._authenticate()
+            while True:
+                kind, body = self._receive()
+                if kind == b"K":
+                    self.backend_pid, self.backend_secret = struct.unpack("!ii", body)
+                elif kind == b"E":
+                    raise self._error(body)
+                elif kind == b"Z":
+                    self.transaction_status = body[:1].decode()
+                    return
+        except BaseException:
+            self._sock = sock
+            self._abort()
+            raise
+
+    def _authenticate(self):
+        scram = None
+        while True:
+            kind, body = self._receive()
+            if kind == b"E":
+                raise self._error(body)
+            if kind != b"R":
+                raise CemirPostgreSQLError(f"Unexpected message during authentication: {kind!r} / Kimlik doğrulama sırasında beklenmeyen mesaj")
+
+            (code,) = _PG_INT32.unpack_from(body)
+            if code == 0:
+                return
+            message, scram = self._auth_step(code, body, scram)
+            if message is not None:
+                self._send(message)
+
+    def _send(self, data):
+        if self._sock is None:
+            raise CemirPostgreSQLError("Connection is closed / Bağlantı kapalı")
+        try:
+            self._sock.sendall(data)
+        except OSError:
+            self._abort()
+            raise
+
+    def _receive(self):
+        """
+        Reads the next message, handling ParameterStatus, NoticeResponse and NotificationResponse in between.
+
+        Bir sonraki mesajı okur; aradaki ParameterStatus, NoticeResponse ve NotificationResponse mesajlarını işler.
+        """
+        try:
+            while True:
+                header = self._rfile.read(5)
+                if len(header) < 5:
+                    raise ConnectionResetError("Connection closed by the server / Bağlantı sunucu tarafından kapatıldı")
+                kind = header[:1]
+                (length,) = _PG_INT32.unpack_from(header, 1)
+                body = self._rfile.read(length - 4)
+                if len(body) < length - 4:
+                    raise ConnectionResetError("Connection closed by the server / Bağlantı sunucu tarafından kapatıldı")
+
+                if kind == b"S":
+                    name, value = body.split(b"\0")[:2]
+                    self.parameters[name.decode()] = value.decode()
+                elif kind not in (b"N", b"A"):
+                    return kind, body
+        except OSError:
+            self._abort()
+            raise
+
+    def _read_results(self):
+        """
+        Reads messages up to ReadyForQuery; returns one Result per completed statement and the server error, if any.
+
+        ReadyForQuery'ye kadar mesajları okur; tamamlanan her ifade için bir Result ve varsa sunucu hatasını döndürür.
+        """
+        results, error = [], None
+        columns, types, decoders, rows = None, None, None, []
+        while True:
+            kind, body = self._receive()
+            if kind == b"D":
+                rows.append(body)
+            elif kind == b"T":
+                columns, types, decoders = self._row_description(body)
+                rows = []
+            elif kind == b"C":
+                arrays = self._decode_columns(rows, decoders) if columns is not None else None
+                results.append(self.Result(columns, None, body[:-1].decode(), arrays, types))
+                columns, types, decoders, rows = None, None, None, []
+            elif kind == b"I":
+                results.append(self.Result())
+            elif kind == b"1":
+                self._parsed += 1
+            elif kind == b"E":
+                error = self._error(body)
+            elif kind == b"G":
+                self._send(self._message(b"f", "COPY FROM STDIN is not supported by this call / COPY FROM STDIN bu çağrıda desteklenmiyor\0".encode()))
+            elif kind == b"Z":
+                self.transaction_status = body[:1].decode()
+                return results, error
+
+    def _collect(self):
+        """
+        Like _read_results, but raises the server error after ReadyForQuery so the connection stays usable.
+
+        _read_results gibi, ancak sunucu hatasını ReadyForQuery'den sonra fırlatır; böylece bağlantı kullanılabilir kalır.
+        """
+        results, error = self._read_results()
+        if error is not None:
+            raise error
+        return results
+
+    def simple_query(self, sql):
+        """
+        Runs one or more ;-separated statements with the simple query protocol.
+
+        Bir veya daha fazla ; ile ayrılmış ifadeyi basit sorgu protokolüyle çalıştırır.
+
+        Args:
+            sql (str): SQL sorgusu / SQL query.
+
+        Returns:
+            list: Her ifade için bir Result / One Result per statement.
+
+        Raises:
+            CemirPostgreSQLError: Sunucu hatası / Server error.
+        """
+        self._send(self._message(b"Q", sql.encode() + b"\0"))
+        return self._collect()
+
+    def _close_statements(self, names):
+        if names and not self.closed:
+            self._send(b"".join(self._message(b"C", b"S" + name.encode() + b"\0") for name in names) + self._message(b"S", b""))
+            self._read_results()
+
+    def _forget_statement(self, sql, cached, invalid):
+        name = self._uncache(sql, cached, invalid)
+        self._close_statements([name] if name is not None else [])
+
+    def execute(self, sql, params=()):
+        """
+        Runs a single statement with the extended query protocol, sending params separately from the SQL ($1, $2, ...). The statement is prepared once per connection and reused from an LRU cache keyed by the SQL text, so repeated queries skip parsing and planning.
+
+        Tek bir ifadeyi genişletilmiş sorgu protokolüyle çalıştırır; parametreler SQL'den ayrı gönderilir ($1, $2, ...). İfade bağlantı başına bir kez hazırlanır ve SQL metnine göre anahtarlanan LRU önbellekten yeniden kullanılır; tekrarlanan sorgular ayrıştırma ve planlamayı atlar.
+
+        Args:
+            sql (str): $1, $2 yer tutuculu SQL / SQL with $1, $2 placeholders.
+            params (tuple, optional): Parametre değerleri; dict/list JSON olarak gönderilir / Parameter values; dict/list are sent as JSON.
+
+        Returns:
+            Result: İfadenin sonucu / The statement's result.
+
+        Raises:
+            CemirPostgreSQLError: Sunucu hatası / Server error.
+        """
+        name, messages, cached = self._statement(sql)
+        self._send(
+            messages
+            + self._bind_message("", name, params, self._result_formats(name))
+            + self._message(b"D", b"P\0")
+            + self._message(b"E", b"\0" + _PG_INT32.pack(0))
+            + self._message(b"S", b"")
+        )
+        try:
+            results = self._collect()
+        except CemirPostgreSQLError as e:
+            self._forget_statement(sql, cached, e.code == "0A000")
+            if cached and e.code == "0A000" and self.transaction_status == "I":
+                return self.execute(sql, params)  # "cached plan must not change result type": prepare again / önbellekteki plan geçersiz: yeniden hazırla
+            raise
+        result = results[-1] if results else self.Result()
+        self._remember_formats(sql, name, result.types)
+        return result
+
+    def _pipeline(self, statements):
+        data, lookups, known = self._pipeline_messages(statements)
+        self._send(data)
+        results, error = self._read_results()
+        self._close_statements(self._pipeline_done(lookups, known, results, error))
+        return results, error
+
+    def pipeline(self, statements):
+        """
+        Sends several statements with the extended query protocol (Parse/Bind/Describe/Execute each) followed by a single Sync, then reads every result, so N statements cost about one round trip. Like a multi-statement simple query, they run in one implicit transaction: if one fails, the statements before it are rolled back too and the error is raised.
+
+        Birden çok ifadeyi genişletilmiş sorgu protokolüyle (her biri Parse/Bind/Describe/Execute) ve ardından tek bir Sync ile gönderir, sonra tüm sonuçları okur; N ifade yaklaşık tek gidiş-dönüş sürer. Çok ifadeli basit sorgu gibi tek bir örtük işlemde çalışırlar: biri başarısız olursa öncekiler de geri alınır ve hata fırlatılır.
+
+        Args:
+            statements (iterable): SQL metinleri veya (sql, params) çiftleri / SQL strings or (sql, params) pairs.
+
+        Returns:
+            list: Sırayla her ifade için bir Result / One Result per statement, in order.
+
+        Raises:
+            CemirPostgreSQLError: Sunucu hatası / Server error.
+        """
+        statements = [(statement, ()) if isinstance(statement, str) else statement for statement in statements]
+        if not statements:
+            return []
+        results, error = self._pipeline(statements)
+        if error is not None:
+            raise error
+        return results
+
+    @contextmanager
+    def transaction(self):
+        """
+        Runs the with block in a transaction: COMMIT when it succeeds, ROLLBACK when it raises. Inside an open transaction the block uses a savepoint instead, so transaction() blocks nest.
+
+        with bloğunu bir işlemde çalıştırır: başarılı biterse COMMIT, hata fırlatırsa ROLLBACK. Açık bir işlemin içinde blok bunun yerine savepoint kullanır; böylece transaction() blokları iç içe kullanılabilir.
+
+        Örnek/Example:
+            with conn.transaction():
+                conn.execute("UPDATE accounts SET balance = balance - $1 WHERE id = $2", (100, 1))
+                with conn.transaction():  # savepoint
+                    conn.execute("INSERT INTO audit (account_id) VALUES ($1)", (1,))
+
+        Raises:
+            CemirPostgreSQLError: Sunucu hatası veya bloktaki başarısız bir ifade yüzünden geri alınan işlem / Server error, or a transaction rolled back because a statement in the block failed.
+        """
+        start, commit, rollback = self._transaction_commands()
+        self.simple_query(start)
+        self._transaction_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._transaction_depth -= 1
+            if not self.closed:
+                try:
+                    self.simple_query(rollback)
+                except Exception:
+                    pass  # Re-raise the block's error, not the rollback's; the pool drops or rolls back the connection on release / Geri alma hatası değil bloğun hatası fırlatılır; havuz bağlantıyı geri verilirken atar veya geri alır
+            raise
+        self._transaction_depth -= 1
+        if self.simple_query(commit)[-1].command == "ROLLBACK":
+            raise CemirPostgreSQLError("Transaction was rolled back because a statement in it failed / İçindeki bir ifade başarısız olduğu için işlem geri alındı")
+
+    def run_batch(self, batch):
+        """
+        Runs a CemirPostgreSQLBatch as one pipeline inside BEGIN ... COMMIT (or inside the open transaction), so the whole batch costs one round trip and one commit. A failed statement in a savepoint block costs one more round trip to roll the block back and go on.
+
+        Bir CemirPostgreSQLBatch'i BEGIN ... COMMIT içinde (veya açık işlemin içinde) tek pipeline olarak çalıştırır; tüm batch tek gidiş-dönüş ve tek commit sürer. Savepoint bloğundaki başarısız bir ifade, bloğu geri alıp devam etmek için bir gidiş-dönüş daha sürer.
+
+        Args:
+            batch (CemirPostgreSQLBatch): Çalıştırılacak batch / The batch to run.
+
+        Returns:
+            list: İfade başına Result, savepoint bloğunda başarısız olan ifade için CemirPostgreSQLError, çalışmayan ifadeler için None / Per statement a Result, the CemirPostgreSQLError of a statement that failed in a savepoint block, or None for statements that did not run.
+
+        Raises:
+            CemirPostgreSQLError: Savepoint bloğu dışındaki hata; batch geri alınır / Error outside a savepoint block; the batch is rolled back.
+        """
+        transaction = self.transaction_status == "I"
+        operations = batch._plan(transaction) if batch.statements else []
+        results = [None] * len(batch.statements)
+        while operations:
+            done, error = self._pipeline([operation[:2] for operation in operations])
+            operations = batch._resume(operations, done, error, results)
+            if operations is None:
+                if transaction and not self.closed and self.transaction_status != "I":
+                    self.simple_query("ROLLBACK")
+                raise error
+        batch.results = results
+        return results
+
+    def _sync(self):
+        """
+        Sends Sync and skips everything up to ReadyForQuery; used to leave a query that was not read to the end.
+
+        Sync gönderir ve ReadyForQuery'ye kadar her şeyi atlar; sonuna kadar okunmayan bir sorgudan çıkmak için kullanılır.
+        """
+        self._send(self._message(b"S", b""))
+        while True:
+            kind, body = self._receive()
+            if kind == b"Z":
+                self.transaction_status = body[:1].decode()
+                return
+
+    def stream(self, sql, params=(), batch_size=1000):
+        """
+        Sorguyu isimsiz bir portal üzerinden çalıştırır ve satırları batch_size'lık gruplar halinde çeker (satır sınırlı Execute); bellek kullanımı sınırlı kalır. Üreteç erken kapatılırsa portal kapatılır.
+        Runs a query through an unnamed portal and fetches rows batch_size at a time (Execute with a row limit), so memory stays bounded. Closing the generator early closes the portal.
+
+        Args:
+            sql (str): $1, $2 yer tutuculu SQL / SQL with $1, $2 placeholders.
+            params (tuple, optional): Parametre değerleri / Parameter values.
+            batch_size (int, optional): Sunucudan her seferde çekilen satır / Rows fetched from the server per round trip. Default is 1000.
+
+        Yields:
+            Result: Her grup için kolonlar ve satırlar; son grup komut etiketini taşır / Columns and rows per batch; the last batch carries the command tag.
+
+        Raises:
+            CemirPostgreSQLError: Sunucu hatası / Server error.
+        """
+        fetch = self._message(b"E", b"\0" + _PG_INT32.pack(batch_size)) + self._message(b"H", b"")
+        name, messages, cached = self._statement(sql)
+        self._send(messages + self._bind_message("", name, params, self._result_formats(name)) + self._message(b"D", b"P\0") + fetch)
+
+        columns, types, decoders, error = None, None, None, None
+        try:
+            while True:
+                rows, command, finished = [], None, False
+                while True:
+                    kind, body = self._receive()
+                    if kind == b"D":
+                        rows.append(body)
+                    elif kind == b"T":
+                        columns, types, decoders = self._row_description(body)
+                    elif kind == b"s":
+                        break
+                    elif kind == b"C":
+                        command, finished = body[:-1].decode(), True
+                        break
+                    elif kind == b"I":
+                        finished = True
+                        break
+                    elif kind == b"1":
+                        self._parsed += 1
+                    elif kind == b"E":
+                        error = self._error(body)
+                        break
+
+                if error is not None:
+                    break
+                if rows or command is not None:
+                    yield self.Result(columns, None, command, self._decode_columns(rows, decoders) if columns is not None else None, types)
+                if finished:
+                    break
+                self._send(fetch)
+        finally:
+            if not self.closed:
+                self._sync()
+
+        if error is not None:
+            self._forget_statement(sql, cached, error.code == "0A000")
+            raise error
+        self._remember_formats(sql, name, types)
+
+    @classmethod
+    def _copy_value(cls, value):
+        if value is None:
+            return "\\N"
+        if isinstance(value, bool):
+            return "t" if value else "f"
+        if isinstance(value, (int, float, Decimal)):
+            return str(value)
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return "\\\\x" + bytes(value).hex()
+        if isinstance(value, (datetime, date, datetime_time)):
+            return value.isoformat()
+        if isinstance(value, (dict, list)):
+            value = json.dumps(value, ensure_ascii=False)
+        return str(value).translate(cls.COPY_ESCAPES)
+
+    @classmethod
+    def copy_rows(cls, rows, chunk_size=65536):
+        """
+        Satırları COPY metin biçiminde kodlar (tab ayraç, NULL için \\N, ters bölü kaçışları, dict/list JSON olarak) ve yaklaşık chunk_size baytlık parçalar üretir.
+        Encodes rows in COPY text format (tab separated, \\N for NULL, backslash escapes, dict/list as JSON) and yields chunks of about chunk_size bytes.
+        """
+        lines, size = [], 0
+        for row in rows:
+            line = "\t".join([cls._copy_value(value) for value in row]) + "\n"
+            lines.append(line)
+            size += len(line)
+            if size >= chunk_size:
+                yield "".join(lines).encode()
+                lines, size = [], 0
+        if lines:
+            yield "".join(lines).encode()
+
+    def copy_in(self, sql, data):
+        """
+        COPY ... FROM STDIN ifadesini çalıştırır ve veriyi parça parça sunucuya akıtır.
+        Runs a COPY ... FROM STDIN statement and streams data to the server chunk by chunk.
+
+        Args:
+            sql (str): COPY ... FROM STDIN ifadesi / COPY ... FROM STDIN statement.
+            data (iterable): bytes veya str parçaları (ör. copy_rows çıktısı) / bytes or str chunks (e.g. the output of copy_rows).
+
+        Returns:
+            Result: Komut etiketi "COPY n" / Command tag "COPY n".
+
+        Raises:
+            CemirPostgreSQLError: Sunucu hatası / Server error.
+        """
+        self._send(self._message(b"Q", sql.encode() + b"\0"))
+        error = None
+        while True:
+            kind, body = self._receive()
+            if kind == b"G":
+                break
+            if kind == b"E":
+                error = self._error(body)
+            elif kind == b"Z":
+                self.transaction_status = body[:1].decode()
+                raise error or CemirPostgreSQLError("Statement is not COPY ... FROM STDIN / İfade COPY ... FROM STDIN değil")
+
+        try:
+            for chunk in data:
+                self._send(self._message(b"d", chunk.encode() if isinstance(chunk, str) else bytes(chunk)))
+        except OSError:
+            raise
+        except BaseException as e:
+            # Abort the COPY so the connection stays usable / Bağlantı kullanılabilir kalsın diye COPY iptal edilir
+            if not self.closed:
+                self._send(self._message(b"f", f"{type(e).__name__}: {e}\0".encode()))
+                try:
+                    self._collect()
+                except CemirPostgreSQLError:
+                    pass
+            raise
+
+        self._send(self._message(b"c", b""))
+        return self._collect()[-1]
+
+
+class CemirPostgreSQLPool:
+    """
+    Thread-safe pool of CemirPostgreSQLConnection objects with min/max size, a health check on checkout, idle timeout and metrics (in use, wait time, creations).
+
+    Min/max boyutlu, teslimde sağlık kontrolü yapan, boşta zaman aşımı olan ve ölçümler (kullanımda, bekleme süresi, oluşturma) sunan, iş parçacığı güvenli CemirPostgreSQLConnection havuzu.
+    """
+
+    def __init__(self, connect, min_size=0, max_size=10, idle_timeout=300, acquire_timeout=30, check_interval=30):
+        """
+        Args:
+            connect (callable): Yeni bağlantı döndüren fonksiyon / Function returning a new connection.
+            min_size (int, optional): Açık tutulan en az bağlantı / Connections kept open at least. Default is 0.
+            max_size (int, optional): En fazla bağlantı / Maximum connections. Default is 10.
+            idle_timeout (float, optional): Boşta bağlantının kapatılacağı saniye (min_size üzerindekiler) / Seconds after which idle connections above min_size are closed. Default is 300.
+            acquire_timeout (float, optional): Boş bağlantı için en fazla bekleme / Longest wait for a free connection. Default is 30.
+            check_interval (float, optional): Bu kadar saniye boşta kalan bağlantı teslimden önce boş bir sorguyla yoklanır / Connections idle this many seconds are pinged with an empty query before checkout. Default is 30.
+        """
+        self.connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.acquire_timeout = acquire_timeout
+        self.check_interval = check_interval
+        self._idle = []
+        self._size = 0
+        self._in_use = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._stats = {"created": 0, "closed": 0, "acquired": 0, "waits": 0, "wait_time": 0.0, "max_wait_time": 0.0, "timeouts": 0, "health_check_failures": 0}
+
+        for _ in range(min_size):
+            connection = self.connect()
+            with self._condition:
+                self._size += 1
+                self._stats["created"] += 1
+                self._idle.append((connection, time.monotonic()))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _checkout(self, deadline):
+        """
+        Takes an idle connection or reserves a slot for a new one (returns None), waiting while the pool is at max_size.
+
+        Boştaki bir bağlantıyı alır veya yenisi için yer ayırır (None döner); havuz max_size'dayken bekler.
+        """
+        expired = []
+        try:
+            with self._condition:
+                waited_since = None
+                while True:
+                    if self._closed:
+                        raise CemirPostgreSQLError("Pool is closed / Havuz kapalı")
+
+                    now = time.monotonic()
+                    # Oldest idle connections sit at the front of the LIFO list / En eski boştaki bağlantılar LIFO listesinin başındadır
+                    while self._idle and self._size > self.min_size and now - self._idle[0][1] >= self.idle_timeout:
+                        expired.append(self._idle.pop(0)[0])
+                        self._size -= 1
+
+                    entry = None
+                    if self._idle:
+                        entry = self._idle.pop()
+                    elif self._size < self.max_size:
+                        self._size += 1
+                        entry = (None, None)
+
+                    if entry is not None:
+                        self._in_use += 1
+                        if waited_since is not None:
+                            waited = now - waited_since
+                            self._stats["waits"] += 1
+                            self._stats["wait_time"] += waited
+                            self._stats["max_wait_time"] = max(self._stats["max_wait_time"], waited)
+                        return entry
+
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        self._stats["timeouts"] += 1
+                        raise TimeoutError("Timed out waiting for a database connection / Veritabanı bağlantısı beklenirken zaman aşımı")
+                    if waited_since is None:
+                        waited_since = now
+                    self._condition.wait(remaining)
+        finally:
+            for connection in expired:
+                connection.close()
+            if expired:
+                with self._condition:
+                    self._stats["closed"] += len(expired)
+
+    def _forget(self, close_count=0):
+        with self._condition:
+            self._size -= 1
+            self._in_use -= 1
+            self._stats["closed"] += close_count
+            self._condition.notify()
+
+    def _healthy(self, connection, released_at):
+        if connection.closed or connection.transaction_status != "I":
+            return False
+        if time.monotonic() - released_at >= self.check_interval:
+            try:
+                connection.simple_query("")
+            except (CemirPostgreSQLError, OSError):
+                return False
+        return True
+
+    def acquire(self, timeout=None):
+        """
+        Havuzdan sağlıklı bir bağlantı alır; gerekirse yenisini açar veya bir bağlantı boşalana kadar bekler.
+        Takes a healthy connection from the pool, opening a new one or waiting for one to be released if needed.
+
+        Args:
+            timeout (float, optional): En fazla bekleme / Longest wait. Default is acquire_timeout.
+
+        Returns:
+            CemirPostgreSQLConnection: Bağlantı / The connection.
+
+        Raises:
+            TimeoutError: Süre içinde bağlantı boşalmazsa / If no connection frees up in time.
+        """
+        deadline = time.monotonic() + (self.acquire_timeout if timeout is None else timeout)
+        while True:
+            connection, released_at = self._checkout(deadline)
+            if connection is None:
+                try:
+                    connection = self.connect()
+                except BaseException:
+                    self._forget()
+                    raise
+                with self._condition:
+                    self._stats["created"] += 1
+                break
+
+            if self._healthy(connection, released_at):
+                break
+            with self._condition:
+                self._stats["health_check_failures"] += 1
+            connection.close()
+            self._forget(close_count=1)
+
+        with self._condition:
+            self._stats["acquired"] += 1
+        return connection
+
+    def release(self, connection):
+        """
+        Bağlantıyı havuza geri verir; açık kalan işlem geri alınır, kopmuş bağlantılar atılır.
+        Returns a connection to the pool; a transaction left open is rolled back and broken connections are dropped.
+        """
+        if not connection.closed and connection.transaction_status != "I":
+            try:
+                connection.simple_query("ROLLBACK")
+            except (CemirPostgreSQLError, OSError):
+                connection.close()
+
+        if connection.closed or self._closed:
+            connection.close()
+            self._forget(close_count=1)
+            return
+
+        with self._condition:
+            self._idle.append((connection, time.monotonic()))
+            self._in_use -= 1
+            self._condition.notify()
+
+    @contextmanager
+    def connection(self, timeout=None):
+        """
+        Bağlantıyı with bloğu süresince ödünç verir.
+        Lends a connection for the duration of a with block.
+
+        Örnek/Example:
+            with pool.connection() as conn:
+                conn.execute("SELECT $1::int", (1,))
+        """
+        connection = self.acquire(timeout)
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    def close(self):
+        """
+        Havuzu kapatır: boştaki bağlantılar hemen, kullanımdakiler geri verildiğinde kapatılır.
+        Closes the pool: idle connections now, connections in use when they are released.
+        """
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._stats["closed"] += len(idle)
+            self._condition.notify_all()
+        for connection, _ in idle:
+            connection.close()
+
+    def pool_info(self):
+        """
+        Havuz ölçümlerini döndürür.
+        Returns pool metrics.
+
+        Returns:
+            dict: size, idle, in_use, created, closed, acquired, waits, wait_time, avg_wait_time, max_wait_time, timeouts, health_check_failures
+        """
+        with self._condition:
+            info = {"size": self._size, "idle": len(self._idle), "in_use": self._in_use, "min_size": self.min_size, "max_size": self.max_size, **self._stats}
+        info["avg_wait_time"] = info["wait_time"] / info["waits"] if info["waits"] else 0.0
+        return info
+
+
+class CemirPostgreSQL:
+    def __init__(self, dbhost, dbport, dbuser, dbpassword, dbname, timeout=10, dbcreate_db_if_not_exists=False, backend='psql', pool_min_size=0, pool_max_size=10, pool_idle_timeout=300, statement_cache_size=100, binary_results=False):
+        """
+        Initialize the CemirPostgreSQL instance.
+
+        Args:
+            dbhost (str): Veritabanı hostu / Database host.
+            dbport (int): Veritabanı portu / Database port.
+            dbuser (str): Veritabanı kullanıcısı / Database user.
+            dbpassword (str): Veritabanı şifresi / Database password.
+            dbname (str): Veritabanı adı / Database name.
+            timeout (int, optional): Sorgu zaman aşımı süresi / Query timeout. Default is 10.
+            dbcreate_db_if_not_exists (bool, optional): Eğer veritabanı yoksa oluştur / Create database if not exists.
+            backend (str, optional): 'psql' her sorgu için psql çalıştırır ve psql çıktısını döndürür; 'wire' kalıcı bir bağlantı üzerinden PostgreSQL protokolünü konuşur, raw/execute_query dict listesi veya komut etiketi döndürür / 'psql' runs psql per query and returns its output; 'wire' speaks the PostgreSQL protocol over a persistent connection, and raw/execute_query return a list of dicts or the command tag. Default is 'psql'.
+            pool_min_size (int, optional): 'wire' bağlantı havuzunda açık tutulan en az bağlantı / Connections the 'wire' pool keeps open at least. Default is 0.
+            pool_max_size (int, optional): Havuzdaki en fazla bağlantı / Maximum pooled connections. Default is 10.
+            pool_idle_timeout (float, optional): Boştaki fazla bağlantıların kapatılacağı saniye / Seconds after which surplus idle connections are closed. Default is 300.
+            statement_cache_size (int, optional): Bağlantı başına önbelleğe alınan hazır ifade sayısı / Prepared statements cached per connection. Default is 100.
+            binary_results (bool, optional): Hazır ifadelerde int, float8, bool, timestamp, uuid, bytea ve json(b) sonuçlarını ikili biçimde al; değerler aynı, çözme daha ucuz / Fetch int, float8, bool, timestamp, uuid, bytea and json(b) results of prepared statements in binary format; same values, cheaper decoding. Default is False.
+        """
+        self.dbhost = dbhost
+        self.dbport = dbport
+        self.dbuser = dbuser
+        self.dbpassword = dbpassword
+        self.dbname = dbname
+        self.timeout = timeout
+        self.dbcreate_db_if_not_exists = dbcreate_db_if_not_exists
+        self.backend = backend
+        self.statement_cache_size = statement_cache_size
+        self.binary_results = binary_results
+        self.statement_stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self.pool = None
+        if backend == 'wire':
+            self.pool = CemirPostgreSQLPool(self.connect, min_size=pool_min_size, max_size=pool_max_size, idle_timeout=pool_idle_timeout, acquire_timeout=timeout)
+
+        if dbcreate_db_if_not_exists:
+            self.create_database(dbname)
+
+    def get_methods(self):
+        """
+        CemirPostgreSQL sınıfının mevcut tüm metodlarının isimlerini yazdırır.
+        Prints all available method names of the CemirPostgreSQL class.
+        """
+        return [method for method in dir(CemirPostgreSQL) if callable(getattr(CemirPostgreSQL, method)) and not method.startswith("__")]
+
+    def connect(self, dbname=None):
+        """
+        Yeni bir wire protokol bağlantısı açar.
+        Opens a new wire protocol connection.
+
+        Args:
+            dbname (str, optional): Veritabanı adı / Database name. Eğer verilmezse, self.dbname kullanılır / If not provided, self.dbname is used.
+
+        Returns:
+            CemirPostgreSQLConnection: Kimliği doğrulanmış bağlantı / Authenticated connection.
+        """
+        return CemirPostgreSQLConnection(self.dbhost, self.dbport, self.dbuser, self.dbpassword, dbname or self.dbname, timeout=self.timeout, statement_cache_size=self.statement_cache_size, statement_stats=self.statement_stats, binary_results=self.binary_results)
+
+    def connection(self, timeout=None):
+        """
+        Havuzdan bir bağlantıyı with bloğu süresince ödünç verir.
+        Lends a pooled connection for the duration of a with block.
+
+        Örnek/Example:
+            with db.connection() as conn:
+                conn.execute("SELECT * FROM users WHERE id = $1", (1,))
+        """
+        return self.pool.connection(timeout)
+
+    def pool_info(self):
+        """
+        Bağlantı havuzu ölçümlerini döndürür (kullanımda, bekleme süresi, oluşturma...).
+        Returns connection pool metrics (in use, wait time, creations...).
+        """
+        return self.pool.pool_info()
+
+    def stats(self):
+        """
+        Hazır ifade önbelleği sayaçlarını ve havuz ölçümlerini döndürür.
+        Returns prepared statement cache counters and pool metrics.
+
+        Returns:
+            dict: {"statements": {"hits", "misses", "evictions", "hit_ratio"}, "pool": pool_info()}
+        """
+        with _PG_STATS_LOCK:
+            statements = dict(self.statement_stats)
+        lookups = statements["hits"] + statements["misses"]
+        statements["hit_ratio"] = statements["hits"] / lookups if lookups else 0.0
+        return {"statements": statements, "pool": self.pool.pool_info() if self.pool is not None else None}
+
+    def close(self):
+        """
+        Bağlantı havuzunu kapatır.
+        Closes the connection pool.
+        """
+        if self.pool is not None:
+            self.pool.close()
+
+    def _call(self, operation, dbname=None):
+        """
+        operation(connection) fonksiyonunu havuzdaki bir bağlantıyla (veya başka veritabanı için geçici bir bağlantıyla) çalıştırır; hatalar JSON formatında hata bilgisine çevrilir.
+        Runs operation(connection) on a pooled connection (or a one-off connection to another database); errors become error information in JSON format.
+        """
+        try:
+            if dbname is not None and dbname != self.dbname:
+                with self.connect(dbname) as connection:
+                    return operation(connection)
+
+            with self.pool.connection() as connection:
+                return operation(connection)
+        except CemirPostgreSQLError as e:
+            return json.dumps({"error": "Query failed", "message": str(e)}, ensure_ascii=False)
+        except (socket.timeout, TimeoutError):
+            return json.dumps({"error": "TimeOut", "message": "timed out"}, ensure_ascii=False)
+        except OSError as e:
+            return json.dumps({"error": "Connection failed", "message": str(e)}, ensure_ascii=False)
+
+    def _query(self, query, dbname=None, params=None):
+        """
+        Sorguyu wire protokolüyle çalıştırır (params verilirse hazır ifade olarak); son ifadenin Result nesnesini veya JSON formatında hata bilgisini döndürür.
+        Runs the query over the wire protocol (as a prepared statement when params are given) and returns the last statement's Result or error information in JSON format.
+        """
+        if params is not None:
+            return self._call(lambda connection: connection.execute(query, params), dbname)
+        return self._call(lambda connection: connection.simple_query(query)[-1], dbname)
+
+    @staticmethod
+    def _output(result):
+        """
+        Result -> dict listesi veya komut etiketi; savepoint bloğunda başarısız olan batch ifadesinin hatası JSON formatında hata bilgisine çevrilir.
+        Result -> list of dicts or the command tag; the error of a batch statement that failed in a savepoint block becomes error information in JSON format.
+        """
+        if result is None or isinstance(result, str):
+            return result
+        if isinstance(result, CemirPostgreSQLError):
+            return json.dumps({"error": "Query failed", "message": str(result)}, ensure_ascii=False)
+        return result.dicts() if result.columns is not None else result.command
+
+    def parse_output(self, output):
+        """
+        psql komutunun çıktısını parse ederek dict yapısına çevirir.
+        Parses the output of a psql command and converts it into a dictionary.
+
+        Args:
+            output (str): psql komutunun çıktısı / Output of the psql command.
+
+        Returns:
+            dict: Dict formatında çıktı / Output in dict format.
+        """
+        lines = output.strip().split('\n')
+        headers = lines[0].split('|')
+        data = []
+
+        for line in lines[2:-1]:  # İlk iki satır ve son satır başlık ve ayırıcılar olduğu için atlanır / Skip first two and last line as they are headers and separators
+            values = line.split('|')
+            data.append({header.strip(): value.strip() for header, value in zip(headers, values)})
+
+        return data
+
+    def execute_query(self, query, dbname=None, params=None):
+        """
+        Veritabanına SQL sorgusu gönderir ve sonucu döndürür.
+        Sends an SQL query to the database and returns the result.
+
+        Args:
+            query (str): SQL sorgusu / SQL query.
+            dbname (str, optional): Veritabanı adı / Database name. Eğer verilmezse, self.dbname kullanılır / If not provided, self.dbname is used.
+            params (tuple, optional): $1, $2 yer tutucularının değerleri; verilirse sorgu hazır ifade olarak çalışır ('wire') / Values for $1, $2 placeholders; when given the query runs as a cached prepared statement ('wire').
+
+        Returns:
+            str or list: Sorgu sonucu veya JSON formatında hata bilgisi / Query result or error information in JSON format. 'wire' ile satır döndüren sorgular için dict listesi, diğerleri için komut etiketi / With 'wire', a list of dicts for queries returning rows, otherwise the command tag.
+        """
+        if self.backend == 'wire':
+            return self._output(self._query(query, dbname, params))
+
+        if params is not None:
+            raise CemirPostgreSQLError("params need the 'wire' backend / params 'wire' arka ucu gerektirir")
+
+        if dbname is None:
+            dbname = self.dbname
+
+        query = query.replace("\n", "").strip()
+        command = f'''PGPASSWORD={self.dbpassword} psql -h {self.dbhost} -p {self.dbport} -U {self.dbuser} -d {dbname} -c {json.dumps(query, ensure_ascii=False)}'''
+
+        try:
+            result = subprocess.run(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=self.timeout)
+            if result.returncode != 0:
+                error_info = {
+                    "error": "Query failed",
+                    "message": result.stderr.strip()
+                }
+                return json.dumps(error_info, ensure_ascii=False)
+            return result.stdout.strip()
+        except subprocess.TimeoutExpired as e:
+            error_info = {
+                "error": "TimeOut",
+                "message": f"timed out"
+            }
+            return json.dumps(error_info, ensure_ascii=False)
+
+    def raw(self, query, print_query=False, params=None):
+        """
+        Ham SQL sorgusu çalıştırır ve sonucu döndürür.
+        Executes a raw SQL query and returns the result.
+
+        Args:
+            query (str): SQL sorgusu / SQL query.
+            print_query (bool, optional): Sorguyu yazdır / Print the query. Default is False.
+            params (tuple, optional): $1, $2 yer tutucularının değerleri / Values for $1, $2 placeholders.
+
+        Returns:
+            str: Sorgu sonucu veya JSON formatında hata bilgisi / Query result or error information in JSON format.
+        """
+        if print_query: print(query)
+        return self.execute_query(query, params=params)
+
+    def pipeline(self, queries):
+        """
+        Birçok ifadeyi tek Sync ile, yaklaşık tek gidiş-dönüşte çalıştırır; ifadeler tek bir örtük işlemde çalışır, biri başarısız olursa hepsi geri alınır. Yalnızca 'wire' arka ucu.
+        Runs many statements with a single Sync, in about one round trip; they run in one implicit transaction and all are rolled back if one fails. 'wire' backend only.
+
+        Args:
+            queries (iterable): SQL metinleri veya (sql, params) çiftleri / SQL strings or (sql, params) pairs (örnek/example: [("SELECT * FROM users WHERE id = $1", (1,)), "SELECT now()"]).
+
+        Returns:
+            list or str: Her ifade için dict listesi veya komut etiketi, ya da JSON formatında hata bilgisi / A list of dicts or the command tag per statement, or error information in JSON format.
+        """
+        if self.backend != 'wire':
+            raise CemirPostgreSQLError("pipeline needs the 'wire' backend / pipeline 'wire' arka ucu gerektirir")
+
+        queries = list(queries)
+        return self._call(lambda connection: [self._output(result) for result in connection.pipeline(queries)])
+
+    @contextmanager
+    def transaction(self):
+        """
+        Havuzdan bir bağlantıyı bir işlem içinde ödünç verir: blok başarıyla biterse COMMIT, hata fırlatırsa ROLLBACK. İç içe conn.transaction() blokları savepoint kullanır. Yalnızca 'wire' arka ucu.
+        Lends a pooled connection inside a transaction: COMMIT when the block succeeds, ROLLBACK when it raises. Nested conn.transaction() blocks use savepoints. 'wire' backend only.
+
+        Örnek/Example:
+            with db.transaction() as conn:
+                conn.execute("UPDATE accounts SET balance = balance - $1 WHERE id = $2", (100, 1))
+                with conn.transaction():  # savepoint
+                    conn.execute("INSERT INTO audit (account_id) VALUES ($1)", (1,))
+
+        Raises:
+            CemirPostgreSQLError: Sunucu hatası / Server error.
+        """
+        if self.backend != 'wire':
+            raise CemirPostgreSQLError("transaction needs the 'wire' backend / transaction 'wire' arka ucu gerektirir")
+
+        with self.pool.connection() as connection, connection.transaction():
+            yield connection
+
+    def batch(self):
+        """
+        İfadeleri toplayıp tek işlemde, tek gidiş-dönüşte çalıştıran bir CemirPostgreSQLBatch döndürür; N ifade N yerine tek commit sürer. Yalnızca 'wire' arka ucu.
+        Returns a CemirPostgreSQLBatch that collects statements and runs them in one transaction and one round trip; N statements cost one commit instead of N. 'wire' backend only.
+
+        Örnek/Example:
+            with db.batch() as batch:
+                batch.execute("CREATE TABLE tags (name text UNIQUE)")
+                batch.execute("INSERT INTO tags VALUES ($1)", ("python",))
+                with batch.savepoint():  # bu bloktaki hata batch'i durdurmaz / an error in this block does not stop the batch
+                    batch.execute("INSERT INTO tags VALUES ($1)", ("python",))
+            print(batch.results)
+
+        Returns:
+            CemirPostgreSQLBatch: run() (veya with bloğundan çıkış) sonrasında results, ifade başına dict listesi, komut etiketi, savepoint bloğunda başarısız olan ifade için JSON hata bilgisi veya çalışmayan ifade için None içerir; batch başarısız olursa JSON formatında hata bilgisidir / After run() (or leaving the with block) results holds per statement a list of dicts, the command tag, JSON error information for a statement that failed in a savepoint block or None for one that did not run; when the batch fails it is error information in JSON format.
+        """
+        if self.backend != 'wire':
+            raise CemirPostgreSQLError("batch needs the 'wire' backend / batch 'wire' arka ucu gerektirir")
+
+        def run(batch):
+            batch.results = self._call(lambda connection: [self._output(result) for result in connection.run_batch(batch)])
+            return batch.results
+
+        return CemirPostgreSQLBatch(run)
+
+    def insert(self, table_name, columns, values, get_id=False):
+        """
+        Veritabanına yeni kayıt ekler.
+        Inserts a new record into the database.
+
+        Args:
+            table_name (str): Tablo adı / Table name.
+            columns (tuple): Kolon adları / Column names (örnek/example: ("id", "name", "data")).
+            values (tuple): Kolon değerleri / Column values (örnek/example: (1, "John Doe", {"age": 30, "city": "Istanbul"})).
+            get_id (bool): İşlem yapılan ID / Get the ID of the inserted record.
+
+        Returns:
+            str: Sorgu sonucu veya JSON formatında hata bilgisi / Query result or error information in JSON format.
+        """
+        columns_str = ', '.join(columns)
+
+        if self.backend == 'wire':
+            # Values are bound as parameters of a cached prepared statement / Değerler önbellekteki hazır ifadenin parametreleri olarak bağlanır
+            placeholders = ', '.join(f"${i}" for i in range(1, len(values) + 1))
+            query = f"INSERT INTO {table_name} ({columns_str}) VALUES ({placeholders})"
+            if get_id:
+                query += " RETURNING id"
+            return self._write_result(self._query(query, params=tuple(values)), get_id)
+
+        formatted_values = []
+        for value in values:
+            if isinstance(value, dict):
+                formatted_values.append(f"'{json.dumps(value)}'::jsonb")
+            else:
+                formatted_values.append(f"'{value}'")
+
+        values_str = ', '.join(formatted_values)
+        query = f"INSERT INTO {table_name} ({columns_str}) VALUES ({values_str})"
+        if get_id:
+            query += f" RETURNING id;"
+
+        if get_id:
+            try:
+                result = self.execute_query(query).split()[2]
+                return {"error": False, "id": int(result)}
+            except ValueError:
+                return self.execute_query(query)
+
+        return self.execute_query(query)
+
+    @staticmethod
+    def _sql_literal(value):
+        if value is None:
+            return "NULL"
+        if isinstance(value, bool):
+            return "TRUE" if value else "FALSE"
+        if isinstance(value, (int, float, Decimal)):
+            return str(value)
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return f"'\\x{bytes(value).hex()}'::bytea"
+        if isinstance(value, (dict, list)):
+            return "'" + json.dumps(value, ensure_ascii=False).replace("'", "''") + "'::jsonb"
+        if isinstance(value, (datetime, date, datetime_time)):
+            value = value.isoformat()
+        return "'" + str(value).replace("'", "''") + "'"
+
+    @staticmethod
+    def _batches(rows, batch_size):
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def insert_many(self, table_name, columns, rows, method='copy', batch_size=1000):
+        """
+        Çok sayıda kaydı tek seferde ekler: COPY ... FROM STDIN ile akıtarak veya çok satırlı INSERT ... VALUES grupları halinde. VALUES, sunucu COPY desteklemediğinde ve 'psql' arka ucunda kullanılır. 'wire' ile tüm satırlar tek bir işlemde eklenir.
+        Inserts many records at once: streamed through COPY ... FROM STDIN or as multi-row INSERT ... VALUES batches. VALUES is used when the server does not support COPY and with the 'psql' backend. With 'wire' all rows go in one transaction.
+
+        Args:
+            table_name (str): Tablo adı / Table name.
+            columns (tuple): Kolon adları / Column names (örnek/example: ("id", "name", "data")).
+            rows (iterable): Kolon değerlerinden oluşan demetler; bir üreteç olabilir / Tuples of column values; may be a generator (örnek/example: [(1, "John", {"age": 30}), ...]).
+            method (str, optional): 'copy' veya 'values' / 'copy' or 'values'. Default is 'copy'.
+            batch_size (int, optional): VALUES grubu başına satır / Rows per VALUES batch. Default is 1000.
+
+        Returns:
+            dict: {"error": False, "count": eklenen satır / inserted rows} veya JSON formatında hata bilgisi / or error information in JSON format.
+        """
+        columns_str = ', '.join(columns)
+        batch_size = max(1, min(batch_size, 65535 // max(len(columns), 1)))  # Bind accepts at most 65535 parameters / Bind en fazla 65535 parametre kabul eder
+
+        if self.backend != 'wire':
+            count = 0
+            for batch in self._batches(rows, batch_size):
+                values_str = ', '.join('(' + ', '.join(self._sql_literal(value) for value in row) + ')' for row in batch)
+                result = self.execute_query(f"INSERT INTO {table_name} ({columns_str}) VALUES {values_str};")
+                if not result.startswith("INSERT"):
+                    return result
+                count += int(result.split()[-1])
+            return {"error": False, "count": count}
+
+        def operation(connection):
+            if method == 'copy':
+                try:
+                    result = connection.copy_in(f"COPY {table_name} ({columns_str}) FROM STDIN", connection.copy_rows(rows))
+                    return {"error": False, "count": result.rowcount}
+                except CemirPostgreSQLError as e:
+                    if e.code not in ("0A000", "42601"):  # feature_not_supported, syntax_error
+                        raise
+
+            count = 0
+            connection.simple_query("BEGIN")
+            for batch in self._batches(rows, batch_size):
+                placeholders = ', '.join('(' + ', '.join(f"${i * len(columns) + j + 1}" for j in range(len(columns))) + ')' for i in range(len(batch)))
+                params = [value for row in batch for value in row]
+                count += connection.execute(f"INSERT INTO {table_name} ({columns_str}) VALUES {placeholders}", params).rowcount
+            connection.simple_query("COMMIT")
+            return {"error": False, "count": count}
+
+        return self._call(operation)
+
+    @staticmethod
+    def _row_maker(columns, row_type):
+        if row_type == 'tuple':
+            return lambda rows: rows
+        if row_type == 'namedtuple':
+            row_class = namedtuple("Row", columns, rename=True)
+            return lambda rows: list(map(row_class._make, rows))
+        if row_type == 'dict':
+            return lambda rows: [dict(zip(columns, row)) for row in rows]
+        if row_type == 'columnar':
+            return lambda rows: CemirPostgreSQLConnection.Result(columns, rows).columnar()
+        raise ValueError(f"Unknown row type: {row_type} / Bilinmeyen satır türü: {row_type}")
+
+    def iter_query(self, query, params=(), batch_size=1000, batches=False, row_type='dict'):
+        """
+        Sorgu sonucunu bellekte toplamadan satır satır veya grup grup üretir; sunucudan her seferde batch_size satır çekilir. Yalnızca 'wire' arka ucu.
+        Yields the query result row by row or batch by batch without collecting it in memory; batch_size rows are fetched from the server at a time. 'wire' backend only.
+
+        Args:
+            query (str): $1, $2 yer tutuculu SQL sorgusu / SQL query with $1, $2 placeholders.
+            params (tuple, optional): Parametre değerleri / Parameter values.
+            batch_size (int, optional): Grup başına satır / Rows per batch. Default is 1000.
+            batches (bool, optional): Tek tek satır yerine satır listeleri üret / Yield lists of rows instead of single rows. Default is False.
+            row_type (str, optional): 'dict', 'tuple', 'namedtuple' veya grup başına {kolon: değer listesi} için 'columnar' / 'dict', 'tuple', 'namedtuple', or 'columnar' for {column: list of values} per batch. Default is 'dict'.
+
+        Yields:
+            dict, tuple, namedtuple or list: Tipli değerlerle satırlar / Rows with typed values.
+
+        Raises:
+            CemirPostgreSQLError: Sunucu hatası / Server error.
+        """
+        if self.backend != 'wire':
+            raise CemirPostgreSQLError("iter_query needs the 'wire' backend / iter_query 'wire' arka ucu gerektirir")
+
+        with self.pool.connection() as connection:
+            make_rows, made_for = None, None
+            for result in connection.stream(query, params, batch_size):
+                if result.columns is None:
+                    continue
+                if row_type == 'columnar':
+                    yield result.columnar()
+                    continue
+                if made_for is not result.columns:
+                    make_rows, made_for = self._row_maker(result.columns, row_type), result.columns
+                rows = make_rows(result.rows)
+                if batches:
+                    yield rows
+                else:
+                    yield from rows
+
+    def iter_read(self, table_name, columns='*', condition=None, batch_size=1000, batches=False, row_type='dict'):
+        """
+        Veritabanından kayıtları akış halinde okur; büyük tablolar bellek kullanımı artmadan okunabilir.
+        Streams records from the database, so large tables can be read with bounded memory.
+
+        Args:
+            table_name (str): Tablo adı / Table name.
+            columns (str or tuple, optional): Kolon adları / Column names. Default is '*'.
+            condition (str, optional): Koşul / Condition.
+            batch_size (int, optional): Grup başına satır / Rows per batch. Default is 1000.
+            batches (bool, optional): Tek tek satır yerine satır listeleri üret / Yield lists of rows instead of single rows. Default is False.
+            row_type (str, optional): 'dict', 'tuple', 'namedtuple' veya grup başına {kolon: değer listesi} için 'columnar' / 'dict', 'tuple', 'namedtuple', or 'columnar' for {column: list of values} per batch. Default is 'dict'.
+
+        Yields:
+            dict, tuple, namedtuple or list: Satırlar / Rows. 'psql' arka ucunda değerler metindir ve sonuç önce tamamen okunur / With the 'psql' backend values are strings and the result is read in full first.
+        """
+        if isinstance(columns, tuple):
+            columns = ', '.join(columns)
+
+        query = f"SELECT {columns} FROM {table_name}"
+        if condition:
+            query += f" WHERE {condition}"
+
+        if self.backend == 'wire':
+            yield from self.iter_query(query, batch_size=batch_size, batches=batches, row_type=row_type)
+            return
+
+        records = self.parse_output(self.execute_query(query + ";"))
+        names = list(records[0]) if records else []
+        make_rows = self._row_maker(names, row_type)
+        for batch in self._batches((tuple(record.values()) for record in records), batch_size):
+            rows = make_rows(batch)
+            if batches or row_type == 'columnar':
+                yield rows
+            else:
+                yield from rows
+
+    @staticmethod
+    def _write_result(result, get_id):
+        if isinstance(result, str):
+            return result
+        if not get_id:
+            return result.command
+        if not result.rows:
+            return {"error": True, "status": "record_not_found"}
+        return {"error": False, "id": result.rows[0][0]}
+
+    def create_database(self, dbname):
+        """
+        Belirtilen ad ile yeni bir veritabanı oluşturur.
+        Creates a new database with the specified name.
+
+        Args:
+            dbname (str): Oluşturulacak veritabanının adı / Name of the database to be created.
+
+        Returns:
+            str: Sorgu sonucu veya JSON formatında hata bilgisi / Query result or error information in JSON format.
+        """
+        query = f"CREATE DATABASE {dbname};"
+        return self.execute_query(query, dbname='postgres')
+
+    def create_table(self, table_name, schema):
+        """
+        Veritabanında tablo oluşturur.
+        Creates a table in the database.
+
+        Args:
+            table_name (str): Tablo adı / Table name.
+            schema (str): Tablo şeması / Table schema (örnek/example: "id SERIAL PRIMARY KEY, name VARCHAR(100), data JSONB").
 
-            # Set up the server
-            if self.smtp_ssl:
-                context = ssl.create_default_context()
-                server = smtplib.SMTP_SSL(self.smtp_host, self.smtp_port, context=context)
-            else:
-                server = smtplib.SMTP(self.smtp_host, self.smtp_port)
-                server.starttls()
+        Returns:
+            str: Sorgu sonucu veya JSON formatında hata bilgisi / Query result or error information in JSON format.
+        """
+        query = f"CREATE TABLE {table_name} ({schema});"
+        return self.execute_query(query)
 
-            # Login to the server
-            server.login(self.smtp_user, self.smtp_pass)
+    def read(self, table_name, columns='*', condition=None, params=None, columnar=False):
+        """
+        Veritabanından kayıt okur.
+        Reads records from the database.
 
-            # Create the email
-            msg = MIMEMultipart('alternative')
+        Args:
+            table_name (str): Tablo adı / Table name.
+            columns (str or tuple, optional): Kolon adları / Column names. Default is '*'.
+            condition (str, optional): Koşul / Condition (örnek/example: "id = $1").
+            params (tuple, optional): Koşuldaki $1, $2 değerleri ('wire') / Values for $1, $2 in the condition ('wire').
+            columnar (bool, optional): Satır listesi yerine {kolon: değer listesi} döndür / Return {column: list of values} instead of a list of rows. Default is False.
 
-            msg['From'] = formataddr((str(sender_name or ""), self.smtp_user))
+        Returns:
+            list or dict: Sorgu sonucu veya JSON formatında hata bilgisi / Query result or error information in JSON format.
+        """
+        if isinstance(columns, tuple):
+            columns = ', '.join(columns)
 
+        query = f"SELECT {columns} FROM {table_name}"
 
-            msg['To'] = to_email
-            msg['Subject'] = subject
+        if condition:
+            query += f" WHERE {condition}"
 
-            # Convert HTML to plain text
-            body_plain = self.html_to_plain(body_html)
+        query += ";"
 
-            # Attach plain text and HTML parts
-            part1 = MIMEText(body_plain, 'plain')
-            part2 = MIMEText(body_html, 'html')
-            msg.attach(part1)
-            msg.attach(part2)
+        if self.backend == 'wire':
+            result = self._query(query, params=tuple(params or ()))
+            if isinstance(result, str):
+                return result
+            if columnar:
+                return result.columnar()
+            result = result.dicts()
+        else:
+            result = self.parse_output(self.execute_query(query, params=params))
+            if columnar:
+                return self._row_maker(list(result[0]) if result else [], 'columnar')([tuple(record.values()) for record in result])
 
-            # Handle attachments
-            if attachments:
-                if zip_files:
-                    zip_filename = self.zip_attachments(attachments)
-                    with open(zip_filename, 'rb') as f:
-                        part = MIMEBase('application', 'octet-stream')
-                        part.set_payload(f.read())
-                    encoders.encode_base64(part)
-                    part.add_header(
-                        'Content-Disposition',
-                        f'attachment; filename={zip_filename}',
-                    )
-                    msg.attach(part)
-                    os.remove(zip_filename)  # Temp zip dosyasını sil
-                else:
-                    for file_path in attachments:
-                        if os.path.isfile(file_path):
-                            with open(file_path, 'rb') as f:
-                                part = MIMEBase('application', 'octet-stream')
-                                part.set_payload(f.read())
-                                encoders.encode_base64(part)
+        if len(result) == 1:
+            return result[0]
+        return result
 
-                            part.add_header(
-                                'Content-Disposition',
-                                f'attachment; filename={os.path.basename(file_path)}',
-                            )
-                            msg.attach(part)
+    def update(self, table_name, updates, condition, get_id=False, params=None):
+        """
+        Veritabanındaki kaydı günceller.
+        Updates a record in the database.
 
-            # Send the email
-            server.sendmail(self.smtp_user, to_email, msg.as_string())
+        Args:
+            table_name (str): Tablo adı / Table name.
+            updates (dict): Güncellemeler / Updates (örnek/example: {"name": "Jane Doe"}).
+            condition (str): Koşul / Condition (örnek/example: "id = 1" veya/or "id = $1").
+            get_id (bool): İşlem yapılan ID / Get the ID of the updated record.
+            params (tuple, optional): Koşuldaki $1, $2 değerleri; güncelleme değerleri bunlardan sonra numaralanır ('wire') / Values for $1, $2 in the condition; update values are numbered after them ('wire').
 
-            # Close the server
-            server.quit()
+        Returns:
+            str: Sorgu sonucu veya JSON formatında hata bilgisi / Query result or error information in JSON format.
+        """
+        if self.backend == 'wire':
+            params = tuple(params or ())
+            update_str = ', '.join(f"{k} = ${len(params) + i}" for i, k in enumerate(updates, 1))
+            query = f"UPDATE {table_name} SET {update_str} WHERE {condition}"
+            if get_id:
+                query += " RETURNING id"
+            return self._write_result(self._query(query, params=params + tuple(updates.values())), get_id)
 
-            print("Email sent successfully")
-        except smtplib.SMTPAuthenticationError:
-            error_message = "Error: The server didn't accept the username/password combination."
-            logging.error(error_message)
-            print(error_message)
-        except smtplib.SMTPConnectError:
-            error_message = "Error: Unable to establish a connection to the email server."
-            logging.error(error_message)
-            print(error_message)
-        except smtplib.SMTPServerDisconnected:
-            error_message = "Error: Server unexpectedly disconnected."
-            logging.error(error_message)
-            print(error_message)
-        except Exception as e:
-            error_message = f"An error occurred: {e}"
-            logging.error(error_message)
-            print(error_message)
+        update_str = ', '.join(f"{k} = '{json.dumps(v)}'" if isinstance(v, dict) else f"{k} = '{v}'" for k, v in updates.items())
+        query = f"UPDATE {table_name} SET {update_str} WHERE {condition}"
+        if get_id:
+            query += f" RETURNING id;"
 
+        if get_id:
+            try:
+                result = self.execute_query(query, params=params).split()[2]
+                return {"error": False, "id": int(result)}
+            except ValueError:
+                return self.execute_query(query)
 
-class CemirUtilsConditions:
-    """
-    CemirUtilsConditions
+        return self.execute_query(query, params=params)
 
-    This class provides functionality to collect and evaluate conditions within a function.
+    def delete(self, table_name, condition, params=None):
+        """
+        Veritabanındaki kaydı siler.
+        Deletes a record from the database.
 
-    Attributes:
-        conditions (list): A list to store conditions.
+        Args:
+            table_name (str): Tablo adı / Table name.
+            condition (str): Koşul / Condition (örnek/example: "id = 1" veya/or "id = $1").
+            params (tuple, optional): Koşuldaki $1, $2 değerleri ('wire') / Values for $1, $2 in the condition ('wire').
 
-    Methods:
-        condition_collector(func): A decorator to collect and evaluate conditions within the decorated function.
-    """
+        Returns:
+            str: Sorgu sonucu veya JSON formatında hata bilgisi / Query result or error information in JSON format.
+        """
+        query = f"DELETE FROM {table_name} WHERE {condition};"
+        if self.backend == 'wire':
+            result = self._query(query, params=tuple(params or ()))
+            if isinstance(result, str):
+                return result
+            if result.rowcount == 0:
+                return {"error": True, "status": "record_not_found"}
+            return {"error": False, "status": "record_deleted"}
 
-    """
-    CemirUtilsConditions
+        if params is not None:
+            raise CemirPostgreSQLError("params need the 'wire' backend / params 'wire' arka ucu gerektirir")
 
-    Bu sınıf, bir işlev içindeki koşulları toplamak ve değerlendirmek için işlevsellik sağlar.
+        try:
+            result = int(self.execute_query(query).split()[1])
+            if result == 0:
+                return {"error": True, "status": "record_not_found"}
+            if result > 0:
+                return {"error": False, "status": "record_deleted"}
+        except (ValueError, IndexError):
+            return self.execute_query(query)
 
-    Nitelikler:
-        conditions (list): Koşulları depolamak için bir liste.
 
-    Metotlar:
-        condition_collector(func): Süslenen işlev içindeki koşulları toplamak ve değerlendirmek için bir dekoratör.
+class CemirPostgreSQLAsyncConnection(_CemirPostgreSQLProtocol):
     """
+    asyncio PostgreSQL v3 wire protocol connection sharing the message handling, authentication and prepared statement cache of CemirPostgreSQLConnection. pipeline() sends several Parse/Bind/Execute messages before a single Sync, so N statements cost about one round trip. Open it with `await CemirPostgreSQLAsyncConnection.connect(...)`.
 
-    def __init__(self):
-        self.conditions = []
+    CemirPostgreSQLConnection'ın mesaj işleme, kimlik doğrulama ve hazır ifade önbelleğini paylaşan asyncio PostgreSQL v3 wire protokol bağlantısı. pipeline() tek bir Sync'ten önce birden çok Parse/Bind/Execute mesajı gönderir; N ifade yaklaşık tek gidiş-dönüş sürer. `await CemirPostgreSQLAsyncConnection.connect(...)` ile açılır.
+    """
 
-    def condition_collector(self, func):
-        def wrapper(*args, **kwargs):
-            self.conditions.clear()
-            source_lines, starting_line_number = inspect.getsourcelines(func)
-            local_vars = {}
+    def __init__(self, host, port, user, password, dbname, timeout=10, statement_cache_size=100, statement_stats=None, binary_results=False):
+        super().__init__(host, port, user, password, dbname, timeout, statement_cache_size, statement_stats, binary_results)
+        self._reader = None
+        self._writer = None
 
-            def trace_function(frame, event, arg):
-                if event == 'return':
-                    local_vars.update(frame.f_locals)
-                return trace_function
+    @classmethod
+    async def connect(cls, host, port, user, password, dbname, timeout=10, ssl_context=None, application_name="CemirUtils", statement_cache_size=100, statement_stats=None, binary_results=False):
+        """
+        Opens a connection and authenticates.
 
-            sys.settrace(trace_function)
-            result = func(*args, **kwargs)
-            sys.settrace(None)
+        Bir bağlantı açar ve kimlik doğrular.
 
-            skip_next_conditions = False
+        Args:
+            host (str): Veritabanı hostu, unix soketi için dizin / Database host, or a directory for a unix socket.
+            port (int): Veritabanı portu / Database port.
+            user (str): Veritabanı kullanıcısı / Database user.
+            password (str): Veritabanı şifresi / Database password.
+            dbname (str): Veritabanı adı / Database name.
+            timeout (float, optional): Bağlantı ve kimlik doğrulama zaman aşımı / Connect and authentication timeout. Default is 10.
+            ssl_context (ssl.SSLContext, optional): Verilirse bağlantı TLS'e yükseltilir / Upgrade the connection to TLS when given.
+            application_name (str, optional): Sunucuya bildirilen uygulama adı / Application name reported to the server.
+            statement_cache_size (int, optional): SQL metnine göre önbelleğe alınan hazır ifade sayısı, 0 kapatır / Prepared statements cached by SQL text, 0 disables. Default is 100.
+            statement_stats (dict, optional): hits/misses/evictions sayaçları; bağlantılar arasında paylaşılabilir / hits/misses/evictions counters, may be shared between connections.
+            binary_results (bool, optional): Önbellekteki ifadeler ilk çalıştırmadan sonra BINARY_DECODERS türlerini ikili biçimde ister / Cached statements ask for BINARY_DECODERS types in binary format after their first run. Default is False.
 
-            for idx, line in enumerate(source_lines):
-                stripped_line = line.strip()
-                if stripped_line.startswith("if"):
-                    skip_next_conditions = False  # Reset at the start of each new if block
-                    condition = stripped_line.split(":")[0].strip()
-                    try:
-                        if eval(condition.split(" ", 1)[1], globals(), local_vars):
-                            self.conditions.append((stripped_line, starting_line_number + idx))
-                            skip_next_conditions = True
-                    except Exception:
-                        pass
-                elif stripped_line.startswith("elif"):
-                    if not skip_next_conditions:
-                        condition = stripped_line.split(":")[0].strip()
-                        try:
-                            if eval(condition.split(" ", 1)[1], globals(), local_vars):
-                                self.conditions.append((stripped_line, starting_line_number + idx))
-                                skip_next_conditions = True
-                        except Exception:
-                            pass
-                elif stripped_line.startswith("else"):
-                    if not skip_next_conditions:
-                        self.conditions.append((stripped_line, starting_line_number + idx))
-                    skip_next_conditions = True
+        Returns:
+            CemirPostgreSQLAsyncConnection: Kimliği doğrulanmış bağlantı / Authenticated connection.
 
-            # Print the collected conditions with line numbers
-            for condition, line_num in self.conditions:
-                print(f"Line {line_num}: {condition}")
+        Raises:
+            CemirPostgreSQLError: Kimlik doğrulama veya başlangıç hatası / Authentication or startup error.
+            OSError: Bağlantı hatası / Connection error.
+        """
+        connection = cls(host, port, user, password, dbname, timeout, statement_cache_size, statement_stats, binary_results)
+        await asyncio.wait_for(connection._connect(ssl_context, application_name), timeout)
+        return connection
 
-            return result
+    async def __aenter__(self):
+        return self
 
-        return wrapper
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
 
+    @property
+    def closed(self):
+        return self._writer is None
 
-class Dict2Dot(dict):
-    """
-    A dictionary subclass that allows for dot notation access to dictionary attributes.
+    async def close(self):
+        """
+        Sends Terminate and closes the connection.
 
-    Bir sözlük alt sınıfı olup, sözlük öğelerine nokta notasyonu ile erişim sağlar.
+        Terminate gönderir ve bağlantıyı kapatır.
+        """
+        if self._writer is None:
+            return
+        try:
+            self._writer.write(b"X\x00\x00\x00\x04")
+        except OSError:
+            pass
+        self._abort()
+
+    def _abort(self):
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.close()
+
+    async def _open_socket(self, loop):
+        if self.host.startswith("/"):
+            targets = [(socket.AF_UNIX, socket.SOCK_STREAM, 0, os.path.join(self.host, f".s.PGSQL.{self.port}"))]
+        else:
+            targets = [(family, kind, proto, address) for family, kind, proto, _, address in await loop.getaddrinfo(self.host, self.port, type=socket.SOCK_STREAM)]
 
-    Methods:
-    ----------
-    __getattr__(self, key):
-        Returns the value of the given key. If the value is a dictionary, it converts it to a Dict2Dot object.
-        Verilen anahtarın değerini döndürür. Eğer değer bir sözlük ise, bunu Dict2Dot nesnesine dönüştürür.
-    """
+        error = None
+        for family, kind, proto, address in targets:
+            sock = socket.socket(family, kind, proto)
+            sock.setblocking(False)
+            try:
+                await loop.sock_connect(sock, address)
+                return sock
+            except OSError as e:
+                sock.close()
+                error = e
+            except BaseException:
+                sock.close()
+                raise
+        raise error
+
+    async def _connect(self, ssl_context, application_name):
+        loop = asyncio.get_running_loop()
+        sock = await self._open_socket(loop)
+        try:
+            # The SSLRequest exchange happens on the raw socket, TLS starts when the stream is opened / SSLRequest ham sokette yapılır, TLS akış açılırken başlar
+            if ssl_context is not None:
+                await loop.sock_sendall(sock, _PG_INT32.pack(8) + _PG_INT32.pack(self.SSL_REQUEST_CODE))
+                if await loop.sock_recv(sock, 1) != b"S":
+                    raise CemirPostgreSQLError("Server does not accept SSL / Sunucu SSL kabul etmiyor")
+            self._reader, self._writer = await asyncio.open_connection(sock=sock, ssl=ssl_context, server_hostname=self.host if ssl_context is not None else None)
+        except BaseException:
+            sock.close()
+            raise
 
-    def __getattr__(self, key):
+        try:
+            await self._send(self._startup_message(application_name))
+            await self._authenticate()
+            while True:
+                kind, body = await self._receive()
+                if kind == b"K":
+                    self.backend_pid, self.backend_secret = struct.unpack("!ii", body)
+                elif kind == b"E":
+                    raise self._error(body)
+                elif kind == b"Z":
+                    self.transaction_status = body[:1].decode()
+                    return
+        except BaseException:
+            self._abort()
+            raise
+
+    async def _authenticate(self):
+        scram = None
+        while True:
+            kind, body = await self._receive()
+            if kind == b"E":
+                raise self._error(body)
+            if kind != b"R":
+                raise CemirPostgreSQLError(f"Unexpected message during authentication: {kind!r} / Kimlik doğrulama sırasında beklenmeyen mesaj")
+
+            (code,) = _PG_INT32.unpack_from(body)
+            if code == 0:
+                return
+            message, scram = self._auth_step(code, body, scram)
+            if message is not None:
+                await self._send(message)
+
+    async def _send(self, data):
+        if self._writer is None:
+            raise CemirPostgreSQLError("Connection is closed / Bağlantı kapalı")
+        try:
+            self._writer.write(data)
+            await self._writer.drain()
+        except BaseException:
+            # Also on cancellation: the protocol state is unknown afterwards / İptalde de: sonrasında protokol durumu bilinmez
+            self._abort()
+            raise
+
+    async def _receive(self):
         """
-        Returns the value of the given key. If the value is a dictionary, it converts it to a Dict2Dot object.
+        Reads the next message, handling ParameterStatus, NoticeResponse and NotificationResponse in between. A connection interrupted mid-message (cancelled, timed out) is closed.
 
-        Verilen anahtarın değerini döndürür. Eğer değer bir sözlük ise, bunu Dict2Dot nesnesine dönüştürür.
+        Bir sonraki mesajı okur; aradaki ParameterStatus, NoticeResponse ve NotificationResponse mesajlarını işler. Mesaj ortasında kesilen (iptal, zaman aşımı) bağlantı kapatılır.
+        """
+        if self._reader is None or self._writer is None:
+            raise CemirPostgreSQLError("Connection is closed / Bağlantı kapalı")
+        try:
+            while True:
+                header = await self._reader.readexactly(5)
+                kind = header[:1]
+                (length,) = _PG_INT32.unpack_from(header, 1)
+                body = await self._reader.readexactly(length - 4)
+
+                if kind == b"S":
+                    name, value = body.split(b"\0")[:2]
+                    self.parameters[name.decode()] = value.decode()
+                elif kind not in (b"N", b"A"):
+                    return kind, body
+        except asyncio.IncompleteReadError:
+            self._abort()
+            raise ConnectionResetError("Connection closed by the server / Bağlantı sunucu tarafından kapatıldı") from None
+        except BaseException:
+            self._abort()
+            raise
+
+    async def _read_results(self):
+        """
+        Reads messages up to ReadyForQuery; returns one Result per completed statement and the server error, if any.
+
+        ReadyForQuery'ye kadar mesajları okur; tamamlanan her ifade için bir Result ve varsa sunucu hatasını döndürür.
+        """
+        results, error = [], None
+        columns, types, decoders, rows = None, None, None, []
+        while True:
+            kind, body = await self._receive()
+            if kind == b"D":
+                rows.append(body)
+            elif kind == b"T":
+                columns, types, decoders = self._row_description(body)
+                rows = []
+            elif kind == b"C":
+                arrays = self._decode_columns(rows, decoders) if columns is not None else None
+                results.append(self.Result(columns, None, body[:-1].decode(), arrays, types))
+                columns, types, decoders, rows = None, None, None, []
+            elif kind == b"I":
+                results.append(self.Result())
+            elif kind == b"1":
+                self._parsed += 1
+            elif kind == b"E":
+                error = self._error(body)
+            elif kind == b"G":
+                await self._send(self._message(b"f", "COPY FROM STDIN is not supported by this call / COPY FROM STDIN bu çağrıda desteklenmiyor\0".encode()))
+            elif kind == b"Z":
+                self.transaction_status = body[:1].decode()
+                return results, error
+
+    async def _collect(self):
+        results, error = await self._read_results()
+        if error is not None:
+            raise error
+        return results
+
+    async def simple_query(self, sql):
+        """
+        Runs one or more ;-separated statements with the simple query protocol.
+
+        Bir veya daha fazla ; ile ayrılmış ifadeyi basit sorgu protokolüyle çalıştırır.
 
-        Parameters:
-        ----------
-        key : str
-            The key to retrieve the value for.
-            Değerini almak için anahtar.
+        Args:
+            sql (str): SQL sorgusu / SQL query.
 
-        Raises:
-        ----------
-        AttributeError
-            If the key does not exist in the dictionary.
-            Anahtar sözlükte bulunamazsa.
-        """
-        if key in self:
-            value = self[key]
-            if isinstance(value, dict):
-                return Dict2Dot(value)
-            return value
-        else:
-            raise AttributeError(f"'{self.__class__.__name__}' objesinde '{key}' anahtarı bulunamadı.")
+        Returns:
+            list: Her ifade için bir Result / One Result per statement.
 
+        Raises:
+            CemirPostgreSQLError: Sunucu hatası / Server error.
+        """
+        await self._send(self._message(b"Q", sql.encode() + b"\0"))
+        return await self._collect()
 
-class IPGeolocation:
-    def __init__(self):
-        self.database_url = "https://download.ip2location.com/lite/IP2LOCATION-LITE-DB1.CSV.ZIP"
-        self.database_file = "IP2LOCATION-LITE-DB1.CSV"
-        self.download_path = os.path.join(os.getcwd(), "ip_database.zip")
-        self.db_file = os.path.join(os.getcwd(), "ip_geolocation.db")
-        self.connection = None
-        self.cursor = None
+    async def _close_statements(self, names):
+        if names and not self.closed:
+            await self._send(b"".join(self._message(b"C", b"S" + name.encode() + b"\0") for name in names) + self._message(b"S", b""))
+            await self._read_results()
 
-    def ip_to_int(self, ip):
+    async def execute(self, sql, params=()):
         """
-        Converts an IP address to an integer.
+        Runs a single statement with the extended query protocol, sending params separately from the SQL ($1, $2, ...). The statement is prepared once per connection and reused from the LRU cache keyed by the SQL text.
 
-        Bir IP adresini tam sayıya dönüştürür.
+        Tek bir ifadeyi genişletilmiş sorgu protokolüyle çalıştırır; parametreler SQL'den ayrı gönderilir ($1, $2, ...). İfade bağlantı başına bir kez hazırlanır ve SQL metnine göre anahtarlanan LRU önbellekten yeniden kullanılır.
 
         Args:
-            ip (str): The IP address to convert. / Dönüştürülecek IP adresi.
+            sql (str): $1, $2 yer tutuculu SQL / SQL with $1, $2 placeholders.
+            params (tuple, optional): Parametre değerleri; dict/list JSON olarak gönderilir / Parameter values; dict/list are sent as JSON.
 
         Returns:
-            int: The integer representation of the IP address. / IP adresinin tam sayı temsili.
-        """
-        parts = ip.split('.')
-        return int(parts[0]) * 256 ** 3 + int(parts[1]) * 256 ** 2 + int(parts[2]) * 256 + int(parts[3])
+            Result: İfadenin sonucu / The statement's result.
 
-    def int_to_ip(self, ip_int):
+        Raises:
+            CemirPostgreSQLError: Sunucu hatası / Server error.
+        """
+        name, messages, cached = self._statement(sql)
+        await self._send(
+            messages
+            + self._bind_message("", name, params, self._result_formats(name))
+            + self._message(b"D", b"P\0")
+            + self._message(b"E", b"\0" + _PG_INT32.pack(0))
+            + self._message(b"S", b"")
+        )
+        try:
+            results = await self._collect()
+        except CemirPostgreSQLError as e:
+            name = self._uncache(sql, cached, e.code == "0A000")
+            await self._close_statements([name] if name is not None else [])
+            if cached and e.code == "0A000" and self.transaction_status == "I":
+                return await self.execute(sql, params)  # "cached plan must not change result type": prepare again / önbellekteki plan geçersiz: yeniden hazırla
+            raise
+        result = results[-1] if results else self.Result()
+        self._remember_formats(sql, name, result.types)
+        return result
+
+    async def _pipeline(self, statements):
+        data, lookups, known = self._pipeline_messages(statements)
+        await self._send(data)
+        results, error = await self._read_results()
+        await self._close_statements(self._pipeline_done(lookups, known, results, error))
+        return results, error
+
+    async def pipeline(self, statements):
         """
-        Converts an integer to an IP address.
+        Sends several statements with the extended query protocol (Parse/Bind/Describe/Execute each) followed by a single Sync, then reads every result, so N statements cost about one round trip. Like a multi-statement simple query, they run in one implicit transaction: if one fails, the statements before it are rolled back too and the error is raised.
 
-        Bir tam sayıyı IP adresine dönüştürür.
+        Birden çok ifadeyi genişletilmiş sorgu protokolüyle (her biri Parse/Bind/Describe/Execute) ve ardından tek bir Sync ile gönderir, sonra tüm sonuçları okur; N ifade yaklaşık tek gidiş-dönüş sürer. Çok ifadeli basit sorgu gibi tek bir örtük işlemde çalışırlar: biri başarısız olursa öncekiler de geri alınır ve hata fırlatılır.
 
         Args:
-            ip_int (int): The integer to convert. / Dönüştürülecek tam sayı.
+            statements (iterable): SQL metinleri veya (sql, params) çiftleri / SQL strings or (sql, params) pairs.
 
         Returns:
-            str: The IP address representation of the integer. / Tam sayının IP adresi temsili.
+            list: Sırayla her ifade için bir Result / One Result per statement, in order.
+
+        Raises:
+            CemirPostgreSQLError: Sunucu hatası / Server error.
         """
-        octet_1 = ip_int // (256 ** 3) % 256
-        octet_2 = ip_int // (256 ** 2) % 256
-        octet_3 = ip_int // 256 % 256
-        octet_4 = ip_int % 256
-        return f"{octet_1}.{octet_2}.{octet_3}.{octet_4}"
+        statements = [(statement, ()) if isinstance(statement, str) else statement for statement in statements]
+        if not statements:
+            return []
+        results, error = await self._pipeline(statements)
+        if error is not None:
+            raise error
+        return results
 
-    def download_database(self, force_download=False):
+    @asynccontextmanager
+    async def transaction(self):
         """
-        Downloads the IP2Location database.
+        Runs the async with block in a transaction: COMMIT when it succeeds, ROLLBACK when it raises. Inside an open transaction the block uses a savepoint instead, so transaction() blocks nest.
 
-        IP2Location veritabanını indirir.
+        async with bloğunu bir işlemde çalıştırır: başarılı biterse COMMIT, hata fırlatırsa ROLLBACK. Açık bir işlemin içinde blok bunun yerine savepoint kullanır; böylece transaction() blokları iç içe kullanılabilir.
 
-        Args:
-            force_download (bool): Whether to force the download of the zip file. / Zip dosyasını yeniden indirme zorunluluğu.
+        Raises:
+            CemirPostgreSQLError: Sunucu hatası veya bloktaki başarısız bir ifade yüzünden geri alınan işlem / Server error, or a transaction rolled back because a statement in the block failed.
         """
+        start, commit, rollback = self._transaction_commands()
+        await self.simple_query(start)
+        self._transaction_depth += 1
         try:
-            if force_download or not os.path.isfile(self.database_file):
-                # Download the database file
-                print("Downloading the database file... / Veritabanı dosyasını indiriyor...")
-                request.urlretrieve(self.database_url, self.download_path)
-                print("Database file downloaded! / Veritabanı dosyası indirildi!")
+            yield self
+        except BaseException:
+            self._transaction_depth -= 1
+            if not self.closed:
+                try:
+                    await self.simple_query(rollback)
+                except Exception:
+                    pass  # Re-raise the block's error, not the rollback's; the pool drops or rolls back the connection on release / Geri alma hatası değil bloğun hatası fırlatılır; havuz bağlantıyı geri verilirken atar veya geri alır
+            raise
+        self._transaction_depth -= 1
+        if (await self.simple_query(commit))[-1].command == "ROLLBACK":
+            raise CemirPostgreSQLError("Transaction was rolled back because a statement in it failed / İçindeki bir ifade başarısız olduğu için işlem geri alındı")
 
-                # Extract the zip file
-                with zipfile.ZipFile(self.download_path, "r") as zip_ref:
-                    zip_ref.extractall(os.getcwd())
-        except Exception as e:
-            print(f"An error occurred: {e} / Hata oluştu: {e}")
+    async def run_batch(self, batch):
+        """
+        Runs a CemirPostgreSQLBatch as one pipeline inside BEGIN ... COMMIT (or inside the open transaction); see CemirPostgreSQLConnection.run_batch.
+
+        Bir CemirPostgreSQLBatch'i BEGIN ... COMMIT içinde (veya açık işlemin içinde) tek pipeline olarak çalıştırır; bkz. CemirPostgreSQLConnection.run_batch.
+
+        Returns:
+            list: İfade başına Result, savepoint bloğunda başarısız olan ifade için CemirPostgreSQLError, çalışmayan ifadeler için None / Per statement a Result, the CemirPostgreSQLError of a statement that failed in a savepoint block, or None for statements that did not run.
+
+        Raises:
+            CemirPostgreSQLError: Savepoint bloğu dışındaki hata; batch geri alınır / Error outside a savepoint block; the batch is rolled back.
+        """
+        transaction = self.transaction_status == "I"
+        operations = batch._plan(transaction) if batch.statements else []
+        results = [None] * len(batch.statements)
+        while operations:
+            done, error = await self._pipeline([operation[:2] for operation in operations])
+            operations = batch._resume(operations, done, error, results)
+            if operations is None:
+                if transaction and not self.closed and self.transaction_status != "I":
+                    await self.simple_query("ROLLBACK")
+                raise error
+        batch.results = results
+        return results
+
+
+class CemirPostgreSQLAsyncPool:
+    """
+    asyncio pool of CemirPostgreSQLAsyncConnection objects with the same sizing, health checks, idle timeout and metrics as CemirPostgreSQLPool. Connections are opened on demand; open() opens min_size of them up front.
+
+    CemirPostgreSQLPool ile aynı boyutlandırma, sağlık kontrolü, boşta zaman aşımı ve ölçümlere sahip asyncio CemirPostgreSQLAsyncConnection havuzu. Bağlantılar gerektikçe açılır; open() min_size kadarını baştan açar.
+    """
 
-    def create_sqlite_db(self):
+    def __init__(self, connect, min_size=0, max_size=10, idle_timeout=300, acquire_timeout=30, check_interval=30):
         """
-        Creates the SQLite database and imports the CSV file into it.
+        Args:
+            connect (callable): Yeni bağlantı döndüren coroutine fonksiyonu / Coroutine function returning a new connection.
+            min_size (int, optional): Açık tutulan en az bağlantı / Connections kept open at least. Default is 0.
+            max_size (int, optional): En fazla bağlantı / Maximum connections. Default is 10.
+            idle_timeout (float, optional): Boşta bağlantının kapatılacağı saniye (min_size üzerindekiler) / Seconds after which idle connections above min_size are closed. Default is 300.
+            acquire_timeout (float, optional): Boş bağlantı için en fazla bekleme / Longest wait for a free connection. Default is 30.
+            check_interval (float, optional): Bu kadar saniye boşta kalan bağlantı teslimden önce boş bir sorguyla yoklanır / Connections idle this many seconds are pinged with an empty query before checkout. Default is 30.
+        """
+        self.connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.acquire_timeout = acquire_timeout
+        self.check_interval = check_interval
+        self._idle = []
+        self._size = 0
+        self._in_use = 0
+        self._closed = False
+        self._condition = None
+        self._stats = {"created": 0, "closed": 0, "acquired": 0, "waits": 0, "wait_time": 0.0, "max_wait_time": 0.0, "timeouts": 0, "health_check_failures": 0}
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def _get_condition(self):
+        # Created inside the running loop / Çalışan döngü içinde oluşturulur
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def open(self):
+        """
+        Opens connections until the pool holds min_size.
+
+        Havuzda min_size bağlantı olana kadar bağlantı açar.
+        """
+        while self._size < self.min_size and not self._closed:
+            self._size += 1
+            try:
+                connection = await self.connect()
+            except BaseException:
+                self._size -= 1
+                raise
+            self._stats["created"] += 1
+            self._idle.append((connection, time.monotonic()))
+
+    async def _checkout(self, deadline):
+        """
+        Takes an idle connection or reserves a slot for a new one (returns None), waiting while the pool is at max_size.
 
-        SQLite veritabanını oluşturur ve CSV dosyasını içine aktarır.
+        Boştaki bir bağlantıyı alır veya yenisi için yer ayırır (None döner); havuz max_size'dayken bekler.
         """
+        condition = self._get_condition()
+        expired = []
         try:
-            self.connection = sqlite3.connect(self.db_file)
-            self.cursor = self.connection.cursor()
+            async with condition:
+                waited_since = None
+                while True:
+                    if self._closed:
+                        raise CemirPostgreSQLError("Pool is closed / Havuz kapalı")
+
+                    now = time.monotonic()
+                    while self._idle and self._size > self.min_size and now - self._idle[0][1] >= self.idle_timeout:
+                        expired.append(self._idle.pop(0)[0])
+                        self._size -= 1
+
+                    entry = None
+                    if self._idle:
+                        entry = self._idle.pop()
+                    elif self._size < self.max_size:
+                        self._size += 1
+                        entry = (None, None)
+
+                    if entry is not None:
+                        self._in_use += 1
+                        if waited_since is not None:
+                            waited = now - waited_since
+                            self._stats["waits"] += 1
+                            self._stats["wait_time"] += waited
+                            self._stats["max_wait_time"] = max(self._stats["max_wait_time"], waited)
+                        return entry
+
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        self._stats["timeouts"] += 1
+                        raise TimeoutError("Timed out waiting for a database connection / Veritabanı bağlantısı beklenirken zaman aşımı")
+                    if waited_since is None:
+                        waited_since = now
+                    try:
+                        await asyncio.wait_for(condition.wait(), remaining)
+                    except asyncio.TimeoutError:
+                        pass
+        finally:
+            for connection in expired:
+                await connection.close()
+            self._stats["closed"] += len(expired)
+
+    async def _forget(self, close_count=0):
+        condition = self._get_condition()
+        async with condition:
+            self._size -= 1
+            self._in_use -= 1
+            self._stats["closed"] += close_count
+            condition.notify()
+
+    async def _healthy(self, connection, released_at):
+        if connection.closed or connection.transaction_status != "I":
+            return False
+        if time.monotonic() - released_at >= self.check_interval:
+            try:
+                await connection.simple_query("")
+            except (CemirPostgreSQLError, OSError):
+                return False
+        return True
 
-            print("Creating SQLite database table... / SQLite veritabanı tablosu oluşturuluyor...")
-            # Create the table
-            self.cursor.execute('''CREATE TABLE IF NOT EXISTS ip_geolocation
-                        (ip_start INTEGER PRIMARY KEY,
-                        ip_end INTEGER,
-                        country_code TEXT,
-                        country_name TEXT)''')
+    async def acquire(self, timeout=None):
+        """
+        Takes a healthy connection from the pool, opening a new one or waiting for one to be released if needed.
 
-            # Read the CSV file and import it into the database
-            with open(self.database_file, "r", encoding="utf-8") as csvfile:
-                csv_reader = csv.reader(csvfile)
-                next(csv_reader)  # Skip the header row
-                for row in csv_reader:
-                    self.cursor.execute("INSERT INTO ip_geolocation VALUES (?, ?, ?, ?)", row)
+        Havuzdan sağlıklı bir bağlantı alır; gerekirse yenisini açar veya bir bağlantı boşalana kadar bekler.
 
-            print("SQLite database table created! / SQLite veritabanı tablosu oluşturuldu!")
+        Args:
+            timeout (float, optional): En fazla bekleme / Longest wait. Default is acquire_timeout.
 
-            # Commit the changes
-            self.connection.commit()
-        except Exception as e:
-            print(f"An error occurred: {e} / Hata oluştu: {e}")
+        Returns:
+            CemirPostgreSQLAsyncConnection: Bağlantı / The connection.
 
-    def get_ip_location(self, ip_address, force_download=False):
+        Raises:
+            TimeoutError: Süre içinde bağlantı boşalmazsa / If no connection frees up in time.
+        """
+        deadline = time.monotonic() + (self.acquire_timeout if timeout is None else timeout)
+        while True:
+            connection, released_at = await self._checkout(deadline)
+            if connection is None:
+                try:
+                    connection = await self.connect()
+                except BaseException:
+                    await self._forget()
+                    raise
+                self._stats["created"] += 1
+                break
+
+            if await self._healthy(connection, released_at):
+                break
+            self._stats["health_check_failures"] += 1
+            await connection.close()
+            await self._forget(close_count=1)
+
+        self._stats["acquired"] += 1
+        return connection
+
+    async def release(self, connection):
         """
-        Returns the location information for the given IP address.
+        Returns a connection to the pool; a transaction left open is rolled back and broken connections are dropped.
 
-        Verilen IP adresinin lokasyon bilgisini döndürür.
+        Bağlantıyı havuza geri verir; açık kalan işlem geri alınır, kopmuş bağlantılar atılır.
+        """
+        if not connection.closed and connection.transaction_status != "I":
+            try:
+                await connection.simple_query("ROLLBACK")
+            except (CemirPostgreSQLError, OSError):
+                await connection.close()
 
-        Args:
-            ip_address (str): The IP address to lookup. / Sorgulanacak IP adresi.
-            force_download (bool): Whether to force the download of the zip file. / Zip dosyasını yeniden indirme zorunluluğu.
+        if connection.closed or self._closed:
+            await connection.close()
+            await self._forget(close_count=1)
+            return
 
-        Returns:
-            dict: The location information for the IP address. / IP adresinin lokasyon bilgisi.
+        condition = self._get_condition()
+        async with condition:
+            self._idle.append((connection, time.monotonic()))
+            self._in_use -= 1
+            condition.notify()
+
+    @asynccontextmanager
+    async def connection(self, timeout=None):
+        """
+        Lends a connection for the duration of an async with block.
+
+        Bağlantıyı async with bloğu süresince ödünç verir.
+
+        Örnek/Example:
+            async with pool.connection() as conn:
+                await conn.execute("SELECT $1::int", (1,))
         """
+        connection = await self.acquire(timeout)
         try:
-            # Create the SQLite database if it does not exist or if force download is requested
-            if not os.path.isfile(self.db_file) or force_download:
-                self.download_database(force_download)
-                self.create_sqlite_db()
+            yield connection
+        finally:
+            await self.release(connection)
 
-            # Query the location information for the IP address
-            print("Querying the location information for the IP address... / IP adresinin lokasyon bilgisini sorguluyor...")
-            self.connection = sqlite3.connect(self.db_file)
-            self.cursor = self.connection.cursor()
+    async def close(self):
+        """
+        Closes the pool: idle connections now, connections in use when they are released.
 
-            # SQLite query
-            query = "SELECT * FROM ip_geolocation WHERE ip_start <= ? AND ip_end >= ?"
-            ip_int = self.ip_to_int(ip_address)
-            self.cursor.execute(query, (ip_int, ip_int))
-            row = self.cursor.fetchone()
-            if row:
-                return {"status": True, "ip_address": ip_address, "ipint": ip_int, "country_code": row[2], "country_name": row[3]}
-            else:
-                return {"status": False, "ip_address": ip_address}
-        except Exception as e:
-            print(f"An error occurred: {e} / Hata oluştu: {e}")
-            return None
+        Havuzu kapatır: boştaki bağlantılar hemen, kullanımdakiler geri verildiğinde kapatılır.
+        """
+        condition = self._get_condition()
+        async with condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._stats["closed"] += len(idle)
+            condition.notify_all()
+        for connection, _ in idle:
+            await connection.close()
+
+    def pool_info(self):
+        """
+        Returns pool metrics.
 
+        Havuz ölçümlerini döndürür.
 
-class CemirPostgreSQL:
-    def __init__(self, dbhost, dbport, dbuser, dbpassword, dbname, timeout=10, dbcreate_db_if_not_exists=False):
+        Returns:
+            dict: size, idle, in_use, created, closed, acquired, waits, wait_time, avg_wait_time, max_wait_time, timeouts, health_check_failures
         """
-        Initialize the CemirPostgreSQL instance.
+        info = {"size": self._size, "idle": len(self._idle), "in_use": self._in_use, "min_size": self.min_size, "max_size": self.max_size, **self._stats}
+        info["avg_wait_time"] = info["wait_time"] / info["waits"] if info["waits"] else 0.0
+        return info
+
+
+class CemirPostgreSQLAsync:
+    """
+    asyncio counterpart of CemirPostgreSQL's 'wire' backend: raw/execute_query/insert/read/update/delete as coroutines on a CemirPostgreSQLAsyncPool, plus pipeline() to run many small statements in one round trip. Results and JSON error strings match CemirPostgreSQL.
+
+    CemirPostgreSQL'in 'wire' arka ucunun asyncio karşılığı: CemirPostgreSQLAsyncPool üzerinde coroutine olarak raw/execute_query/insert/read/update/delete, ayrıca birçok küçük ifadeyi tek gidiş-dönüşte çalıştıran pipeline(). Sonuçlar ve JSON hata metinleri CemirPostgreSQL ile aynıdır.
+    """
+
+    def __init__(self, dbhost, dbport, dbuser, dbpassword, dbname, timeout=10, pool_min_size=0, pool_max_size=10, pool_idle_timeout=300, statement_cache_size=100, binary_results=False):
+        """
+        Initialize the CemirPostgreSQLAsync instance. Use `async with CemirPostgreSQLAsync(...) as db:` to open pool_min_size connections up front and close the pool at the end.
 
         Args:
             dbhost (str): Veritabanı hostu / Database host.
@@ -1453,7 +6075,11 @@ class CemirPostgreSQL:
             dbpassword (str): Veritabanı şifresi / Database password.
             dbname (str): Veritabanı adı / Database name.
             timeout (int, optional): Sorgu zaman aşımı süresi / Query timeout. Default is 10.
-            dbcreate_db_if_not_exists (bool, optional): Eğer veritabanı yoksa oluştur / Create database if not exists.
+            pool_min_size (int, optional): Havuzda açık tutulan en az bağlantı / Connections the pool keeps open at least. Default is 0.
+            pool_max_size (int, optional): Havuzdaki en fazla bağlantı / Maximum pooled connections. Default is 10.
+            pool_idle_timeout (float, optional): Boştaki fazla bağlantıların kapatılacağı saniye / Seconds after which surplus idle connections are closed. Default is 300.
+            statement_cache_size (int, optional): Bağlantı başına önbelleğe alınan hazır ifade sayısı / Prepared statements cached per connection. Default is 100.
+            binary_results (bool, optional): Hazır ifadelerde int, float8, bool, timestamp, uuid, bytea ve json(b) sonuçlarını ikili biçimde al; değerler aynı, çözme daha ucuz / Fetch int, float8, bool, timestamp, uuid, bytea and json(b) results of prepared statements in binary format; same values, cheaper decoding. Default is False.
         """
         self.dbhost = dbhost
         self.dbport = dbport
@@ -1461,40 +6087,106 @@ class CemirPostgreSQL:
         self.dbpassword = dbpassword
         self.dbname = dbname
         self.timeout = timeout
-        self.dbcreate_db_if_not_exists = dbcreate_db_if_not_exists
+        self.statement_cache_size = statement_cache_size
+        self.binary_results = binary_results
+        self.statement_stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self.pool = CemirPostgreSQLAsyncPool(self.connect, min_size=pool_min_size, max_size=pool_max_size, idle_timeout=pool_idle_timeout, acquire_timeout=timeout)
 
-        if dbcreate_db_if_not_exists:
-            self.create_database(dbname)
+    async def __aenter__(self):
+        await self.pool.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
 
     def get_methods(self):
         """
-        CemirPostgreSQL sınıfının mevcut tüm metodlarının isimlerini yazdırır.
-        Prints all available method names of the CemirPostgreSQL class.
+        CemirPostgreSQLAsync sınıfının mevcut tüm metodlarının isimlerini yazdırır.
+        Prints all available method names of the CemirPostgreSQLAsync class.
         """
-        return [method for method in dir(CemirPostgreSQL) if callable(getattr(CemirPostgreSQL, method)) and not method.startswith("__")]
+        return [method for method in dir(CemirPostgreSQLAsync) if callable(getattr(CemirPostgreSQLAsync, method)) and not method.startswith("__")]
 
-    def parse_output(self, output):
+    async def connect(self, dbname=None):
         """
-        psql komutunun çıktısını parse ederek dict yapısına çevirir.
-        Parses the output of a psql command and converts it into a dictionary.
+        Yeni bir asyncio wire protokol bağlantısı açar.
+        Opens a new asyncio wire protocol connection.
 
         Args:
-            output (str): psql komutunun çıktısı / Output of the psql command.
+            dbname (str, optional): Veritabanı adı / Database name. Eğer verilmezse, self.dbname kullanılır / If not provided, self.dbname is used.
 
         Returns:
-            dict: Dict formatında çıktı / Output in dict format.
+            CemirPostgreSQLAsyncConnection: Kimliği doğrulanmış bağlantı / Authenticated connection.
         """
-        lines = output.strip().split('\n')
-        headers = lines[0].split('|')
-        data = []
+        return await CemirPostgreSQLAsyncConnection.connect(self.dbhost, self.dbport, self.dbuser, self.dbpassword, dbname or self.dbname, timeout=self.timeout, statement_cache_size=self.statement_cache_size, statement_stats=self.statement_stats, binary_results=self.binary_results)
 
-        for line in lines[2:-1]:  # İlk iki satır ve son satır başlık ve ayırıcılar olduğu için atlanır / Skip first two and last line as they are headers and separators
-            values = line.split('|')
-            data.append({header.strip(): value.strip() for header, value in zip(headers, values)})
+    def connection(self, timeout=None):
+        """
+        Havuzdan bir bağlantıyı async with bloğu süresince ödünç verir.
+        Lends a pooled connection for the duration of an async with block.
 
-        return data
+        Örnek/Example:
+            async with db.connection() as conn:
+                await conn.execute("SELECT * FROM users WHERE id = $1", (1,))
+        """
+        return self.pool.connection(timeout)
+
+    def pool_info(self):
+        """
+        Bağlantı havuzu ölçümlerini döndürür (kullanımda, bekleme süresi, oluşturma...).
+        Returns connection pool metrics (in use, wait time, creations...).
+        """
+        return self.pool.pool_info()
+
+    def stats(self):
+        """
+        Hazır ifade önbelleği sayaçlarını ve havuz ölçümlerini döndürür.
+        Returns prepared statement cache counters and pool metrics.
+
+        Returns:
+            dict: {"statements": {"hits", "misses", "evictions", "hit_ratio"}, "pool": pool_info()}
+        """
+        with _PG_STATS_LOCK:
+            statements = dict(self.statement_stats)
+        lookups = statements["hits"] + statements["misses"]
+        statements["hit_ratio"] = statements["hits"] / lookups if lookups else 0.0
+        return {"statements": statements, "pool": self.pool.pool_info()}
 
-    def execute_query(self, query, dbname=None):
+    async def close(self):
+        """
+        Bağlantı havuzunu kapatır.
+        Closes the connection pool.
+        """
+        await self.pool.close()
+
+    async def _call(self, operation, dbname=None):
+        """
+        operation(connection) coroutine'ini havuzdaki bir bağlantıyla (veya başka veritabanı için geçici bir bağlantıyla) timeout süresi içinde çalıştırır; hatalar JSON formatında hata bilgisine çevrilir.
+        Runs the operation(connection) coroutine on a pooled connection (or a one-off connection to another database) within timeout; errors become error information in JSON format.
+        """
+        try:
+            if dbname is not None and dbname != self.dbname:
+                async with await self.connect(dbname) as connection:
+                    return await asyncio.wait_for(operation(connection), self.timeout)
+
+            async with self.pool.connection() as connection:
+                return await asyncio.wait_for(operation(connection), self.timeout)
+        except CemirPostgreSQLError as e:
+            return json.dumps({"error": "Query failed", "message": str(e)}, ensure_ascii=False)
+        except (asyncio.TimeoutError, TimeoutError):
+            return json.dumps({"error": "TimeOut", "message": "timed out"}, ensure_ascii=False)
+        except OSError as e:
+            return json.dumps({"error": "Connection failed", "message": str(e)}, ensure_ascii=False)
+
+    async def _query(self, query, dbname=None, params=None):
+        if params is not None:
+            return await self._call(lambda connection: connection.execute(query, params), dbname)
+
+        async def operation(connection):
+            return (await connection.simple_query(query))[-1]
+
+        return await self._call(operation, dbname)
+
+    async def execute_query(self, query, dbname=None, params=None):
         """
         Veritabanına SQL sorgusu gönderir ve sonucu döndürür.
         Sends an SQL query to the database and returns the result.
@@ -1502,33 +6194,14 @@ class CemirPostgreSQL:
         Args:
             query (str): SQL sorgusu / SQL query.
             dbname (str, optional): Veritabanı adı / Database name. Eğer verilmezse, self.dbname kullanılır / If not provided, self.dbname is used.
+            params (tuple, optional): $1, $2 yer tutucularının değerleri; verilirse sorgu hazır ifade olarak çalışır / Values for $1, $2 placeholders; when given the query runs as a cached prepared statement.
 
         Returns:
-            str: Sorgu sonucu veya JSON formatında hata bilgisi / Query result or error information in JSON format.
+            list or str: Satır döndüren sorgular için dict listesi, diğerleri için komut etiketi veya JSON formatında hata bilgisi / A list of dicts for queries returning rows, otherwise the command tag, or error information in JSON format.
         """
-        if dbname is None:
-            dbname = self.dbname
-
-        query = query.replace("\n", "").strip()
-        command = f'''PGPASSWORD={self.dbpassword} psql -h {self.dbhost} -p {self.dbport} -U {self.dbuser} -d {dbname} -c {json.dumps(query, ensure_ascii=False)}'''
-
-        try:
-            result = subprocess.run(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=self.timeout)
-            if result.returncode != 0:
-                error_info = {
-                    "error": "Query failed",
-                    "message": result.stderr.strip()
-                }
-                return json.dumps(error_info, ensure_ascii=False)
-            return result.stdout.strip()
-        except subprocess.TimeoutExpired as e:
-            error_info = {
-                "error": "TimeOut",
-                "message": f"timed out"
-            }
-            return json.dumps(error_info, ensure_ascii=False)
+        return CemirPostgreSQL._output(await self._query(query, dbname, params))
 
-    def raw(self, query, print_query=False):
+    async def raw(self, query, print_query=False, params=None):
         """
         Ham SQL sorgusu çalıştırır ve sonucu döndürür.
         Executes a raw SQL query and returns the result.
@@ -1536,78 +6209,88 @@ class CemirPostgreSQL:
         Args:
             query (str): SQL sorgusu / SQL query.
             print_query (bool, optional): Sorguyu yazdır / Print the query. Default is False.
+            params (tuple, optional): $1, $2 yer tutucularının değerleri / Values for $1, $2 placeholders.
 
         Returns:
-            str: Sorgu sonucu veya JSON formatında hata bilgisi / Query result or error information in JSON format.
+            list or str: Sorgu sonucu veya JSON formatında hata bilgisi / Query result or error information in JSON format.
         """
         if print_query: print(query)
-        return self.execute_query(query)
+        return await self.execute_query(query, params=params)
 
-    def insert(self, table_name, columns, values, get_id=False):
+    async def pipeline(self, queries):
         """
-        Veritabanına yeni kayıt ekler.
-        Inserts a new record into the database.
+        Birçok ifadeyi tek Sync ile, yaklaşık tek gidiş-dönüşte çalıştırır; ifadeler tek bir örtük işlemde çalışır, biri başarısız olursa hepsi geri alınır.
+        Runs many statements with a single Sync, in about one round trip; they run in one implicit transaction and all are rolled back if one fails.
 
         Args:
-            table_name (str): Tablo adı / Table name.
-            columns (tuple): Kolon adları / Column names (örnek/example: ("id", "name", "data")).
-            values (tuple): Kolon değerleri / Column values (örnek/example: (1, "John Doe", {"age": 30, "city": "Istanbul"})).
-            get_id (bool): İşlem yapılan ID / Get the ID of the inserted record.
+            queries (iterable): SQL metinleri veya (sql, params) çiftleri / SQL strings or (sql, params) pairs (örnek/example: [("SELECT * FROM users WHERE id = $1", (1,)), "SELECT now()"]).
 
         Returns:
-            str: Sorgu sonucu veya JSON formatında hata bilgisi / Query result or error information in JSON format.
+            list or str: Her ifade için dict listesi veya komut etiketi, ya da JSON formatında hata bilgisi / A list of dicts or the command tag per statement, or error information in JSON format.
         """
-        columns_str = ', '.join(columns)
+        queries = list(queries)
 
-        formatted_values = []
-        for value in values:
-            if isinstance(value, dict):
-                formatted_values.append(f"'{json.dumps(value)}'::jsonb")
-            else:
-                formatted_values.append(f"'{value}'")
+        async def operation(connection):
+            return [CemirPostgreSQL._output(result) for result in await connection.pipeline(queries)]
 
-        values_str = ', '.join(formatted_values)
-        query = f"INSERT INTO {table_name} ({columns_str}) VALUES ({values_str})"
-        if get_id:
-            query += f" RETURNING id;"
-            try:
-                result = self.execute_query(query).split()[2]
-                return {"error": False, "id": int(result)}
-            except ValueError:
-                return self.execute_query(query)
+        return await self._call(operation)
 
-        return self.execute_query(query)
+    @asynccontextmanager
+    async def transaction(self):
+        """
+        Havuzdan bir bağlantıyı bir işlem içinde ödünç verir: blok başarıyla biterse COMMIT, hata fırlatırsa ROLLBACK. İç içe conn.transaction() blokları savepoint kullanır.
+        Lends a pooled connection inside a transaction: COMMIT when the block succeeds, ROLLBACK when it raises. Nested conn.transaction() blocks use savepoints.
 
-    def create_database(self, dbname):
+        Örnek/Example:
+            async with db.transaction() as conn:
+                await conn.execute("UPDATE accounts SET balance = balance - $1 WHERE id = $2", (100, 1))
+
+        Raises:
+            CemirPostgreSQLError: Sunucu hatası / Server error.
         """
-        Belirtilen ad ile yeni bir veritabanı oluşturur.
-        Creates a new database with the specified name.
+        async with self.pool.connection() as connection, connection.transaction():
+            yield connection
 
-        Args:
-            dbname (str): Oluşturulacak veritabanının adı / Name of the database to be created.
+    def batch(self):
+        """
+        İfadeleri toplayıp tek işlemde, tek gidiş-dönüşte çalıştıran bir CemirPostgreSQLBatch döndürür; run() bir coroutine döndürür, async with bloğundan çıkışta beklenir. Sonuçlar CemirPostgreSQL.batch ile aynıdır.
+        Returns a CemirPostgreSQLBatch that collects statements and runs them in one transaction and one round trip; run() returns a coroutine, awaited on leaving an async with block. Results match CemirPostgreSQL.batch.
 
-        Returns:
-            str: Sorgu sonucu veya JSON formatında hata bilgisi / Query result or error information in JSON format.
+        Örnek/Example:
+            async with db.batch() as batch:
+                batch.execute("INSERT INTO users (name) VALUES ($1)", ("Cem",))
+            print(batch.results)
         """
-        query = f"CREATE DATABASE {dbname};"
-        return self.execute_query(query, dbname='postgres')
+        async def run(batch):
+            async def operation(connection):
+                return [CemirPostgreSQL._output(result) for result in await connection.run_batch(batch)]
 
-    def create_table(self, table_name, schema):
+            batch.results = await self._call(operation)
+            return batch.results
+
+        return CemirPostgreSQLBatch(run)
+
+    async def insert(self, table_name, columns, values, get_id=False):
         """
-        Veritabanında tablo oluşturur.
-        Creates a table in the database.
+        Veritabanına yeni kayıt ekler; değerler parametre olarak bağlanır.
+        Inserts a new record into the database; values are bound as parameters.
 
         Args:
             table_name (str): Tablo adı / Table name.
-            schema (str): Tablo şeması / Table schema (örnek/example: "id SERIAL PRIMARY KEY, name VARCHAR(100), data JSONB").
+            columns (tuple): Kolon adları / Column names (örnek/example: ("id", "name", "data")).
+            values (tuple): Kolon değerleri / Column values (örnek/example: (1, "John Doe", {"age": 30, "city": "Istanbul"})).
+            get_id (bool): İşlem yapılan ID / Get the ID of the inserted record.
 
         Returns:
-            str: Sorgu sonucu veya JSON formatında hata bilgisi / Query result or error information in JSON format.
+            str or dict: Komut etiketi, {"error": False, "id": id} veya JSON formatında hata bilgisi / The command tag, {"error": False, "id": id} or error information in JSON format.
         """
-        query = f"CREATE TABLE {table_name} ({schema});"
-        return self.execute_query(query)
+        placeholders = ', '.join(f"${i}" for i in range(1, len(values) + 1))
+        query = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
+        if get_id:
+            query += " RETURNING id"
+        return CemirPostgreSQL._write_result(await self._query(query, params=tuple(values)), get_id)
 
-    def read(self, table_name, columns='*', condition=None):
+    async def read(self, table_name, columns='*', condition=None, params=None, columnar=False):
         """
         Veritabanından kayıt okur.
         Reads records from the database.
@@ -1615,7 +6298,9 @@ class CemirPostgreSQL:
         Args:
             table_name (str): Tablo adı / Table name.
             columns (str or tuple, optional): Kolon adları / Column names. Default is '*'.
-            condition (str, optional): Koşul / Condition.
+            condition (str, optional): Koşul / Condition (örnek/example: "id = $1").
+            params (tuple, optional): Koşuldaki $1, $2 değerleri / Values for $1, $2 in the condition.
+            columnar (bool, optional): Satır listesi yerine {kolon: değer listesi} döndür / Return {column: list of values} instead of a list of rows. Default is False.
 
         Returns:
             list or dict: Sorgu sonucu veya JSON formatında hata bilgisi / Query result or error information in JSON format.
@@ -1624,20 +6309,18 @@ class CemirPostgreSQL:
             columns = ', '.join(columns)
 
         query = f"SELECT {columns} FROM {table_name}"
-
         if condition:
             query += f" WHERE {condition}"
 
-        query += ";"
-
-        result = self.parse_output(self.execute_query(query))
-
-        if len(result) == 1:
-            print(result[0], type(result[0]))
+        result = await self._query(query, params=tuple(params or ()))
+        if columnar and not isinstance(result, str):
+            return result.columnar()
+        result = CemirPostgreSQL._output(result)
+        if isinstance(result, list) and len(result) == 1:
             return result[0]
         return result
 
-    def update(self, table_name, updates, condition, get_id=False):
+    async def update(self, table_name, updates, condition, get_id=False, params=None):
         """
         Veritabanındaki kaydı günceller.
         Updates a record in the database.
@@ -1645,45 +6328,39 @@ class CemirPostgreSQL:
         Args:
             table_name (str): Tablo adı / Table name.
             updates (dict): Güncellemeler / Updates (örnek/example: {"name": "Jane Doe"}).
-            condition (str): Koşul / Condition (örnek/example: "id = 1").
+            condition (str): Koşul / Condition (örnek/example: "id = $1").
             get_id (bool): İşlem yapılan ID / Get the ID of the updated record.
+            params (tuple, optional): Koşuldaki $1, $2 değerleri; güncelleme değerleri bunlardan sonra numaralanır / Values for $1, $2 in the condition; update values are numbered after them.
 
         Returns:
-            str: Sorgu sonucu veya JSON formatında hata bilgisi / Query result or error information in JSON format.
+            str or dict: Sorgu sonucu veya JSON formatında hata bilgisi / Query result or error information in JSON format.
         """
-        update_str = ', '.join(f"{k} = '{json.dumps(v)}'" if isinstance(v, dict) else f"{k} = '{v}'" for k, v in updates.items())
+        params = tuple(params or ())
+        update_str = ', '.join(f"{k} = ${len(params) + i}" for i, k in enumerate(updates, 1))
         query = f"UPDATE {table_name} SET {update_str} WHERE {condition}"
         if get_id:
-            query += f" RETURNING id;"
-            try:
-                result = self.execute_query(query).split()[2]
-                return {"error": False, "id": int(result)}
-            except ValueError:
-                return self.execute_query(query)
+            query += " RETURNING id"
+        return CemirPostgreSQL._write_result(await self._query(query, params=params + tuple(updates.values())), get_id)
 
-        return self.execute_query(query)
-
-    def delete(self, table_name, condition):
+    async def delete(self, table_name, condition, params=None):
         """
         Veritabanındaki kaydı siler.
         Deletes a record from the database.
 
         Args:
             table_name (str): Tablo adı / Table name.
-            condition (str): Koşul / Condition (örnek/example: "id = 1").
+            condition (str): Koşul / Condition (örnek/example: "id = $1").
+            params (tuple, optional): Koşuldaki $1, $2 değerleri / Values for $1, $2 in the condition.
 
         Returns:
-            str: Sorgu sonucu veya JSON formatında hata bilgisi / Query result or error information in JSON format.
+            dict or str: Silme durumu veya JSON formatında hata bilgisi / Deletion status or error information in JSON format.
         """
-        query = f"DELETE FROM {table_name} WHERE {condition};"
-        try:
-            result = int(self.execute_query(query).split()[1])
-            if result == 0:
-                return {"error": True, "status": "record_not_found"}
-            if result > 0:
-                return {"error": False, "status": "record_deleted"}
-        except:
-            return self.execute_query(query)
+        result = await self._query(f"DELETE FROM {table_name} WHERE {condition}", params=tuple(params or ()))
+        if isinstance(result, str):
+            return result
+        if result.rowcount == 0:
+            return {"error": True, "status": "record_not_found"}
+        return {"error": False, "status": "record_deleted"}
 
 
 class CemirUtils:
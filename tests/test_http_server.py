@@ -0,0 +1,213 @@
+import base64
+import gzip
+import http.client
+import os
+import threading
+
+import pytest
+
+from cemirutils import CemirUtilsHTTP
+
+
+BODY = bytes(range(256)) * 4
+
+
+@pytest.fixture
+def site(tmp_path):
+    (tmp_path / "data.bin").write_bytes(BODY)
+    (tmp_path / "page.txt").write_text("hello " * 200, encoding="utf-8")
+    return tmp_path
+
+
+def serve(directory, auth=None, gzip_cache=None):
+    handler = CemirUtilsHTTP()._make_handler(str(directory), auth, gzip_cache)
+    handler.log_message = lambda *args: None
+    httpd = CemirUtilsHTTP.PooledHTTPServer(("127.0.0.1", 0), handler, workers=4)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+
+@pytest.fixture
+def server(site):
+    httpd = serve(site)
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def fetch(httpd, path, headers=None, method="GET"):
+    connection = http.client.HTTPConnection(*httpd.server_address, timeout=5)
+    try:
+        connection.request(method, path, headers=headers or {})
+        response = connection.getresponse()
+        return response.status, response.headers, response.read()
+    finally:
+        connection.close()
+
+
+def test_file_response_sets_validators(site):
+    status, headers, body, byte_range = CemirUtilsHTTP.file_response(str(site / "data.bin"), {}, "application/octet-stream")
+    body.close()
+    headers = dict(headers)
+    fs = os.stat(site / "data.bin")
+    assert status == 200
+    assert headers["ETag"] == f'"{fs.st_mtime_ns:x}-{fs.st_size:x}"'
+    assert headers["Content-Length"] == str(len(BODY))
+    assert headers["Accept-Ranges"] == "bytes"
+    assert byte_range == (0, len(BODY))
+
+
+@pytest.mark.parametrize("range_header, expected", [
+    ("bytes=0-0", (0, 0)),
+    ("bytes=10-19", (10, 19)),
+    ("bytes=1000-", (1000, 1023)),
+    ("bytes=1000-5000", (1000, 1023)),
+    ("bytes=-24", (1000, 1023)),
+    ("bytes=-5000", (0, 1023)),
+    ("bytes=1024-", "unsatisfiable"),
+    ("bytes=20-10", "unsatisfiable"),
+    ("bytes=0-1,5-6", None),
+    ("items=0-1", None),
+    ("bytes=a-b", None),
+])
+def test_parse_range(range_header, expected):
+    assert CemirUtilsHTTP.parse_range({"Range": range_header}, 1024, '"tag"', "date") == expected
+
+
+def test_parse_range_honours_if_range():
+    headers = {"Range": "bytes=0-9", "If-Range": '"old"'}
+    assert CemirUtilsHTTP.parse_range(headers, 1024, '"new"', "date") is None
+    headers["If-Range"] = '"new"'
+    assert CemirUtilsHTTP.parse_range(headers, 1024, '"new"', "date") == (0, 9)
+
+
+def test_server_answers_full_and_ranged_requests(server):
+    status, headers, body = fetch(server, "/data.bin")
+    assert status == 200
+    assert body == BODY
+
+    status, headers, body = fetch(server, "/data.bin", {"Range": "bytes=100-199"})
+    assert status == 206
+    assert headers["Content-Range"] == f"bytes 100-199/{len(BODY)}"
+    assert body == BODY[100:200]
+
+    status, headers, body = fetch(server, "/data.bin", {"Range": "bytes=-10"})
+    assert status == 206
+    assert body == BODY[-10:]
+
+
+def test_server_answers_416_past_the_end(server):
+    status, headers, body = fetch(server, "/data.bin", {"Range": f"bytes={len(BODY)}-"})
+    assert status == 416
+    assert headers["Content-Range"] == f"bytes */{len(BODY)}"
+    assert body == b""
+
+
+def test_server_answers_304_for_matching_validators(server):
+    _, headers, _ = fetch(server, "/data.bin")
+    etag, last_modified = headers["ETag"], headers["Last-Modified"]
+
+    assert fetch(server, "/data.bin", {"If-None-Match": etag})[0] == 304
+    assert fetch(server, "/data.bin", {"If-None-Match": f'"other", W/{etag}'})[0] == 304
+    assert fetch(server, "/data.bin", {"If-None-Match": "*"})[0] == 304
+    assert fetch(server, "/data.bin", {"If-None-Match": '"other"'})[0] == 200
+    assert fetch(server, "/data.bin", {"If-Modified-Since": last_modified})[0] == 304
+    assert fetch(server, "/data.bin", {"If-Modified-Since": "Thu, 01 Jan 1970 00:00:00 GMT"})[0] == 200
+    # If-None-Match wins over If-Modified-Since / If-None-Match, If-Modified-Since'a üstün gelir
+    assert fetch(server, "/data.bin", {"If-None-Match": '"other"', "If-Modified-Since": last_modified})[0] == 200
+
+
+def test_server_ignores_stale_if_range(server):
+    status, _, body = fetch(server, "/data.bin", {"Range": "bytes=0-9", "If-Range": '"stale"'})
+    assert status == 200
+    assert body == BODY
+
+
+def test_server_head_sends_no_body(server):
+    status, headers, body = fetch(server, "/data.bin", method="HEAD")
+    assert status == 200
+    assert headers["Content-Length"] == str(len(BODY))
+    assert body == b""
+
+
+
+def test_server_gzip_variant(site):
+    httpd = serve(site, gzip_cache=CemirUtilsHTTP.GzipCache())
+    try:
+        status, headers, body = fetch(httpd, "/page.txt", {"Accept-Encoding": "gzip"})
+        assert status == 200
+        assert headers["Content-Encoding"] == "gzip"
+        assert headers["Vary"] == "Accept-Encoding"
+        assert gzip.decompress(body) == (site / "page.txt").read_bytes()
+
+        status, headers, body = fetch(httpd, "/page.txt", {"Accept-Encoding": "gzip;q=0"})
+        assert headers.get("Content-Encoding") is None
+        assert body == (site / "page.txt").read_bytes()
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_gzip_cache_reuses_compressed_body(site):
+    cache = CemirUtilsHTTP.GzipCache()
+    path = str(site / "page.txt")
+    fs = os.stat(path)
+    body = cache.get(path, fs)
+    assert cache.get(path, fs) is body
+    assert cache.size == len(body)
+
+
+def basic(username, password):
+    return "Basic " + base64.b64encode(f"{username}:{password}".encode()).decode()
+
+
+def test_basic_auth_plain_credentials():
+    auth = CemirUtilsHTTP.BasicAuth("admin", "s3cret")
+    assert auth.check(basic("admin", "s3cret")) is True
+    assert auth.check(basic("admin", "wrong")) is False
+    assert auth.check(basic("nobody", "s3cret")) is False
+    assert auth.check(None) is False
+    assert auth.check("Bearer abc") is False
+    assert auth.check("Basic not-base64!") is False
+    assert auth.check("Basic " + base64.b64encode(b"no-colon").decode()) is False
+
+
+def test_basic_auth_password_file(tmp_path):
+    path = tmp_path / "passwords"
+    entry = CemirUtilsHTTP.BasicAuth.hash_password("pa:ss", iterations=1000)
+    path.write_text(f"# users\n\nalice:{entry}\n", encoding="utf-8")
+    auth = CemirUtilsHTTP.BasicAuth(password_file=str(path))
+    assert auth.check(basic("alice", "pa:ss")) is True
+    assert auth.check(basic("alice", "pa")) is False
+
+    path.write_text("alice:md5$1$x$y\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="line 1"):
+        auth.load_password_file(str(path))
+
+
+def test_basic_auth_caches_decisions():
+    auth = CemirUtilsHTTP.BasicAuth("admin", "s3cret", cache_size=2)
+    for password in ("s3cret", "a", "b"):
+        auth.check(basic("admin", password))
+    assert len(auth.cache) == 2
+    assert basic("admin", "s3cret") not in auth.cache
+
+    auth.verify = None  # Cached headers must not reach verify / Önbellekteki başlıklar verify'a ulaşmamalı
+    assert auth.check(basic("admin", "b")) is False
+
+
+def test_server_requires_credentials(site):
+    httpd = serve(site, auth=CemirUtilsHTTP.BasicAuth("admin", "s3cret"))
+    try:
+        status, headers, _ = fetch(httpd, "/data.bin")
+        assert status == 401
+        assert headers["WWW-Authenticate"] == 'Basic realm="CemirUtils"'
+        assert fetch(httpd, "/data.bin", method="HEAD")[0] == 401
+        assert fetch(httpd, "/data.bin", {"Authorization": basic("admin", "wrong")})[0] == 401
+
+        status, _, body = fetch(httpd, "/data.bin", {"Authorization": basic("admin", "s3cret")})
+        assert status == 200
+        assert body == BODY
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
@@ -0,0 +1,212 @@
+import pytest
+
+from cemirutils import IPGeolocation
+
+
+CSV = '''"ip_from","ip_to","country_code","country_name"
+"0","16777215","-","-"
+"16777216","16777471","AU","Australia"
+"16777472","16778239","CN","China"
+"16779264","16781311","AU","Australia"
+'''
+
+
+@pytest.fixture
+def geo():
+    return IPGeolocation(in_memory=True)
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "ranges.csv"
+    path.write_text(CSV, encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def index(geo, csv_file):
+    return geo._build_range_index(source=csv_file)
+
+
+def test_range_index_interns_countries(index):
+    assert len(index) == 4
+    assert index.countries == [("-", "-"), ("AU", "Australia"), ("CN", "China")]
+    assert list(index.country_idx) == [0, 1, 2, 1]
+
+
+@pytest.mark.parametrize("ip_int, expected", [
+    (0, ("-", "-")),
+    (16777215, ("-", "-")),
+    (16777216, ("AU", "Australia")),
+    (16777471, ("AU", "Australia")),
+    (16777472, ("CN", "China")),
+    (16778239, ("CN", "China")),
+    (16778240, None),
+    (16779263, None),
+    (16779264, ("AU", "Australia")),
+    (16781311, ("AU", "Australia")),
+    (16781312, None),
+    (0xFFFFFFFF, None),
+])
+def test_range_index_lookup_boundaries(index, ip_int, expected):
+    assert index.lookup(ip_int) == expected
+
+
+def test_empty_range_index_matches_nothing(geo, tmp_path):
+    path = tmp_path / "empty.csv"
+    path.write_text('"ip_from","ip_to","country_code","country_name"\n', encoding="utf-8")
+    index = geo._build_range_index(source=str(path))
+    assert len(index) == 0
+    assert index.lookup(0) is None
+
+
+def test_unsorted_csv_is_rejected(geo, tmp_path):
+    path = tmp_path / "unsorted.csv"
+    path.write_text('"16777472","16778239","CN","China"\n"16777216","16777471","AU","Australia"\n', encoding="utf-8")
+    with pytest.raises(ValueError):
+        geo._build_range_index(source=str(path))
+
+
+def test_get_ip_location_uses_memory_index(geo, index):
+    geo.index = index
+    assert geo.get_ip_location("1.0.0.0")["country_code"] == "AU"
+    assert geo.get_ip_location("1.0.1.0")["country_code"] == "CN"
+    assert geo.get_ip_location("1.0.4.0")["status"] is False
+
+
+def test_bulk_lookups_match_single_lookups(geo, index):
+    geo.index = index
+    ips = ["0.0.0.1", "1.0.0.255", "1.0.1.0", "1.0.4.0", 16779264, "255.255.255.255"]
+    expected = ["-", "AU", "CN", None, "AU", None]
+    assert geo.get_ip_locations(ips) == expected
+    assert [code for _, code in geo.iter_ip_locations(ips)] == expected
+
+
+def test_binary_database_round_trip(index, tmp_path):
+    path = str(tmp_path / "ranges.bin")
+    IPGeolocation.MappedIndex.write(index, path)
+    mapped = IPGeolocation.MappedIndex(path)
+    try:
+        assert len(mapped) == len(index)
+        assert list(mapped.starts) == list(index.starts)
+        assert list(mapped.ends) == list(index.ends)
+        assert list(mapped.country_idx) == list(index.country_idx)
+        assert mapped.countries == index.countries
+        for ip_int in (0, 16777216, 16778239, 16778240, 16781311, 16781312):
+            assert mapped.lookup(ip_int) == index.lookup(ip_int)
+    finally:
+        mapped.close()
+
+
+def test_binary_database_keeps_utf8_country_names(geo, tmp_path):
+    path = tmp_path / "utf8.csv"
+    path.write_text('"16777216","16777471","TR","Türkiye"\n"16777472","16778239","CI","Côte d\'Ivoire"\n', encoding="utf-8")
+    binary_file = str(tmp_path / "utf8.bin")
+    IPGeolocation.MappedIndex.write(geo._build_range_index(source=str(path)), binary_file)
+    mapped = IPGeolocation.MappedIndex(binary_file)
+    try:
+        assert mapped.countries == [("TR", "Türkiye"), ("CI", "Côte d'Ivoire")]
+    finally:
+        mapped.close()
+
+
+def test_binary_database_rejects_corrupted_payload(index, tmp_path):
+    path = tmp_path / "ranges.bin"
+    IPGeolocation.MappedIndex.write(index, str(path))
+    data = bytearray(path.read_bytes())
+    data[IPGeolocation.MappedIndex.HEADER.size + 1] ^= 0xFF
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError, match="checksum"):
+        IPGeolocation.MappedIndex(str(path))
+    IPGeolocation.MappedIndex(str(path), verify=False).close()
+
+
+@pytest.mark.parametrize("offset, value, message", [(0, b"XXXX", "not a CemirUtils IP database"), (4, b"\x00\x09", "version")])
+def test_binary_database_rejects_foreign_header(index, tmp_path, offset, value, message):
+    path = tmp_path / "ranges.bin"
+    IPGeolocation.MappedIndex.write(index, str(path))
+    data = bytearray(path.read_bytes())
+    data[offset:offset + len(value)] = value
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError, match=message):
+        IPGeolocation.MappedIndex(str(path))
+
+
+def test_open_binary_db_serves_lookups(geo, index, tmp_path):
+    path = str(tmp_path / "ranges.bin")
+    IPGeolocation.MappedIndex.write(index, path)
+    geo.open_binary_db(path)
+    try:
+        assert geo.get_ip_location("1.0.1.0")["country_code"] == "CN"
+        assert geo.get_ip_locations(["1.0.0.0", "1.0.4.0"]) == ["AU", None]
+    finally:
+        geo.index.close()
+
+
+DOC_PREFIX = 0x20010DB8 << 96
+CSV6 = "\n".join([
+    '"0","281470681743359","-","-"',
+    '"281470698520576","281470698520831","AU","Australia"',
+    f'"{DOC_PREFIX}","{DOC_PREFIX + (1 << 64) - 1}","DE","Germany"',
+    f'"{DOC_PREFIX + (1 << 64)}","{DOC_PREFIX + (1 << 64) + 255}","FR","France"',
+    f'"{DOC_PREFIX + (2 << 64) + 16}","{DOC_PREFIX + (3 << 64) - 1}","NL","Netherlands"',
+]) + "\n"
+
+
+@pytest.fixture
+def csv6_file(tmp_path):
+    path = tmp_path / "ranges6.csv"
+    path.write_text(CSV6, encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize("ip, expected", [
+    ("::", "-"),
+    ("::ffff:1.0.0.0", "AU"),
+    ("::ffff:1.0.0.255", "AU"),
+    ("::ffff:1.0.1.0", None),
+    ("2001:db7:ffff:ffff:ffff:ffff:ffff:ffff", None),
+    ("2001:db8::", "DE"),
+    ("2001:db8::ffff:ffff:ffff:ffff", "DE"),
+    ("2001:db8:0:1::", "FR"),
+    ("2001:db8:0:1::ff", "FR"),
+    ("2001:db8:0:1::100", None),
+    ("2001:db8:0:2::f", None),
+    ("2001:db8:0:2::10", "NL"),
+    ("2001:db8:0:2:ffff:ffff:ffff:ffff", "NL"),
+    ("2001:db8:0:3::", None),
+    ("ffff:ffff:ffff:ffff:ffff:ffff:ffff:ffff", None),
+])
+def test_range_index6_lookup_boundaries(geo, csv6_file, ip, expected):
+    index6 = geo._build_range_index6(csv6_file)
+    country = index6.lookup(geo.ip6_to_int(ip))
+    assert (country[0] if country else None) == expected
+
+
+def test_get_ip_location_answers_ipv6(geo, index, csv6_file):
+    geo.index = index
+    geo.load_ipv6_index(source=csv6_file)
+    assert geo.get_ip_location("2001:db8::1")["country_code"] == "DE"
+    assert geo.get_ip_location("2001:db8:0:3::")["status"] is False
+    assert geo.get_ip_location("1.0.1.0")["country_code"] == "CN"
+
+
+def test_refresh_database_swaps_both_indexes(tmp_path, csv_file, csv6_file):
+    geo = IPGeolocation(in_memory=True, cache_size=16)
+    geo.refresh_database(source=csv_file, background=False)
+    geo.load_ipv6_index(source=csv6_file)
+    assert geo.get_ip_location("1.0.0.1")["country_code"] == "AU"
+    assert geo.get_ip_location("2001:db8::1")["country_code"] == "DE"
+
+    new_csv = tmp_path / "new.csv"
+    new_csv.write_text('"16777216","16777471","JP","Japan"\n', encoding="utf-8")
+    new_csv6 = tmp_path / "new6.csv"
+    new_csv6.write_text(f'"{DOC_PREFIX}","{DOC_PREFIX + 255}","SE","Sweden"\n', encoding="utf-8")
+    generation = geo._cache_generation
+    assert geo.refresh_database(source=str(new_csv), source6=str(new_csv6), background=False) is True
+
+    assert geo._cache_generation == generation + 1
+    assert geo.get_ip_location("1.0.0.1")["country_code"] == "JP"
+    assert geo.get_ip_location("2001:db8::1")["country_code"] == "SE"
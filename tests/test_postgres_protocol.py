@@ -0,0 +1,178 @@
+import struct
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from cemirutils.utils import CemirPostgreSQLError, _CemirPostgreSQLProtocol
+
+
+@pytest.fixture
+def protocol():
+    return _CemirPostgreSQLProtocol("127.0.0.1", 5432, "postgres", "secret", "postgres")
+
+
+def row_description(*columns):
+    body = struct.pack("!h", len(columns))
+    for name, type_oid, format_code in columns:
+        body += name.encode() + b"\0" + struct.pack("!ihihih", 0, 0, type_oid, -1, -1, format_code)
+    return body
+
+
+def data_row(*values):
+    body = struct.pack("!h", len(values))
+    for value in values:
+        body += struct.pack("!i", -1) if value is None else struct.pack("!i", len(value)) + value
+    return body
+
+
+@pytest.mark.parametrize("value, encoded", [
+    (None, None),
+    (True, b"t"),
+    (False, b"f"),
+    (0, b"0"),
+    (-42, b"-42"),
+    (1.5, b"1.5"),
+    (Decimal("12.340"), b"12.340"),
+    ("çay", "çay".encode()),
+    (b"\x00\xff", b"\\x00ff"),
+    (memoryview(b"ab"), b"\\x6162"),
+    ({"a": [1, "ş"]}, '{"a": [1, "ş"]}'.encode()),
+    ([1, 2], b"[1, 2]"),
+    (date(2024, 2, 29), b"2024-02-29"),
+    (datetime(2024, 1, 2, 3, 4, 5, 6), b"2024-01-02T03:04:05.000006"),
+    (datetime(2024, 1, 2, tzinfo=timezone.utc), b"2024-01-02T00:00:00+00:00"),
+    (time(13, 14, 15), b"13:14:15"),
+    (uuid.UUID(int=1), b"00000000-0000-0000-0000-000000000001"),
+])
+def test_encode_param(value, encoded):
+    assert _CemirPostgreSQLProtocol._encode_param(value) == encoded
+
+
+def test_bind_message_layout():
+    message = _CemirPostgreSQLProtocol._bind_message("", "s1", (1, None, "ab"))
+    payload = b"\0s1\0" + b"\0\0" + b"\0\3" + b"\0\0\0\1" + b"1" + b"\xff\xff\xff\xff" + b"\0\0\0\2" + b"ab" + b"\0\0"
+    assert message == b"B" + struct.pack("!i", len(payload) + 4) + payload
+
+
+def test_bind_message_passes_result_formats():
+    message = _CemirPostgreSQLProtocol._bind_message("p", "", (), result_formats=b"\0\1\0\1")
+    assert message.endswith(b"p\0\0\0\0\0\0\0\1\0\1")
+
+
+def test_row_description_picks_decoders_by_format(protocol):
+    columns, types, decoders = protocol._row_description(row_description(("id", 23, 0), ("name", 25, 0), ("n", 20, 1)))
+    assert columns == ["id", "name", "n"]
+    assert types == [23, 25, 20]
+    assert decoders[0] == (None, int)
+    assert decoders[1] == (None, bytes.decode)
+    assert decoders[2] == _CemirPostgreSQLProtocol.BINARY_DECODERS[20]
+
+
+def test_text_columns_decode(protocol):
+    _, _, decoders = protocol._row_description(row_description(
+        ("b", 16, 0), ("i", 23, 0), ("f", 701, 0), ("d", 1700, 0), ("t", 25, 0), ("by", 17, 0),
+        ("j", 3802, 0), ("day", 1082, 0), ("ts", 1114, 0), ("tz", 1184, 0), ("u", 2950, 0),
+    ))
+    rows = [
+        data_row(b"t", b"7", b"2.5", b"1.10", "ğ".encode(), b"\\x0aff", b'{"k": 1}', b"2024-02-29", b"2024-01-02 03:04:05.5", b"2024-01-02 03:04:05+03", b"00000000-0000-0000-0000-000000000001"),
+        data_row(b"f", None, None, None, None, None, None, b"infinity", b"infinity", b"2024-01-02 03:04:05-02:30", None),
+    ]
+    arrays = _CemirPostgreSQLProtocol._decode_columns(rows, decoders)
+    assert [column[0] for column in arrays] == [
+        True, 7, 2.5, Decimal("1.10"), "ğ", b"\n\xff", {"k": 1}, date(2024, 2, 29),
+        datetime(2024, 1, 2, 3, 4, 5, 500000), datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=3))), uuid.UUID(int=1),
+    ]
+    assert [column[1] for column in arrays] == [
+        False, None, None, None, None, None, None, "infinity", "infinity", datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone(-timedelta(hours=2, minutes=30))), None,
+    ]
+
+
+def test_result_rows_and_rowcount():
+    result = _CemirPostgreSQLProtocol.Result(columns=["a", "b"], arrays=[[1, 2], ["x", "y"]], command="SELECT 2")
+    assert result.rows == [(1, "x"), (2, "y")]
+    assert result.dicts() == [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}]
+    assert result.columnar() == {"a": [1, 2], "b": ["x", "y"]}
+    assert result.rowcount == 2
+    assert _CemirPostgreSQLProtocol.Result(command="INSERT 0 5").rowcount == 5
+    assert _CemirPostgreSQLProtocol.Result(command="BEGIN").rowcount is None
+
+
+def test_error_response_fields():
+    error = _CemirPostgreSQLProtocol._error(b"SERROR\0C23505\0Mduplicate key\0Dkey (id)=(1) exists\0\0")
+    assert isinstance(error, CemirPostgreSQLError)
+    assert error.code == "23505"
+    assert error.severity == "ERROR"
+    assert str(error) == "ERROR: duplicate key\nDETAIL: key (id)=(1) exists"
+
+
+BINARY_COLUMNS = (("b", 16, 1), ("s", 21, 1), ("i", 23, 1), ("n", 20, 1), ("o", 26, 1), ("f", 701, 1), ("day", 1082, 1), ("ts", 1114, 1), ("tz", 1184, 1))
+
+
+def binary_row(flag, small, integer, big, oid, double, days, microseconds, microseconds_tz):
+    return data_row(
+        struct.pack("!?", flag), struct.pack("!h", small), struct.pack("!i", integer), struct.pack("!q", big), struct.pack("!I", oid),
+        struct.pack("!d", double), struct.pack("!i", days), struct.pack("!q", microseconds), struct.pack("!q", microseconds_tz),
+    )
+
+
+def test_fixed_width_binary_columns_decode(protocol):
+    _, _, decoders = protocol._row_description(row_description(*BINARY_COLUMNS))
+    rows = [
+        binary_row(True, -2, 2 ** 31 - 1, -2 ** 63, 2 ** 32 - 1, 0.25, 0, 0, 86400 * 10 ** 6 + 1),
+        binary_row(False, 3, -7, 2 ** 40, 26, -1.5, 8825, 1, -1),
+    ]
+    arrays = _CemirPostgreSQLProtocol._decode_columns(rows, decoders)
+    assert arrays == [
+        [True, False],
+        [-2, 3],
+        [2 ** 31 - 1, -7],
+        [-2 ** 63, 2 ** 40],
+        [2 ** 32 - 1, 26],
+        [0.25, -1.5],
+        [date(2000, 1, 1), date(2024, 2, 29)],
+        [datetime(2000, 1, 1), datetime(2000, 1, 1, 0, 0, 0, 1)],
+        [datetime(2000, 1, 2, 0, 0, 0, 1, tzinfo=timezone.utc), datetime(1999, 12, 31, 23, 59, 59, 999999, tzinfo=timezone.utc)],
+    ]
+
+
+def test_binary_columns_with_nulls_match_the_row_path(protocol):
+    _, _, decoders = protocol._row_description(row_description(("i", 23, 1), ("n", 20, 1)))
+    rows = [data_row(struct.pack("!i", 1), None), data_row(None, struct.pack("!q", 5)), data_row(struct.pack("!i", 3), struct.pack("!q", 6))]
+    assert _CemirPostgreSQLProtocol._decode_columns(rows, decoders) == [[1, None, 3], [None, 5, 6]]
+
+
+@pytest.mark.parametrize("type_oid, fmt, value, expected", [
+    (1082, "!i", 2 ** 31 - 1, "infinity"),
+    (1082, "!i", -2 ** 31, "-infinity"),
+    (1114, "!q", 2 ** 63 - 1, "infinity"),
+    (1184, "!q", -2 ** 63, "-infinity"),
+])
+def test_binary_infinity(protocol, type_oid, fmt, value, expected):
+    _, _, decoders = protocol._row_description(row_description(("v", type_oid, 1)))
+    assert _CemirPostgreSQLProtocol._decode_columns([data_row(struct.pack(fmt, value))], decoders) == [[expected]]
+
+
+def test_variable_width_binary_columns_decode(protocol):
+    _, _, decoders = protocol._row_description(row_description(("by", 17, 1), ("j", 114, 1), ("jb", 3802, 1), ("u", 2950, 1), ("i", 23, 1)))
+    rows = [
+        data_row(b"\x00\x01", b'{"a": 1}', b'\x01{"b": [2]}', uuid.UUID(int=7).bytes, struct.pack("!i", 9)),
+        data_row(None, None, None, None, None),
+    ]
+    assert _CemirPostgreSQLProtocol._decode_columns(rows, decoders) == [
+        [b"\x00\x01", None], [{"a": 1}, None], [{"b": [2]}, None], [uuid.UUID(int=7), None], [9, None],
+    ]
+
+
+def test_binary_formats_follow_cached_statement_types():
+    protocol = _CemirPostgreSQLProtocol("127.0.0.1", 5432, "postgres", "secret", "postgres", binary_results=True)
+    protocol._statements["SELECT 1"] = "s1"
+    assert protocol._result_formats("s1") == b"\0\0"
+
+    protocol._remember_formats("SELECT 1", "s1", [23, 1700, 25])
+    assert protocol._result_formats("s1") == b"\0\3\0\1\0\0\0\0"
+
+    protocol._statements["SELECT 2"] = "s2"
+    protocol._remember_formats("SELECT 2", "s2", [25])
+    assert protocol._result_formats("s2") == b"\0\0"